@@ -14,4 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo import discovery, conformance, analysis, evaluation, simulation, organizational_mining, transformation
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "discovery", "conformance", "analysis", "evaluation", "simulation", "organizational_mining",
+    "transformation"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,9 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
 
-from pm4py.algo.analysis import extended_marking_equation, marking_equation, workflow_net
+_submodules = ["extended_marking_equation", "marking_equation", "workflow_net"]
 
-import pkgutil
 if pkgutil.find_loader("simpy"):
-    from pm4py.algo.analysis import woflan
+    _submodules.append("woflan")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
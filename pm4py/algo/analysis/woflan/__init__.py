@@ -14,5 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.analysis.woflan import algorithm, graphs, not_well_handled_pairs, place_invariants
+from pm4py.util.lazy_loading import lazy_submodules
 
+_submodules = ["algorithm", "graphs", "not_well_handled_pairs", "place_invariants"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
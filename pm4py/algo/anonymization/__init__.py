@@ -14,10 +14,13 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-
-from pm4py.algo.anonymization import trace_variant_query
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["trace_variant_query"]
 
 if pkgutil.find_loader("diffprivlib"):
     # import pripel only if the diffprivlib package is installed
-    from pm4py.algo.anonymization import pripel
+    _submodules.append("pripel")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
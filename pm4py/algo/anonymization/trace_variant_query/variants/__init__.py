@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.util.lazy_loading import lazy_submodules
 
 '''
     This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
@@ -28,4 +29,6 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.anonymization.trace_variant_query.variants import laplace, sacofa
+_submodules = ["laplace", "sacofa"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
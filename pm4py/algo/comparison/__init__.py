@@ -14,12 +14,15 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-
 import pkgutil
+import warnings
+from pm4py.util.lazy_loading import lazy_submodules
 
-if pkgutil.find_loader("matplotlib"):
-    from pm4py.algo.comparison import petrinet
+_submodules = []
 
-import warnings
+if pkgutil.find_loader("matplotlib"):
+    _submodules.append("petrinet")
 
 warnings.warn("The comparison package will be removed in a future release.")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
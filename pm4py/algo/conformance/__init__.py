@@ -14,9 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.conformance import alignments, tokenreplay, log_skeleton, footprints, temporal_profile
+from pm4py.util.lazy_loading import lazy_submodules
 
-import sys
-# this package is available only for Python >= 3.6
-if sys.version_info >= (3, 6):
-    pass
+_submodules = ["alignments", "tokenreplay", "log_skeleton", "footprints", "temporal_profile"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,5 +14,9 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.conformance.alignments import decomposed, dfg, petri_net, process_tree
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["decomposed", "dfg", "petri_net", "process_tree"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
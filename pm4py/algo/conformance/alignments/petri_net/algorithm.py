@@ -17,6 +17,7 @@
 from copy import copy
 
 from pm4py.algo.conformance.alignments.petri_net import variants
+from pm4py.algo.conformance.alignments.petri_net import cache as alignments_cache
 from pm4py.objects.petri_net.utils import align_utils, check_soundness
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TRACEID_KEY
@@ -58,6 +59,8 @@ class Parameters(Enum):
     VARIANTS_IDX = "variants_idx"
     SHOW_PROGRESS_BAR = "show_progress_bar"
     CORES = 'cores'
+    CHUNKS_PER_WORKER = "chunks_per_worker"
+    ALIGNMENTS_CACHE = "alignments_cache"
     BEST_WORST_COST_INTERNAL = "best_worst_cost_internal"
     FITNESS_ROUND_DIGITS = "fitness_round_digits"
     SYNCHRONOUS = "synchronous_dijkstra"
@@ -204,20 +207,33 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     max_align_time_case = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
                                                      sys.maxsize)
 
-    best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
+    cache = exec_utils.get_param_value(Parameters.ALIGNMENTS_CACHE, parameters, None)
+    model = alignments_cache.model_fingerprint(petri_net, initial_marking, final_marking, variant,
+                                               parameters) if cache is not None else None
+
+    best_worst_cost = __get_cached_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters,
+                                                   cache, model)
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
     progress = __get_progress_bar(len(one_tr_per_var), parameters)
     parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
     all_alignments = []
-    for trace in one_tr_per_var:
-        this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
-        parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
-        all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
-                                          variant=variant))
+    for activities, trace in zip(variants_idxs, one_tr_per_var):
+        ali = cache.get_alignment(model, activities) if cache is not None else None
+        if ali is None:
+            this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
+            parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+            ali = apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
+                              variant=variant)
+            if cache is not None:
+                cache.put_alignment(model, activities, ali)
+        all_alignments.append(ali)
         if progress is not None:
             progress.update()
 
+    if cache is not None:
+        cache.flush()
+
     alignments = __form_alignments(variants_idxs, all_alignments)
     __close_progress_bar(progress)
 
@@ -226,7 +242,9 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
 
 def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
     """
-    Applies the alignments using a process pool (multiprocessing)
+    Applies the alignments using a process pool (multiprocessing).
+    The model is sent once to every worker process, and the variants are sent in chunks of similar estimated cost.
+    The worker processes are kept alive, and reused by the following calls on the same model.
 
     Parameters
     ---------------
@@ -250,34 +268,47 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
         parameters = {}
 
     import multiprocessing
+    from pm4py.algo.conformance.alignments.petri_net import pool
 
     num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
-
-    best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
+    chunks_per_worker = exec_utils.get_param_value(Parameters.CHUNKS_PER_WORKER, parameters,
+                                                   pool.DEFAULT_CHUNKS_PER_WORKER)
+
+    cache = exec_utils.get_param_value(Parameters.ALIGNMENTS_CACHE, parameters, None)
+    model = alignments_cache.model_fingerprint(petri_net, initial_marking, final_marking, variant,
+                                               parameters) if cache is not None else None
+    if cache is not None:
+        # the cache is not sent to the worker processes
+        parameters = copy(parameters)
+        for key in [Parameters.ALIGNMENTS_CACHE, Parameters.ALIGNMENTS_CACHE.value]:
+            parameters.pop(key, None)
+
+    best_worst_cost = __get_cached_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters,
+                                                   cache, model)
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
     parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
-    all_alignments = []
-
-    from concurrent.futures import ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
-        futures = []
-        for trace in one_tr_per_var:
-            futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters))
-        progress = __get_progress_bar(len(one_tr_per_var), parameters)
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            all_alignments.append(futures[index].result())
-        __close_progress_bar(progress)
+    all_alignments = [None] * len(one_tr_per_var)
+    to_align = list(range(len(one_tr_per_var)))
+    if cache is not None:
+        for index, activities in enumerate(variants_idxs):
+            all_alignments[index] = cache.get_alignment(model, activities)
+        to_align = [index for index in to_align if all_alignments[index] is None]
+
+    # the worker processes receive the model once, and are reused by the following calls on the same model
+    progress = __get_progress_bar(len(to_align), parameters)
+    if to_align:
+        aligned = pool.align_variants([one_tr_per_var[index] for index in to_align], petri_net, initial_marking,
+                                      final_marking, variant, parameters=parameters, num_cores=num_cores,
+                                      progress=progress, chunks_per_worker=chunks_per_worker)
+        variants_list = list(variants_idxs) if cache is not None else None
+        for index, ali in zip(to_align, aligned):
+            all_alignments[index] = ali
+            if cache is not None:
+                cache.put_alignment(model, variants_list[index], ali)
+        if cache is not None:
+            cache.flush()
+    __close_progress_bar(progress)
 
     alignments = __form_alignments(variants_idxs, all_alignments)
 
@@ -293,6 +324,15 @@ def __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, pa
     return best_worst_cost
 
 
+def __get_cached_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters, cache, model):
+    best_worst_cost = cache.get_best_worst_cost(model) if cache is not None else None
+    if best_worst_cost is None:
+        best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
+        if cache is not None:
+            cache.put_best_worst_cost(model, best_worst_cost)
+    return best_worst_cost
+
+
 def __get_variants_structure(log, parameters):
     if parameters is None:
         parameters = {}
@@ -0,0 +1,257 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import hashlib
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from enum import Enum
+from types import ModuleType
+from typing import Optional, Dict, Any, Tuple
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.util import exec_utils, typing
+
+# default maximum number of entries kept in memory
+DEFAULT_MAX_SIZE = 100000
+
+
+def __stable_repr(obj) -> str:
+    """
+    Gets a representation of the object which does not depend on the identity of the objects
+    (hence, stable across calls and processes)
+    """
+    if isinstance(obj, dict):
+        return "{" + ",".join(sorted(__stable_repr(k) + ":" + __stable_repr(v) for k, v in obj.items())) + "}"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ",".join(__stable_repr(x) for x in obj) + "]"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ",".join(sorted(__stable_repr(x) for x in obj)) + "}"
+    if isinstance(obj, ModuleType):
+        return obj.__name__
+    if isinstance(obj, Enum):
+        return __stable_repr(obj.value) if isinstance(obj.value, ModuleType) else repr(obj.value)
+    return repr(obj)
+
+
+def model_fingerprint(petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, variant,
+                      parameters: Optional[Dict[Any, Any]] = None) -> str:
+    """
+    Computes a hash of an exact serialization of the model against which the traces are aligned (the places, the
+    transitions and the arcs with their names, the labels and the costs of the transitions, and the markings),
+    which does not depend on the identity of the objects, so it is stable across calls and processes.
+    The places and the transitions are numbered in the order of their description (including the descriptions
+    of their neighbours), and the arcs refer to these numbers, so that elements sharing the same name are
+    distinguished. Only for elements with the same name and the same neighbourhood the numbering may depend on
+    the order of the objects: then, the same model may get different fingerprints (a miss of the cache),
+    while different models never share a fingerprint.
+    The hash combines the serialization, the variant of the alignments and the parameters affecting the results.
+
+    Parameters
+    ----------------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    variant
+        Variant of the alignments
+    parameters
+        Parameters of the alignments
+
+    Returns
+    ----------------
+    fingerprint
+        Hexadecimal digest
+    """
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.algo.conformance.alignments.petri_net.algorithm import Parameters
+
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+
+    descriptions = {p: (repr(p.name), initial_marking.get(p, 0), final_marking.get(p, 0)) for p in petri_net.places}
+    for t in petri_net.transitions:
+        descriptions[t] = (repr(t.name), repr(t.label),
+                           repr(model_cost_function.get(t)) if model_cost_function is not None else "",
+                           repr(sync_cost_function.get(t)) if sync_cost_function is not None else "")
+
+    def neighbourhood(x):
+        return (descriptions[x], sorted((descriptions[a.source], a.weight) for a in x.in_arcs),
+                sorted((descriptions[a.target], a.weight) for a in x.out_arcs))
+
+    places = sorted(petri_net.places, key=neighbourhood)
+    transitions = sorted(petri_net.transitions, key=neighbourhood)
+    numbers = {x: i for i, x in enumerate(places)}
+    numbers.update({x: i for i, x in enumerate(transitions)})
+    arcs = sorted((type(a.source).__name__, numbers[a.source], numbers[a.target], a.weight)
+                  for a in petri_net.arcs)
+    places = [descriptions[p] for p in places]
+    transitions = [descriptions[t] for t in transitions]
+
+    description = [places, transitions, arcs, variant,
+                   exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None)]
+    # other parameters changing the result of the alignment of a trace
+    for param in [Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE, Parameters.PARAM_TRACE_NET_COSTS,
+                  Parameters.SYNCHRONOUS, Parameters.EXPONENT]:
+        description.append((param.value, exec_utils.get_param_value(param, parameters, None)))
+
+    return hashlib.blake2b(__stable_repr(description).encode("utf-8"), digest_size=20).hexdigest()
+
+
+def trace_key(activities: Tuple) -> str:
+    """
+    Gets the key of a trace (sequence of activities) in the cache
+    """
+    return hashlib.blake2b(__stable_repr(tuple(activities)).encode("utf-8"), digest_size=20).hexdigest()
+
+
+class AlignmentsCache(object):
+    """
+    Cache of the alignments of the variants against the models (identified by the hash of their serialization).
+
+    The entries are kept in a bounded in-memory LRU. Optionally, they are also persisted in a SQLite database,
+    which is shared by different calls and processes.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, disk_path: Optional[str] = None):
+        """
+        Constructor
+
+        Parameters
+        ---------------
+        max_size
+            Maximum number of entries kept in memory
+        disk_path
+            (optional) path to the SQLite database in which the entries are persisted
+        """
+        self.max_size = max_size
+        self.disk_path = disk_path
+        self.hits = 0
+        self.misses = 0
+        self.__memory = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__connection = None
+        if disk_path is not None:
+            self.__connection = sqlite3.connect(disk_path, check_same_thread=False)
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS alignments (key TEXT PRIMARY KEY, value BLOB)")
+            self.__connection.commit()
+
+    def get(self, key: str):
+        """
+        Gets the value associated to the key (None if the key is not in the cache)
+        """
+        with self.__lock:
+            if key in self.__memory:
+                self.__memory.move_to_end(key)
+                self.hits += 1
+                return self.__memory[key]
+            if self.__connection is not None:
+                row = self.__connection.execute("SELECT value FROM alignments WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value = pickle.loads(row[0])
+                    self.__store_in_memory(key, value)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value):
+        """
+        Associates the value to the key
+        """
+        with self.__lock:
+            self.__store_in_memory(key, value)
+            if self.__connection is not None:
+                self.__connection.execute("INSERT OR REPLACE INTO alignments (key, value) VALUES (?, ?)",
+                                          (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def flush(self):
+        """
+        Commits the pending writes to the database (making them visible to the other processes)
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.commit()
+
+    def __store_in_memory(self, key: str, value):
+        self.__memory[key] = value
+        self.__memory.move_to_end(key)
+        while len(self.__memory) > self.max_size:
+            self.__memory.popitem(last=False)
+
+    def get_alignment(self, model: str, activities: Tuple) -> Optional[typing.AlignmentResult]:
+        """
+        Gets the alignment of the given sequence of activities against the model (hash of the model),
+        if it is cached
+        """
+        ali = self.get("ali|" + model + "|" + trace_key(activities))
+        return dict(ali) if ali is not None else None
+
+    def put_alignment(self, model: str, activities: Tuple, alignment: typing.AlignmentResult):
+        """
+        Stores the alignment of the given sequence of activities against the model (hash of the model)
+        """
+        if alignment is not None:
+            self.put("ali|" + model + "|" + trace_key(activities), dict(alignment))
+
+    def get_best_worst_cost(self, model: str) -> Optional[int]:
+        """
+        Gets the cost of the best worst alignment of the model (hash of the model), if it is cached
+        """
+        return self.get("bwc|" + model)
+
+    def put_best_worst_cost(self, model: str, best_worst_cost: int):
+        """
+        Stores the cost of the best worst alignment of the model (hash of the model)
+        """
+        if best_worst_cost is not None:
+            self.put("bwc|" + model, best_worst_cost)
+
+    def clear(self):
+        """
+        Removes all the entries of the cache (also from the disk)
+        """
+        with self.__lock:
+            self.__memory.clear()
+            if self.__connection is not None:
+                self.__connection.execute("DELETE FROM alignments")
+                self.__connection.commit()
+
+    def close(self):
+        """
+        Closes the connection to the database
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.commit()
+                self.__connection.close()
+                self.__connection = None
+
+    def __len__(self):
+        return len(self.__memory)
+
+    def __getstate__(self):
+        # the connection to the database is re-opened when the cache is deserialized
+        return {"max_size": self.max_size, "disk_path": self.disk_path}
+
+    def __setstate__(self, state):
+        self.__init__(max_size=state["max_size"], disk_path=state["disk_path"])
+
@@ -0,0 +1,286 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import atexit
+import hashlib
+import heapq
+import importlib
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from copy import copy
+from enum import Enum
+from types import ModuleType
+from typing import Optional, Dict, Any, List, Sequence
+
+from pm4py.objects.log.obj import Trace
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.util import typing
+
+# number of chunks of variants submitted per worker process (more chunks: better balancing between the workers
+# and more frequent updates of the progress bar; fewer chunks: less inter-process communication)
+DEFAULT_CHUNKS_PER_WORKER = 4
+
+# maximum number of worker pools kept alive (every pool is bound to a model)
+MAX_CACHED_POOLS = 1
+
+# state of a worker process: (petri_net, initial_marking, final_marking, variant, parameters)
+_worker_model = None
+
+
+def _initialize_worker(payload: bytes):
+    """
+    Initializes a worker process, deserializing the model (Petri net, markings, variant and parameters)
+    which is then shared by all the chunks of variants aligned by the worker
+    """
+    global _worker_model
+    petri_net, initial_marking, final_marking, variant, parameters = pickle.loads(payload)
+    if isinstance(variant, str):
+        variant = importlib.import_module(variant)
+    _worker_model = (petri_net, initial_marking, final_marking, variant, parameters)
+
+
+def _align_chunk(indexes: List[int], traces: List[Trace]) -> List[Any]:
+    """
+    Aligns a chunk of variants against the model of the worker process
+
+    Returns
+    -------------
+    results
+        List of couples (index of the variant, alignment)
+    """
+    from pm4py.algo.conformance.alignments.petri_net import algorithm
+
+    petri_net, initial_marking, final_marking, variant, parameters = _worker_model
+    return [(idx, algorithm.apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
+                                        variant=variant)) for idx, trace in zip(indexes, traces)]
+
+
+def estimate_cost(trace: Trace) -> int:
+    """
+    Estimates the cost of aligning a trace (the number of states explored by the search grows with the length
+    of the trace)
+    """
+    return len(trace) + 1
+
+
+def balanced_chunks(costs: Sequence[int], num_chunks: int) -> List[List[int]]:
+    """
+    Distributes the items among the given number of chunks, such that the chunks have a similar total cost
+    (longest processing time first: every item, in decreasing order of cost, is assigned to the chunk
+    having the lowest total cost so far)
+
+    Parameters
+    --------------
+    costs
+        Estimated cost of every item
+    num_chunks
+        Number of chunks
+
+    Returns
+    --------------
+    chunks
+        Indexes of the items belonging to every chunk. The chunks are sorted by decreasing total cost,
+        and the items inside a chunk by decreasing cost.
+    """
+    num_chunks = max(1, min(num_chunks, len(costs)))
+    order = sorted(range(len(costs)), key=lambda i: -costs[i])
+    chunks = [[] for _ in range(num_chunks)]
+    heap = [(0, c) for c in range(num_chunks)]
+    for i in order:
+        total, c = heapq.heappop(heap)
+        chunks[c].append(i)
+        heapq.heappush(heap, (total + costs[i], c))
+    totals = {c: total for total, c in heap}
+    return [chunks[c] for c in sorted(range(num_chunks), key=lambda c: -totals[c]) if chunks[c]]
+
+
+class AlignmentsWorkerPool(object):
+    """
+    Pool of worker processes aligning traces against a given model.
+
+    The model (Petri net, markings, variant and parameters) is serialized once and deserialized once
+    in every worker process (when the process is started). Then, only the traces are sent to the workers.
+    """
+
+    def __init__(self, petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, variant,
+                 parameters: Optional[Dict[Any, Any]] = None, num_cores: int = 1, payload: Optional[bytes] = None):
+        if payload is None:
+            payload = serialize_model(petri_net, initial_marking, final_marking, variant, parameters)
+        self.fingerprint = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        self.num_cores = max(1, num_cores)
+        self.executor = ProcessPoolExecutor(max_workers=self.num_cores, initializer=_initialize_worker,
+                                            initargs=(payload,))
+
+    def align(self, traces: List[Trace], progress=None,
+              chunks_per_worker: int = DEFAULT_CHUNKS_PER_WORKER) -> List[typing.AlignmentResult]:
+        """
+        Aligns the provided traces (one per variant) against the model of the pool
+
+        Parameters
+        --------------
+        traces
+            Traces
+        progress
+            (optional) progress bar, updated as soon as the chunks of variants are aligned
+        chunks_per_worker
+            Number of chunks of variants submitted per worker process
+
+        Returns
+        --------------
+        alignments
+            Alignments (in the same order as the traces)
+        """
+        chunks = balanced_chunks([estimate_cost(trace) for trace in traces], self.num_cores * chunks_per_worker)
+        futures = [self.executor.submit(_align_chunk, chunk, [traces[i] for i in chunk])
+                   for chunk in chunks]
+        alignments = [None] * len(traces)
+        for future in as_completed(futures):
+            results = future.result()
+            for idx, ali in results:
+                alignments[idx] = ali
+            if progress is not None:
+                progress.update(len(results))
+        return alignments
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def serialize_model(petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, variant,
+                    parameters: Optional[Dict[Any, Any]] = None) -> bytes:
+    """
+    Serializes together the Petri net, the markings, the variant and the parameters of the alignments
+    (the cost functions in the parameters refer to the transitions of the net, hence they must be serialized
+    in the same payload)
+    """
+    if isinstance(variant, ModuleType):
+        variant = variant.__name__
+    elif isinstance(variant, Enum) and isinstance(variant.value, ModuleType):
+        variant = variant.value.__name__
+    return pickle.dumps((petri_net, initial_marking, final_marking, variant, parameters),
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def get_pool(petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, variant,
+             parameters: Optional[Dict[Any, Any]] = None, num_cores: int = 1) -> AlignmentsWorkerPool:
+    """
+    Gets a worker pool for the provided model, reusing the pool started for a previous call on the same
+    model (and with the same parameters and number of processes) when it is still alive
+
+    Parameters
+    --------------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    variant
+        Variant of the alignments
+    parameters
+        Parameters of the alignments
+    num_cores
+        Number of worker processes
+
+    Returns
+    --------------
+    pool
+        Worker pool
+    """
+    payload = serialize_model(petri_net, initial_marking, final_marking, variant, parameters)
+    key = (hashlib.blake2b(payload, digest_size=16).hexdigest(), max(1, num_cores))
+    with _pools_lock:
+        pool = _pools.pop(key, None)
+        if pool is None:
+            pool = AlignmentsWorkerPool(petri_net, initial_marking, final_marking, variant, num_cores=num_cores,
+                                        payload=payload)
+        # the most recently used pool is kept as last entry
+        _pools[key] = pool
+        while len(_pools) > MAX_CACHED_POOLS:
+            __discard(next(iter(_pools)))
+    return pool
+
+
+def discard_pool(pool: AlignmentsWorkerPool):
+    """
+    Shuts down a worker pool (for example, after a failure of one of its processes) and removes it from the cache
+    """
+    with _pools_lock:
+        for key in [k for k, p in _pools.items() if p is pool]:
+            del _pools[key]
+    pool.shutdown()
+
+
+def shutdown_pools():
+    """
+    Shuts down all the cached worker pools
+    """
+    with _pools_lock:
+        while _pools:
+            __discard(next(iter(_pools)))
+
+
+def __discard(key):
+    _pools.pop(key).shutdown()
+
+
+atexit.register(shutdown_pools)
+
+
+def align_variants(traces: List[Trace], petri_net: PetriNet, initial_marking: Marking, final_marking: Marking,
+                   variant, parameters: Optional[Dict[Any, Any]] = None, num_cores: int = 1, progress=None,
+                   chunks_per_worker: int = DEFAULT_CHUNKS_PER_WORKER) -> List[typing.AlignmentResult]:
+    """
+    Aligns the provided traces (one per variant) using the (possibly cached) worker pool of the model
+
+    Parameters
+    --------------
+    traces
+        Traces
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    variant
+        Variant of the alignments
+    parameters
+        Parameters of the alignments
+    num_cores
+        Number of worker processes
+    progress
+        (optional) progress bar
+    chunks_per_worker
+        Number of chunks of variants submitted per worker process
+
+    Returns
+    --------------
+    alignments
+        Alignments (in the same order as the traces)
+    """
+    pool = get_pool(petri_net, initial_marking, final_marking, variant, parameters=parameters, num_cores=num_cores)
+    try:
+        return pool.align(traces, progress=progress, chunks_per_worker=chunks_per_worker)
+    except BrokenProcessPool:
+        discard_pool(pool)
+        raise
@@ -14,5 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.conformance.alignments.petri_net.variants import dijkstra_less_memory, dijkstra_no_heuristics, \
-    state_equation_a_star, tweaked_state_equation_a_star, discounted_a_star
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "dijkstra_less_memory", "dijkstra_no_heuristics", "state_equation_a_star",
+    "tweaked_state_equation_a_star", "discounted_a_star"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,4 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.conformance.alignments.process_tree.variants.approximated import calculate_a_sa_ea_sets, matrix_lp, original, utilities
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["calculate_a_sa_ea_sets", "matrix_lp", "original", "utilities"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
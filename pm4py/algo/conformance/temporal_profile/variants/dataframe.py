@@ -18,9 +18,10 @@ import sys
 from enum import Enum
 from typing import Optional, Dict, Any
 
+import numpy as np
 import pandas as pd
 
-from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
+from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe_chunks
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
 
@@ -34,6 +35,11 @@ class Parameters(Enum):
     BUSINESS_HOURS = "business_hours"
     BUSINESS_HOUR_SLOTS = "business_hour_slots"
     WORKCALENDAR = "workcalendar"
+    RETURN_DATAFRAME = "return_dataframe"
+    MAX_PAIRS_PER_CHUNK = "max_pairs_per_chunk"
+
+
+ZETA_COLUMN = "@@zeta"
 
 
 def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
@@ -58,16 +64,21 @@ def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
          - Parameters.TIMESTAMP_KEY => the attribute to use as timestamp
          - Parameters.ZETA => multiplier for the standard deviation
          - Parameters.CASE_ID_KEY => column to use as case identifier
+         - Parameters.RETURN_DATAFRAME => returns the deviations as a dataframe instead of a list of lists
+         - Parameters.MAX_PAIRS_PER_CHUNK => maximum number of couples of events evaluated at once
 
     Returns
     ---------------
     list_dev
-        A list containing, for each case, all the deviations.
+        A list containing, for each case (in the order of appearance in the dataframe), all the deviations.
         Each deviation is a tuple with four elements:
         - 1) The source activity of the recorded deviation
         - 2) The target activity of the recorded deviation
         - 3) The time passed between the occurrence of the source activity and the target activity
         - 4) The value of (time passed - mean)/std for this occurrence (zeta).
+        If Parameters.RETURN_DATAFRAME is set, a dataframe with the columns case identifier, source activity,
+        target activity (suffixed by _2), @@flow_time and @@zeta is returned instead (one row per deviation, sorted
+        by case).
 
     """
     if parameters is None:
@@ -84,24 +95,104 @@ def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
-    temporal_profile = pd.DataFrame([{activity_key: x[0], activity_key + "_2": x[1], "@@min": y[0] - zeta * y[1],
-                                      "@@max": y[0] + zeta * y[1], "@@mean": y[0], "@@std": y[1]} for x, y in
-                                     temporal_profile.items()])
-
-    cases = list(df[case_id_key].unique())
-    ret = [[] for c in cases]
-    efg = get_partial_order_dataframe(df, activity_key=activity_key, timestamp_key=timestamp_key,
-                                      start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
-                                      keep_first_following=False, business_hours=business_hours,
-                                      business_hours_slot=business_hours_slots, workcalendar=workcalendar)
-    efg = efg[[case_id_key, activity_key, activity_key + "_2", "@@flow_time"]]
-    efg = efg.merge(temporal_profile, on=[activity_key, activity_key + "_2"])
-    efg = efg[(efg["@@flow_time"] < efg["@@min"]) | (efg["@@flow_time"] > efg["@@max"])][
-        [case_id_key, activity_key, activity_key + "_2", "@@flow_time", "@@mean", "@@std"]].to_dict("records")
-
-    for el in efg:
-        this_zeta = abs(el["@@flow_time"] - el["@@mean"]) / el["@@std"] if el["@@std"] > 0 else sys.maxsize
-        ret[cases.index(el[case_id_key])].append(
-            (el[activity_key], el[activity_key + "_2"], el["@@flow_time"], this_zeta))
-
-    return ret
+    return_dataframe = exec_utils.get_param_value(Parameters.RETURN_DATAFRAME, parameters, False)
+    max_pairs_per_chunk = exec_utils.get_param_value(Parameters.MAX_PAIRS_PER_CHUNK, parameters, 2000000)
+
+    # the cases are indexed by hash in the order of appearance
+    cases = pd.Index(df[case_id_key].unique())
+
+    if not temporal_profile:
+        # no couple of activities can deviate from an empty temporal profile
+        if return_dataframe:
+            return pd.DataFrame({case_id_key: cases.to_numpy()[:0], activity_key: np.zeros(0, dtype=object),
+                                 activity_key + "_2": np.zeros(0, dtype=object),
+                                 constants.DEFAULT_FLOW_TIME: np.zeros(0, dtype=np.float64),
+                                 ZETA_COLUMN: np.zeros(0, dtype=np.float64)})
+        return [[] for i in range(len(cases))]
+
+    # arrays of the temporal profile, sorted by the code of the couple of activities
+    activities = pd.Index(list(dict.fromkeys(y for x in temporal_profile for y in x)))
+    num_activities = len(activities)
+    profile_keys = np.array([activities.get_loc(x[0]) * num_activities + activities.get_loc(x[1])
+                             for x in temporal_profile], dtype=np.int64)
+    profile_values = np.array(list(temporal_profile.values()), dtype=np.float64).reshape(-1, 2)
+    profile_order = np.argsort(profile_keys)
+    profile_keys = profile_keys[profile_order]
+    profile_mean = profile_values[profile_order, 0]
+    profile_std = profile_values[profile_order, 1]
+    profile_min = profile_mean - zeta * profile_std
+    profile_max = profile_mean + zeta * profile_std
+
+    dev_cases = []
+    dev_sources = []
+    dev_targets = []
+    dev_flow = []
+    dev_zeta = []
+    dev_unbounded = []
+
+    for efg in get_partial_order_dataframe_chunks(df, activity_key=activity_key, timestamp_key=timestamp_key,
+                                                  start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
+                                                  keep_first_following=False, business_hours=business_hours,
+                                                  business_hours_slot=business_hours_slots, workcalendar=workcalendar,
+                                                  max_pairs_per_chunk=max_pairs_per_chunk):
+        source = activities.get_indexer(efg[activity_key])
+        target = activities.get_indexer(efg[activity_key + "_2"])
+        keys = source.astype(np.int64) * num_activities + target
+        positions = np.minimum(np.searchsorted(profile_keys, keys), len(profile_keys) - 1)
+        in_profile = (source >= 0) & (target >= 0) & (profile_keys[positions] == keys)
+        flow_time = efg[constants.DEFAULT_FLOW_TIME].to_numpy()
+        deviating = np.flatnonzero(in_profile & ((flow_time < profile_min[positions]) |
+                                                 (flow_time > profile_max[positions])))
+        if len(deviating) == 0:
+            continue
+        positions = positions[deviating]
+        flow_time = flow_time[deviating]
+        mean = profile_mean[positions]
+        std = profile_std[positions]
+        # the couples of activities having a standard deviation equal to zero get sys.maxsize as zeta
+        this_zeta = np.full(len(deviating), float(sys.maxsize))
+        np.divide(np.abs(flow_time - mean), std, out=this_zeta, where=std > 0)
+        dev_unbounded.append(std <= 0)
+
+        dev_cases.append(cases.get_indexer(efg[case_id_key].to_numpy()[deviating]))
+        dev_sources.append(efg[activity_key].to_numpy()[deviating])
+        dev_targets.append(efg[activity_key + "_2"].to_numpy()[deviating])
+        dev_flow.append(flow_time)
+        dev_zeta.append(this_zeta)
+
+    if dev_cases:
+        dev_cases = np.concatenate(dev_cases)
+        dev_sources = np.concatenate(dev_sources)
+        dev_targets = np.concatenate(dev_targets)
+        dev_flow = np.concatenate(dev_flow)
+        dev_zeta = np.concatenate(dev_zeta)
+        dev_unbounded = np.concatenate(dev_unbounded)
+    else:
+        dev_cases = np.zeros(0, dtype=np.int64)
+        dev_sources = np.zeros(0, dtype=object)
+        dev_targets = np.zeros(0, dtype=object)
+        dev_flow = np.zeros(0, dtype=np.float64)
+        dev_zeta = np.zeros(0, dtype=np.float64)
+        dev_unbounded = np.zeros(0, dtype=bool)
+
+    # groups the deviations by case, in the order of appearance of the cases
+    order = np.argsort(dev_cases, kind="stable")
+    dev_cases = dev_cases[order]
+    dev_sources = dev_sources[order]
+    dev_targets = dev_targets[order]
+    dev_flow = dev_flow[order]
+    dev_zeta = dev_zeta[order]
+    dev_unbounded = dev_unbounded[order]
+
+    if return_dataframe:
+        return pd.DataFrame({case_id_key: cases.to_numpy()[dev_cases], activity_key: dev_sources,
+                             activity_key + "_2": dev_targets, constants.DEFAULT_FLOW_TIME: dev_flow,
+                             ZETA_COLUMN: dev_zeta})
+
+    boundaries = np.searchsorted(dev_cases, np.arange(len(cases) + 1))
+    dev_zeta = dev_zeta.tolist()
+    for i in np.flatnonzero(dev_unbounded):
+        # as an integer, as in the log variant
+        dev_zeta[i] = sys.maxsize
+    deviations = list(zip(dev_sources.tolist(), dev_targets.tolist(), dev_flow.tolist(), dev_zeta))
+    return [deviations[boundaries[i]:boundaries[i + 1]] for i in range(len(cases))]
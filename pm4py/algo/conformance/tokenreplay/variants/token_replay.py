@@ -53,6 +53,7 @@ class Parameters(Enum):
     CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS = "consider_activities_not_in_model_in_fitness"
     ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
     SHOW_PROGRESS_BAR = "show_progress_bar"
+    USE_PREFIX_TRIE = "use_prefix_trie"
 
 
 class TechnicalParameters(Enum):
@@ -914,12 +915,304 @@ def get_variant_from_trace(trace, activity_key, disable_variants=False):
     return variants_util.get_variant_from_trace(trace, parameters=parameters)
 
 
+def __replay_activity_on_prefix(state, activity, net, trans_map, act_trans, transitions_with_problems,
+                                places_shortest_path_by_hidden, stop_immediately_unfit, walk_through_hidden_trans,
+                                cleaning_token_flood, s_components):
+    """
+    Replays an activity starting from the state reached by a prefix (without the statistics at the place/transition
+    level), returning the state reached by the extended prefix. The activated transitions and the transitions with
+    problems are appended to the provided lists, which are shared by all the prefixes of the current variant.
+
+    Parameters
+    ----------
+    state
+        State reached by the prefix: (marking, number of activated transitions, number of transitions with problems,
+        remaining tokens map, missing, consumed, produced, stopped)
+    activity
+        Activity to replay
+    net
+        Petri net
+    trans_map
+        Map between transitions labels and transitions
+    act_trans
+        Activated transitions (of the prefix)
+    transitions_with_problems
+        Transitions with problems (of the prefix)
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    stop_immediately_unfit
+        Boolean value that decides if we shall stop immediately when a non-conformance is detected
+    walk_through_hidden_trans
+        Boolean value that decides if we shall walk through hidden transitions in order to enable visible transitions
+    cleaning_token_flood
+        Decides if a cleaning of the token flood shall be operated
+    s_components
+        S-components of the Petri net (if workflow net)
+
+    Returns
+    ----------
+    state
+        State reached by the extended prefix
+    """
+    marking, _, _, current_remaining_map, missing, consumed, produced, stopped = state
+    if stopped or activity not in trans_map:
+        return (marking, len(act_trans), len(transitions_with_problems), current_remaining_map, missing, consumed,
+                produced, stopped)
+
+    corr_en_t = [x for x in semantics.enabled_transitions(net, marking) if x.label == activity]
+    if corr_en_t:
+        t = corr_en_t[0]
+    else:
+        t = trans_map[activity]
+    if walk_through_hidden_trans and not semantics.is_enabled(t, net, marking):
+        [net, marking, new_act_trans, _] = apply_hidden_trans(t, net, copy(marking), places_shortest_path_by_hidden,
+                                                              [], 0, set(), [])
+        for tt5 in new_act_trans:
+            consumed = consumed + get_consumed_tokens(tt5)[0]
+            produced = produced + get_produced_tokens(tt5)[0]
+        act_trans.extend(new_act_trans)
+    is_initially_enabled = True
+    old_marking_names = [x.name for x in list(marking.keys())]
+    if not semantics.is_enabled(t, net, marking):
+        is_initially_enabled = False
+        transitions_with_problems.append(t)
+        if stop_immediately_unfit:
+            return (marking, len(act_trans), len(transitions_with_problems), current_remaining_map, missing + 1,
+                    consumed, produced, True)
+        # the marking of the prefix is shared with the other variants, hence the tokens are added to a copy
+        marking = copy(marking)
+        missing = missing + add_missing_tokens(t, marking)[0]
+    consumed = consumed + get_consumed_tokens(t)[0]
+    produced = produced + get_produced_tokens(t)[0]
+    if semantics.is_enabled(t, net, marking):
+        marking = semantics.execute(t, net, marking)
+        act_trans.append(t)
+    if not is_initially_enabled and cleaning_token_flood:
+        current_remaining_map = copy(current_remaining_map)
+        new_marking_names = [x.name for x in list(marking.keys())]
+        new_marking_names_diff = [x for x in new_marking_names if x not in old_marking_names]
+        new_marking_names_inte = [x for x in new_marking_names if x in old_marking_names]
+        for p1 in new_marking_names_inte:
+            for p2 in new_marking_names_diff:
+                for comp in s_components:
+                    if p1 in comp and p2 in comp:
+                        place_to_delete = [place for place in list(marking.keys()) if place.name == p1]
+                        if len(place_to_delete) == 1:
+                            del marking[place_to_delete[0]]
+                            if not place_to_delete[0] in current_remaining_map:
+                                current_remaining_map[place_to_delete[0]] = 0
+                            current_remaining_map[place_to_delete[0]] = current_remaining_map[place_to_delete[0]] + 1
+
+    return (marking, len(act_trans), len(transitions_with_problems), current_remaining_map, missing, consumed, produced,
+            False)
+
+
+def __complete_replay_of_prefix(state, net, final_marking, act_trans, transitions_with_problems,
+                                places_shortest_path_by_hidden, consider_remaining_in_fitness,
+                                try_to_reach_final_marking_through_hidden):
+    """
+    Completes the replay of a variant, starting from the state reached by its last event
+    (trying to reach the final marking and counting the remaining tokens), as done by apply_trace
+
+    Parameters
+    ----------
+    state
+        State reached by the variant
+    net
+        Petri net
+    final_marking
+        Final marking
+    act_trans
+        Activated transitions (of the variant)
+    transitions_with_problems
+        Transitions with problems (of the variant)
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    consider_remaining_in_fitness
+        Boolean value telling if the remaining tokens should be considered in fitness evaluation
+    try_to_reach_final_marking_through_hidden
+        Boolean value that decides if we shall try to reach the final marking through hidden transitions
+
+    Returns
+    ----------
+    result
+        Result of the replay of the variant
+    """
+    marking, num_act_trans, num_trans_probl, current_remaining_map, missing, consumed, produced, _ = state
+    act_trans = act_trans[:num_act_trans]
+
+    if try_to_reach_final_marking_through_hidden:
+        for i in range(TechnicalParameters.MAX_IT_FINAL1.value):
+            if not break_condition_final_marking(marking, final_marking):
+                hidden_transitions_to_enable = get_req_transitions_for_final_marking(marking, final_marking,
+                                                                                     places_shortest_path_by_hidden)
+
+                for group in hidden_transitions_to_enable:
+                    for t in group:
+                        if semantics.is_enabled(t, net, marking):
+                            marking = semantics.execute(t, net, marking)
+                            act_trans.append(t)
+                            consumed = consumed + get_consumed_tokens(t)[0]
+                            produced = produced + get_produced_tokens(t)[0]
+                    if break_condition_final_marking(marking, final_marking):
+                        break
+            else:
+                break
+
+        # try to reach the final marking in a different fashion, if not already reached
+        if not break_condition_final_marking(marking, final_marking):
+            if len(final_marking) == 1:
+                sink_place = list(final_marking)[0]
+
+                connections_to_sink = []
+                for place in marking:
+                    if place in places_shortest_path_by_hidden and sink_place in places_shortest_path_by_hidden[place]:
+                        connections_to_sink.append([place, places_shortest_path_by_hidden[place][sink_place]])
+                connections_to_sink = sorted(connections_to_sink, key=lambda x: len(x[1]))
+
+                for i in range(TechnicalParameters.MAX_IT_FINAL2.value):
+                    for j in range(len(connections_to_sink)):
+                        for z in range(len(connections_to_sink[j][1])):
+                            t = connections_to_sink[j][1][z]
+                            if semantics.is_enabled(t, net, marking):
+                                marking = semantics.execute(t, net, marking)
+                                act_trans.append(t)
+                                consumed = consumed + get_consumed_tokens(t)[0]
+                                produced = produced + get_produced_tokens(t)[0]
+                                continue
+                            else:
+                                break
+
+    marking_before_cleaning = copy(marking)
+
+    missing_final = 0
+    for p in final_marking:
+        diff = final_marking[p] - marking[p]
+        if diff > 0:
+            missing_final = missing_final + diff
+
+    remaining = 0
+    for p in marking:
+        if p in final_marking:
+            remaining = remaining + max(0, marking[p] - final_marking[p])
+        else:
+            remaining = remaining + marking[p]
+    for p in current_remaining_map:
+        remaining = remaining + current_remaining_map[p]
+
+    if consider_remaining_in_fitness:
+        is_fit = (missing == 0) and (remaining == 0)
+    else:
+        is_fit = (missing == 0)
+
+    for pl in final_marking:
+        consumed += final_marking[pl]
+    missing += missing_final
+
+    if consumed > 0 and produced > 0:
+        trace_fitness = 0.5 * (1.0 - float(missing) / float(consumed)) + 0.5 * (
+                1.0 - float(remaining) / float(produced))
+    else:
+        trace_fitness = 1.0
+
+    return {"trace_is_fit": is_fit,
+            "trace_fitness": float(trace_fitness),
+            "activated_transitions": act_trans,
+            "reached_marking": marking_before_cleaning,
+            "enabled_transitions_in_marking": align_utils.get_visible_transitions_eventually_enabled_by_marking(
+                net, marking_before_cleaning),
+            "transitions_with_problems": transitions_with_problems[:num_trans_probl],
+            "missing_tokens": int(missing),
+            "consumed_tokens": int(consumed),
+            "remaining_tokens": int(remaining),
+            "produced_tokens": int(produced)}
+
+
+def apply_variants_prefix_trie(variants, net, initial_marking, final_marking, trans_map,
+                               places_shortest_path_by_hidden, consider_remaining_in_fitness=True,
+                               reach_mark_through_hidden=True, stop_immediately_unfit=False,
+                               walk_through_hidden_trans=True, cleaning_token_flood=False, s_components=None,
+                               progress=None):
+    """
+    Replays the variants of a log visiting depth-first their prefix trie: the variants are sorted, so that the
+    variants sharing a prefix are consecutive, and a stack keeps the states reached by the prefixes of the current
+    variant. Hence, every prefix shared by different variants is replayed only once.
+
+    The statistics at the place/transition level are not computed (use apply_trace for them).
+
+    Parameters
+    ----------
+    variants
+        Variants (tuples of activities)
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    trans_map
+        Map between transitions labels and transitions
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    consider_remaining_in_fitness
+        Boolean value telling if the remaining tokens should be considered in fitness evaluation
+    reach_mark_through_hidden
+        Boolean value that decides if we shall try to reach the final marking through hidden transitions
+    stop_immediately_unfit
+        Boolean value that decides if we shall stop immediately when a non-conformance is detected
+    walk_through_hidden_trans
+        Boolean value that decides if we shall walk through hidden transitions in order to enable visible transitions
+    cleaning_token_flood
+        Decides if a cleaning of the token flood shall be operated
+    s_components
+        S-components of the Petri net (if workflow net)
+    progress
+        (optional) progress bar, updated after the replay of every variant
+
+    Returns
+    ----------
+    results
+        Dictionary associating to every variant the result of its replay
+    """
+    if s_components is None:
+        s_components = []
+
+    act_trans = []
+    transitions_with_problems = []
+    stack = [(copy(initial_marking), 0, 0, {}, 0, 0, sum(initial_marking.values()), False)]
+    previous = ()
+    results = {}
+
+    for variant in sorted(set(variants), key=lambda x: tuple(str(y) for y in x)):
+        common = 0
+        while common < len(previous) and common < len(variant) and previous[common] == variant[common]:
+            common = common + 1
+        # go back to the state reached by the longest prefix in common with the previous variant
+        del stack[common + 1:]
+        del act_trans[stack[-1][1]:]
+        del transitions_with_problems[stack[-1][2]:]
+        for i in range(common, len(variant)):
+            stack.append(__replay_activity_on_prefix(stack[-1], variant[i], net, trans_map, act_trans,
+                                                     transitions_with_problems, places_shortest_path_by_hidden,
+                                                     stop_immediately_unfit, walk_through_hidden_trans,
+                                                     cleaning_token_flood, s_components))
+        results[variant] = __complete_replay_of_prefix(stack[-1], net, final_marking, act_trans,
+                                                       transitions_with_problems, places_shortest_path_by_hidden,
+                                                       consider_remaining_in_fitness, reach_mark_through_hidden)
+        previous = variant
+        if progress is not None:
+            progress.update()
+
+    return results
+
+
 def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=False, consider_remaining_in_fitness=False,
               activity_key="concept:name", reach_mark_through_hidden=True, stop_immediately_unfit=False,
               walk_through_hidden_trans=True, places_shortest_path_by_hidden=None,
               is_reduction=False, thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
               cleaning_token_flood=False, disable_variants=False, return_object_names=False, show_progress_bar=True,
-              consider_activities_not_in_model_in_fitness=False, case_id_key=constants.CASE_CONCEPT_NAME):
+              consider_activities_not_in_model_in_fitness=False, case_id_key=constants.CASE_CONCEPT_NAME,
+              use_prefix_trie=True):
     """
     Apply token-based replay to a log
 
@@ -957,6 +1250,12 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         Disable variants grouping
     return_object_names
         Decides whether names instead of object pointers shall be returned
+    use_prefix_trie
+        Replays the prefixes shared by different variants only once (visiting the prefix trie of the variants).
+        This is not possible when the statistics at the place/transition level are requested, when the caches of
+        the reduction are used, when the activities not in the model are considered in the fitness, or when
+        a maximum execution time (different from the default one) is provided, since the time of the replay of
+        a single variant is not measured in the prefix trie
     """
     post_fix_cache = PostFixCaching()
     marking_to_activity_cache = MarkingToActivityCaching()
@@ -1006,45 +1305,59 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
     threads = {}
     threads_results = {}
 
-    for i in range(len(vc)):
-        variant = vc[i][0]
-        considered_case = variants_util.variant_to_trace(variant, parameters={constants.PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key})
-
-        threads[variant] = ApplyTraceTokenReplay(considered_case, net, initial_marking, final_marking,
-                                                 trans_map, enable_pltr_fitness, place_fitness_per_trace,
-                                                 transition_fitness_per_trace,
-                                                 notexisting_activities_in_model,
-                                                 places_shortest_path_by_hidden,
-                                                 consider_remaining_in_fitness,
-                                                 activity_key=activity_key,
-                                                 reach_mark_through_hidden=reach_mark_through_hidden,
-                                                 stop_immediately_when_unfit=stop_immediately_unfit,
-                                                 walk_through_hidden_trans=walk_through_hidden_trans,
-                                                 post_fix_caching=post_fix_cache,
-                                                 marking_to_activity_caching=marking_to_activity_cache,
-                                                 is_reduction=is_reduction,
-                                                 thread_maximum_ex_time=thread_maximum_ex_time,
-                                                 cleaning_token_flood=cleaning_token_flood,
-                                                 s_components=s_components, trace_occurrences=vc[i][1],
-                                                 consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness)
-        threads[variant].run()
-        if progress is not None:
-            progress.update()
-
-        t = threads[variant]
-        threads_results[variant] = {"trace_is_fit": copy(t.t_fit),
-                                    "trace_fitness": float(copy(t.t_value)),
-                                    "activated_transitions": copy(t.act_trans),
-                                    "reached_marking": copy(t.reached_marking),
-                                    "enabled_transitions_in_marking": copy(
-                                        t.enabled_trans_in_mark),
-                                    "transitions_with_problems": copy(
-                                        t.trans_probl),
-                                    "missing_tokens": int(t.missing),
-                                    "consumed_tokens": int(t.consumed),
-                                    "remaining_tokens": int(t.remaining),
-                                    "produced_tokens": int(t.produced)}
-
+    if use_prefix_trie and not enable_pltr_fitness and not is_reduction and \
+            not consider_activities_not_in_model_in_fitness and \
+            thread_maximum_ex_time == TechnicalParameters.MAX_DEF_THR_EX_TIME.value:
+        threads_results = apply_variants_prefix_trie([x[0] for x in vc], net, initial_marking, final_marking,
+                                                     trans_map, places_shortest_path_by_hidden,
+                                                     consider_remaining_in_fitness=consider_remaining_in_fitness,
+                                                     reach_mark_through_hidden=reach_mark_through_hidden,
+                                                     stop_immediately_unfit=stop_immediately_unfit,
+                                                     walk_through_hidden_trans=walk_through_hidden_trans,
+                                                     cleaning_token_flood=cleaning_token_flood,
+                                                     s_components=s_components, progress=progress)
+    else:
+        for i in range(len(vc)):
+            variant = vc[i][0]
+            considered_case = variants_util.variant_to_trace(variant, parameters={constants.PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key})
+
+            threads[variant] = ApplyTraceTokenReplay(considered_case, net, initial_marking, final_marking,
+                                                     trans_map, enable_pltr_fitness, place_fitness_per_trace,
+                                                     transition_fitness_per_trace,
+                                                     notexisting_activities_in_model,
+                                                     places_shortest_path_by_hidden,
+                                                     consider_remaining_in_fitness,
+                                                     activity_key=activity_key,
+                                                     reach_mark_through_hidden=reach_mark_through_hidden,
+                                                     stop_immediately_when_unfit=stop_immediately_unfit,
+                                                     walk_through_hidden_trans=walk_through_hidden_trans,
+                                                     post_fix_caching=post_fix_cache,
+                                                     marking_to_activity_caching=marking_to_activity_cache,
+                                                     is_reduction=is_reduction,
+                                                     thread_maximum_ex_time=thread_maximum_ex_time,
+                                                     cleaning_token_flood=cleaning_token_flood,
+                                                     s_components=s_components, trace_occurrences=vc[i][1],
+                                                     consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness)
+            threads[variant].run()
+            if progress is not None:
+                progress.update()
+
+            t = threads[variant]
+            threads_results[variant] = {"trace_is_fit": copy(t.t_fit),
+                                        "trace_fitness": float(copy(t.t_value)),
+                                        "activated_transitions": copy(t.act_trans),
+                                        "reached_marking": copy(t.reached_marking),
+                                        "enabled_transitions_in_marking": copy(
+                                            t.enabled_trans_in_mark),
+                                        "transitions_with_problems": copy(
+                                            t.trans_probl),
+                                        "missing_tokens": int(t.missing),
+                                        "consumed_tokens": int(t.consumed),
+                                        "remaining_tokens": int(t.remaining),
+                                        "produced_tokens": int(t.produced)}
+            del threads[variant]
+
+    for variant in threads_results:
         if return_object_names:
             threads_results[variant]["activated_transitions_labels"] = [x.label for x in
                                                                         threads_results[variant][
@@ -1063,7 +1376,6 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
             threads_results[variant]["reached_marking"] = {x.name: y for x, y in
                                                            threads_results[variant][
                                                                "reached_marking"].items()}
-        del threads[variant]
 
     for trace_variant in traces:
         if trace_variant in threads_results:
@@ -1122,6 +1434,7 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
 
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    use_prefix_trie = exec_utils.get_param_value(Parameters.USE_PREFIX_TRIE, parameters, True)
 
     if type(log) is not pd.DataFrame:
         log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
@@ -1136,7 +1449,7 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
                      cleaning_token_flood=cleaning_token_flood, disable_variants=disable_variants,
                      return_object_names=return_names, show_progress_bar=show_progress_bar,
                      consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness,
-                     case_id_key=case_id_key)
+                     case_id_key=case_id_key, use_prefix_trie=use_prefix_trie)
 
 
 def apply_variants_list(variants_list, net, initial_marking, final_marking, parameters=None):
@@ -14,8 +14,15 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.discovery import dfg, alpha, inductive, transition_system, log_skeleton, footprints, minimum_self_distance, performance_spectrum, temporal_profile, batches, heuristics, ocel
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "dfg", "alpha", "inductive", "transition_system", "log_skeleton", "footprints", "minimum_self_distance",
+    "performance_spectrum", "temporal_profile", "batches", "heuristics", "ocel"
+]
 
 if pkgutil.find_loader("pandas"):
-    from pm4py.algo.discovery import correlation_mining
+    _submodules.append("correlation_mining")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,9 +14,23 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.objects.log.util import log_index
 from pm4py.util import xes_constants, pandas_utils, constants
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import get_schedule, to_wall_clock_ns
 import numpy as np
+import pandas as pd
+
+
+def __factorize(values):
+    """
+    Factorizes the provided column (codes sorted according to the values when possible),
+    missing values are associated to the code -1
+    """
+    try:
+        codes, uniques = pd.factorize(values, sort=True)
+    except TypeError:
+        codes, uniques = pd.factorize(values)
+    return codes.astype(np.int32 if len(uniques) < 2 ** 31 - 1 else np.int64, copy=False), uniques
 
 
 def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_glue="case:concept:name",
@@ -28,6 +42,10 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     """
     Get DFG graph from Pandas dataframe
 
+    The activities and the cases are factorized into integer codes, and the couples of events at distance window
+    are obtained by comparing the arrays of codes shifted by window (without copying the dataframe).
+    The arcs are identified by the code source_activity * number_of_target_activities + target_activity.
+
     Parameters
     -----------
     df
@@ -58,8 +76,6 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     dfg
         DFG in the chosen measure (may be only the frequency, only the performance, or both)
     """
-    import pandas as pd
-
     # added support to specify an activity key for the target event which is different
     # from the activity key of the source event.
     if target_activity_key is None:
@@ -69,71 +85,111 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     # to avoid retro-compatibility problems
     st_eq_ct = start_timestamp_key == timestamp_key
     if start_timestamp_key is None:
-        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
-        df[start_timestamp_key] = df[timestamp_key]
+        start_timestamp_key = timestamp_key
         st_eq_ct = True
 
-    # to increase the speed of the approaches reduce dataframe to case, activity (and possibly complete timestamp)
-    # columns
-    if reduce_columns:
-        if measure == "frequency" and not sort_timestamp_along_case_id:
-            df = df[list({case_id_glue, activity_key, target_activity_key})]
-        else:
-            df = df[list({case_id_glue, activity_key, start_timestamp_key, timestamp_key, target_activity_key})]
-
-    # to get rows belonging to same case ID together, we need to sort on case ID
-    if sort_caseid_required:
-        if sort_timestamp_along_case_id:
-            df = df.sort_values([case_id_glue, start_timestamp_key, timestamp_key])
+    need_timestamps = measure == "performance" or measure == "both"
+    index = None
+    if sort_caseid_required and sort_timestamp_along_case_id and st_eq_ct and target_activity_key == activity_key and \
+            not (need_timestamps and business_hours):
+        index = log_index.get(df, parameters={log_index.Parameters.CASE_ID_KEY: case_id_glue,
+                                               log_index.Parameters.ACTIVITY_KEY: activity_key,
+                                               log_index.Parameters.TIMESTAMP_KEY: timestamp_key})
+
+    if index is not None and index.timestamps_ns is not None:
+        # the index attached to the dataframe already contains the codes of the events sorted by case and timestamp
+        case_codes, activity_codes, activities = index.case_codes, index.activity_codes, index.activities
+        target_codes, target_activities = activity_codes, activities
+        num_targets = max(len(target_activities), 1)
+        ts_ns, ts_nat = index.timestamps_ns, index.timestamps_nat
+        st_ns, st_nat = ts_ns, ts_nat
+    else:
+        case_codes, _ = __factorize(df[case_id_glue])
+        activity_codes, activities = __factorize(df[activity_key])
+        if target_activity_key == activity_key:
+            target_codes, target_activities = activity_codes, activities
         else:
-            df = df.sort_values(case_id_glue)
+            target_codes, target_activities = __factorize(df[target_activity_key])
+        num_targets = max(len(target_activities), 1)
+
+        if need_timestamps or sort_timestamp_along_case_id:
+            ts_ns, ts_nat = __timestamps_to_ns(df[timestamp_key])
+            st_ns, st_nat = __timestamps_to_ns(df[start_timestamp_key]) if not st_eq_ct else (ts_ns, ts_nat)
+        if need_timestamps and business_hours:
+            # working time (in nanoseconds) elapsed, since a reference instant, at the timestamps of the events
+            if business_hours_slot is None:
+                business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+            schedule = get_schedule(business_hours_slot, workcalendar)
+            ts_working_ns = schedule.working_ns(to_wall_clock_ns(df[timestamp_key])[0])
+            st_working_ns = schedule.working_ns(to_wall_clock_ns(df[start_timestamp_key])[0]) if not st_eq_ct else ts_working_ns
+
+        # to get rows belonging to same case ID together, we need to sort on case ID
+        # (the missing case identifiers are placed at the end)
+        if sort_caseid_required:
+            sort_case_codes = np.where(case_codes >= 0, case_codes, np.iinfo(case_codes.dtype).max)
+            if sort_timestamp_along_case_id:
+                order = np.lexsort((np.where(ts_nat, np.iinfo(np.int64).max, ts_ns),
+                                    np.where(st_nat, np.iinfo(np.int64).max, st_ns), sort_case_codes))
+            else:
+                order = np.argsort(sort_case_codes, kind="stable")
+            case_codes = case_codes[order]
+            activity_codes = activity_codes[order]
+            target_codes = activity_codes if target_activity_key == activity_key else target_codes[order]
+            if need_timestamps:
+                ts_ns, ts_nat, st_ns, st_nat = ts_ns[order], ts_nat[order], st_ns[order], st_nat[order]
+                if business_hours:
+                    ts_working_ns, st_working_ns = ts_working_ns[order], st_working_ns[order]
+
+    # couples of events at distance window belonging to the same case
+    n = len(case_codes)
+    window = max(window, 1)
+    if n > window:
+        source = np.arange(n - window)
+        valid = (case_codes[:-window] == case_codes[window:]) & (case_codes[:-window] >= 0) & (
+                activity_codes[:-window] >= 0) & (target_codes[window:] >= 0)
+        source = source[valid]
+    else:
+        source = np.zeros(0, dtype=np.int64)
+    target = source + window
+    arcs = activity_codes[source].astype(np.int64) * num_targets + target_codes[target]
 
-    # shift the dataframe by 1, in order to couple successive rows
-    df_shifted = df.shift(-window)
-    # change column names to shifted dataframe
-    df_shifted.columns = [str(col) + '_2' for col in df_shifted.columns]
-    # concate the two dataframe to get a unique dataframe
-    df_successive_rows = pd.concat([df, df_shifted], axis=1)
-    # as successive rows in the sorted dataframe may belong to different case IDs we have to restrict ourselves to
-    # successive rows belonging to same case ID
-    df_successive_rows = df_successive_rows[df_successive_rows[case_id_glue] == df_successive_rows[case_id_glue + '_2']]
     if keep_once_per_case:
-        df_successive_rows = df_successive_rows.groupby(
-            [case_id_glue, activity_key, target_activity_key + "_2"]).first().reset_index()
+        # keeps only the first occurrence of every arc inside a case
+        _, first_occurrences = np.unique(case_codes[source].astype(np.int64) * (len(activities) * num_targets) + arcs,
+                                         return_index=True)
+        first_occurrences = np.sort(first_occurrences)
+        source = source[first_occurrences]
+        target = target[first_occurrences]
+        arcs = arcs[first_occurrences]
 
-    all_columns = set(df_successive_rows.columns)
-    all_columns = list(all_columns - set([activity_key, target_activity_key + '_2']))
+    dfg_frequency = {}
+    dfg_performance = {}
+
+    if measure == "frequency" or measure == "both":
+        arc_codes, arc_counts = np.unique(arcs, return_counts=True)
+        dfg_frequency = {(activities[a // num_targets], target_activities[a % num_targets]): c for a, c in
+                         zip(arc_codes.tolist(), arc_counts.tolist())}
 
-    if measure == "performance" or measure == "both":
-        if not st_eq_ct:
-            # in the arc performance calculation, make sure to consider positive or null values
-            df_successive_rows[start_timestamp_key + '_2'] = df_successive_rows[[start_timestamp_key + '_2', timestamp_key]].max(axis=1)
-        
+    if need_timestamps:
         # calculate the difference between the timestamps of two successive events
+        # (in the arc performance calculation, make sure to consider positive or null values)
         if business_hours:
-            if business_hours_slot is None:
-                business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-            df_successive_rows[constants.DEFAULT_FLOW_TIME] = df_successive_rows.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+            flow_time = np.maximum(st_working_ns[target] - ts_working_ns[source], 0) / 10 ** 9
         else:
-            df_successive_rows[constants.DEFAULT_FLOW_TIME] = (
-                    df_successive_rows[start_timestamp_key + '_2'] - df_successive_rows[timestamp_key]).astype(
-                'timedelta64[s]')
-        # groups couple of attributes (directly follows relation, we can measure the frequency and the performance)
-        directly_follows_grouping = df_successive_rows.groupby([activity_key, target_activity_key + '_2'])[
-            constants.DEFAULT_FLOW_TIME]
-    else:
-        directly_follows_grouping = df_successive_rows.groupby([activity_key, target_activity_key + '_2'])
-        if all_columns:
-            directly_follows_grouping = directly_follows_grouping[all_columns[0]]
+            target_st_ns = st_ns[target]
+            if not st_eq_ct:
+                target_st_ns = np.maximum(target_st_ns, ts_ns[source])
+            flow_time = np.floor_divide(target_st_ns - ts_ns[source], 10 ** 9).astype(np.float64)
+        missing = ts_nat[source] | st_nat[target]
+        if missing.any():
+            flow_time[missing] = np.nan
 
-    dfg_frequency = {}
-    dfg_performance = {}
+        # groups the flow times by the integer code of the arc
+        directly_follows_grouping = pd.Series(flow_time).groupby(arcs)
 
-    if measure == "frequency" or measure == "both":
-        dfg_frequency = directly_follows_grouping.size().to_dict()
+        def __decode(dictio):
+            return {(activities[a // num_targets], target_activities[a % num_targets]): v for a, v in dictio.items()}
 
-    if measure == "performance" or measure == "both":
         if perf_aggregation_key == "all":
             dfg_performance_mean = directly_follows_grouping.agg("mean").to_dict()
             dfg_performance_median = directly_follows_grouping.agg("median").to_dict()
@@ -144,10 +200,11 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
             dfg_performance = {}
             for key in dfg_performance_mean:
                 dfg_performance[key] = {"mean": dfg_performance_mean[key], "median": dfg_performance_median[key], "max": dfg_performance_max[key], "min": dfg_performance_min[key], "sum": dfg_performance_sum[key], "stdev": dfg_performance_std[key]}
+            dfg_performance = __decode(dfg_performance)
         elif perf_aggregation_key == "raw_values":
-            dfg_performance = directly_follows_grouping.apply(list).to_dict()
+            dfg_performance = __decode(directly_follows_grouping.apply(list).to_dict())
         else:
-            dfg_performance = directly_follows_grouping.agg(perf_aggregation_key).to_dict()
+            dfg_performance = __decode(directly_follows_grouping.agg(perf_aggregation_key).to_dict())
 
     if measure == "frequency":
         return dfg_frequency
@@ -159,6 +216,326 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         return [dfg_frequency, dfg_performance]
 
 
+DEFAULT_MAX_PAIRS_PER_CHUNK = 2000000
+
+
+def __prepare_partial_order_dataframe(df, start_timestamp_key, timestamp_key, case_id_glue, activity_key,
+                                      sort_caseid_required, sort_timestamp_along_case_id, reduce_dataframe,
+                                      event_index):
+    """
+    Prepares the dataframe for the computation of the partial order (sorting, reduction of the columns),
+    and computes the NumPy arrays (case codes, event indexes, timestamps) used to generate the couples of events.
+
+    The rows of the returned dataframe are grouped by case, and inside each case sorted by the event index.
+    """
+    if start_timestamp_key not in df:
+        df = df.copy()
+        df[start_timestamp_key] = df[timestamp_key]
+
+    # to increase the speed of the approaches reduce dataframe to case, activity (and possibly complete timestamp)
+    # columns
+    if reduce_dataframe:
+        needed_columns = {case_id_glue, activity_key, start_timestamp_key, timestamp_key}
+        if event_index in df.columns:
+            needed_columns.add(event_index)
+        needed_columns = list(needed_columns)
+        df = df[needed_columns]
+
+    # to get rows belonging to same case ID together, we need to sort on case ID
+    if sort_caseid_required:
+        if sort_timestamp_along_case_id:
+            df = df.sort_values([case_id_glue, start_timestamp_key, timestamp_key])
+        else:
+            df = df.sort_values(case_id_glue)
+    df = df.reset_index(drop=True)
+
+    if event_index not in df.columns:
+        df[event_index] = df.index
+
+    case_codes = pd.factorize(df[case_id_glue])[0]
+    indexes = df[event_index].to_numpy()
+    # groups the events of the same case together, respecting the order given by the event index
+    order = np.lexsort((indexes, case_codes))
+    if not np.array_equal(order, np.arange(len(order))):
+        df = df.take(order).reset_index(drop=True)
+        case_codes = case_codes[order]
+        indexes = indexes[order]
+
+    return df, case_codes, indexes
+
+
+def __timestamps_to_ns(series):
+    """
+    Gets the NumPy array of nanoseconds since the epoch, and the mask of missing values, of a timestamp column
+    """
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+    values = series.to_numpy(dtype="datetime64[ns]")
+    return values.view(np.int64), np.isnat(values)
+
+
+def __iterate_partial_order_couples(case_codes, indexes, ts_ns, ts_nat, st_ns, st_nat, keep_first_following,
+                                    max_pairs_per_chunk):
+    """
+    Generates the couples of events (of the same case) that are in the partial order, without materializing the
+    whole table of couples: the events are split in blocks such that the number of candidate couples
+    having as source an event of the block does not exceed the provided threshold (every source event
+    belongs to exactly one block).
+
+    Yields
+    ---------------
+    (src, tgt)
+        NumPy arrays containing the positions of the source and target events of the couples
+    """
+    n = len(case_codes)
+    if n == 0:
+        return
+    positions = np.arange(n)
+    case_starts = np.flatnonzero(np.r_[True, case_codes[1:] != case_codes[:-1]])
+    case_ends = np.r_[case_starts[1:], n]
+    case_lengths = case_ends - case_starts
+    ends = np.repeat(case_ends, case_lengths)
+    # number of candidate target events for each source event
+    num_targets = ends - positions - 1
+    cum_targets = np.cumsum(num_targets)
+
+    i0 = 0
+    while i0 < n:
+        already = cum_targets[i0 - 1] if i0 > 0 else 0
+        i1 = int(np.searchsorted(cum_targets, already + max_pairs_per_chunk, side="right"))
+        i1 = min(max(i1, i0 + 1), n)
+        counts = num_targets[i0:i1]
+        total = int(counts.sum())
+        if total > 0:
+            src = np.repeat(positions[i0:i1], counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            tgt = src + 1 + offsets
+            mask = (indexes[src] < indexes[tgt]) & (ts_ns[src] <= st_ns[tgt]) & ~ts_nat[src] & ~st_nat[tgt]
+            src = src[mask]
+            tgt = tgt[mask]
+            if keep_first_following and len(src) > 0:
+                first = np.r_[True, src[1:] != src[:-1]]
+                src = src[first]
+                tgt = tgt[first]
+            if len(src) > 0:
+                yield src, tgt
+        i0 = i1
+
+
+def __flow_times(src, tgt, ts_ns, st_ns, ts_working_ns=None, st_working_ns=None):
+    """
+    Gets the flow time (in seconds) between the source and the target events of the provided couples
+    """
+    if ts_working_ns is not None:
+        return np.maximum(st_working_ns[tgt] - ts_working_ns[src], 0) / 10 ** 9
+    return np.floor_divide(st_ns[tgt] - ts_ns[src], 10 ** 9).astype(np.float64)
+
+
+def get_partial_order_dataframe_chunks(df, start_timestamp_key=None, timestamp_key="time:timestamp",
+                                       case_id_glue="case:concept:name", activity_key="concept:name",
+                                       sort_caseid_required=True,
+                                       sort_timestamp_along_case_id=True, reduce_dataframe=True,
+                                       keep_first_following=True,
+                                       business_hours=False, business_hours_slot=None,
+                                       workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR,
+                                       event_index=constants.DEFAULT_INDEX_KEY,
+                                       max_pairs_per_chunk=DEFAULT_MAX_PAIRS_PER_CHUNK):
+    """
+    Gets the partial order between events (of the same case) in a Pandas dataframe, as a generator of
+    dataframes (chunks) each containing at most max_pairs_per_chunk couples of events, so that the
+    whole partial order never needs to be kept in memory.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    start_timestamp_key
+        Start timestamp key (if not provided, defaulted to the timestamp_key)
+    timestamp_key
+        Complete timestamp
+    case_id_glue
+        Column of the dataframe to use as case ID
+    activity_key
+        Activity key
+    sort_caseid_required
+        Tells if a sort by case ID is required (default: True)
+    sort_timestamp_along_case_id
+        Tells if a sort by timestamp is required along the case ID (default: True)
+    reduce_dataframe
+        To fasten operation, keep only essential columns in the dataframe
+    keep_first_following
+        Keep only the first event following the given event
+    business_hours
+        Enables/disables the computation of the flow time based on the business hours
+    business_hours_slot
+        Work schedule of the company (business hour slots)
+    workcalendar
+        Work calendar
+    event_index
+        Column containing the index of the event (if not provided, the position in the sorted dataframe is used)
+    max_pairs_per_chunk
+        Maximum number of candidate couples of events considered in each chunk
+
+    Returns
+    ---------------
+    chunks
+        Generator of partial order dataframes (with @@flow_time between events)
+    """
+    if start_timestamp_key is None:
+        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+
+    df, case_codes, indexes = __prepare_partial_order_dataframe(df, start_timestamp_key, timestamp_key,
+                                                                 case_id_glue, activity_key, sort_caseid_required,
+                                                                 sort_timestamp_along_case_id, reduce_dataframe,
+                                                                 event_index)
+    ts_ns, ts_nat = __timestamps_to_ns(df[timestamp_key])
+    st_ns, st_nat = __timestamps_to_ns(df[start_timestamp_key])
+    ts_working_ns = None
+    st_working_ns = None
+    if business_hours:
+        schedule = get_schedule(business_hours_slot if business_hours_slot is not None else
+                                constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar)
+        ts_working_ns = schedule.working_ns(to_wall_clock_ns(df[timestamp_key])[0])
+        st_working_ns = schedule.working_ns(to_wall_clock_ns(df[start_timestamp_key])[0])
+
+    for src, tgt in __iterate_partial_order_couples(case_codes, indexes, ts_ns, ts_nat, st_ns, st_nat,
+                                                    keep_first_following, max_pairs_per_chunk):
+        yield __build_partial_order_chunk(df, case_id_glue, src, tgt,
+                                          __flow_times(src, tgt, ts_ns, st_ns, ts_working_ns, st_working_ns))
+
+
+def __build_partial_order_chunk(df, case_id_glue, src, tgt, flow_times):
+    """
+    Builds the dataframe containing the provided couples of events (the attributes of the target event
+    are suffixed with _2)
+    """
+    other_columns = [x for x in df.columns if x != case_id_glue]
+    chunk = {case_id_glue: df[case_id_glue].to_numpy()[src]}
+    for suffix, positions in (("", src), ("_2", tgt)):
+        for col in other_columns:
+            series = df[col]
+            if getattr(series.dtype, "tz", None) is not None:
+                # keeps the timezone information
+                chunk[col + suffix] = pd.DatetimeIndex(series.values[positions]).tz_localize("UTC").tz_convert(
+                    series.dtype.tz)
+            else:
+                chunk[col + suffix] = series.to_numpy()[positions]
+    chunk[constants.DEFAULT_FLOW_TIME] = flow_times
+    return pd.DataFrame(chunk)
+
+
+def get_partial_order_aggregates(df, start_timestamp_key=None, timestamp_key="time:timestamp",
+                                 case_id_glue="case:concept:name", activity_key="concept:name",
+                                 sort_caseid_required=True,
+                                 sort_timestamp_along_case_id=True, keep_first_following=False,
+                                 business_hours=False, business_hours_slot=None,
+                                 workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR,
+                                 event_index=constants.DEFAULT_INDEX_KEY,
+                                 max_pairs_per_chunk=DEFAULT_MAX_PAIRS_PER_CHUNK):
+    """
+    Computes, for each couple of activities in the partial order (eventually-follows relation) of the dataframe,
+    the number of occurrences and the mean/standard deviation of the flow time, without materializing the table
+    of the couples of events. The couples are generated in blocks of bounded size, and the statistics of the
+    blocks are merged with the parallel variance algorithm (Chan et al.).
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    start_timestamp_key
+        Start timestamp key (if not provided, defaulted to the timestamp_key)
+    timestamp_key
+        Complete timestamp
+    case_id_glue
+        Column of the dataframe to use as case ID
+    activity_key
+        Activity key
+    sort_caseid_required
+        Tells if a sort by case ID is required (default: True)
+    sort_timestamp_along_case_id
+        Tells if a sort by timestamp is required along the case ID (default: True)
+    keep_first_following
+        Keep only the first event following the given event
+    business_hours
+        Enables/disables the computation of the flow time based on the business hours
+    business_hours_slot
+        Work schedule of the company (business hour slots)
+    workcalendar
+        Work calendar
+    event_index
+        Column containing the index of the event (if not provided, the position in the sorted dataframe is used)
+    max_pairs_per_chunk
+        Maximum number of candidate couples of events considered in each block
+
+    Returns
+    ---------------
+    aggregates
+        Dictionary associating to each couple of activities a dictionary with the keys "count", "mean" and "stdev"
+        (sample standard deviation of the flow time, NaN if the couple occurs once)
+    """
+    if start_timestamp_key is None:
+        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+
+    df, case_codes, indexes = __prepare_partial_order_dataframe(df, start_timestamp_key, timestamp_key,
+                                                                 case_id_glue, activity_key, sort_caseid_required,
+                                                                 sort_timestamp_along_case_id, True, event_index)
+    ts_ns, ts_nat = __timestamps_to_ns(df[timestamp_key])
+    st_ns, st_nat = __timestamps_to_ns(df[start_timestamp_key])
+    ts_working_ns = None
+    st_working_ns = None
+    if business_hours:
+        schedule = get_schedule(business_hours_slot if business_hours_slot is not None else
+                                constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar)
+        ts_working_ns = schedule.working_ns(to_wall_clock_ns(df[timestamp_key])[0])
+        st_working_ns = schedule.working_ns(to_wall_clock_ns(df[start_timestamp_key])[0])
+
+    activity_codes, activities = pd.factorize(df[activity_key])
+    num_activities = max(len(activities), 1)
+
+    keys = np.zeros(0, dtype=np.int64)
+    count = np.zeros(0, dtype=np.int64)
+    mean = np.zeros(0, dtype=np.float64)
+    m2 = np.zeros(0, dtype=np.float64)
+
+    for src, tgt in __iterate_partial_order_couples(case_codes, indexes, ts_ns, ts_nat, st_ns, st_nat,
+                                                    keep_first_following, max_pairs_per_chunk):
+        valid = (activity_codes[src] >= 0) & (activity_codes[tgt] >= 0)
+        src = src[valid]
+        tgt = tgt[valid]
+        flow = __flow_times(src, tgt, ts_ns, st_ns, ts_working_ns, st_working_ns)
+        block_keys, inverse, block_count = np.unique(activity_codes[src].astype(np.int64) * num_activities +
+                                                     activity_codes[tgt], return_inverse=True, return_counts=True)
+        block_mean = np.bincount(inverse, weights=flow) / block_count
+        block_m2 = np.bincount(inverse, weights=(flow - block_mean[inverse]) ** 2)
+
+        # merges the statistics of the block in the overall statistics
+        new_keys = np.union1d(keys, block_keys)
+        old_positions = np.searchsorted(new_keys, keys)
+        block_positions = np.searchsorted(new_keys, block_keys)
+        new_count = np.zeros(len(new_keys), dtype=np.int64)
+        new_mean = np.zeros(len(new_keys), dtype=np.float64)
+        new_m2 = np.zeros(len(new_keys), dtype=np.float64)
+        new_count[old_positions] = count
+        new_mean[old_positions] = mean
+        new_m2[old_positions] = m2
+        count_a = new_count[block_positions]
+        total = count_a + block_count
+        delta = block_mean - new_mean[block_positions]
+        new_mean[block_positions] = new_mean[block_positions] + delta * block_count / total
+        new_m2[block_positions] = new_m2[block_positions] + block_m2 + delta ** 2 * count_a * block_count / total
+        new_count[block_positions] = total
+        keys, count, mean, m2 = new_keys, new_count, new_mean, new_m2
+
+    ret = {}
+    for i in range(len(keys)):
+        act1 = activities[keys[i] // num_activities]
+        act2 = activities[keys[i] % num_activities]
+        stdev = float(np.sqrt(m2[i] / (count[i] - 1))) if count[i] > 1 else float("nan")
+        ret[(act1, act2)] = {"count": int(count[i]), "mean": float(mean[i]), "stdev": stdev}
+
+    return ret
+
+
 def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="time:timestamp",
                                 case_id_glue="case:concept:name", activity_key="concept:name",
                                 sort_caseid_required=True,
@@ -168,6 +545,11 @@ def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="tim
     """
     Gets the partial order between events (of the same case) in a Pandas dataframe
 
+    The couples of events are generated case by case in blocks of bounded size (see
+    get_partial_order_dataframe_chunks), hence the memory required is the one of the output table.
+    If only the statistics per couple of activities are needed, get_partial_order_aggregates
+    avoids materializing the table.
+
     Parameters
     --------------
     df
@@ -201,44 +583,29 @@ def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="tim
     if start_timestamp_key not in df:
         df[start_timestamp_key] = df[timestamp_key]
 
-    # to increase the speed of the approaches reduce dataframe to case, activity (and possibly complete timestamp)
-    # columns
-    if reduce_dataframe:
-        needed_columns = {case_id_glue, activity_key, start_timestamp_key, timestamp_key}
-        if event_index in df.columns:
-            needed_columns.add(event_index)
-        needed_columns = list(needed_columns)
-        df = df[needed_columns]
-
-    # to get rows belonging to same case ID together, we need to sort on case ID
-    if sort_caseid_required:
-        if sort_timestamp_along_case_id:
-            df = df.sort_values([case_id_glue, start_timestamp_key, timestamp_key])
-        else:
-            df = df.sort_values(case_id_glue)
-        df.reset_index(drop=True, inplace=True)
-
-    if event_index not in df.columns:
-        df[event_index] = df.index
-
-    df.set_index(case_id_glue, inplace=True)
-
-    df = df.join(df, rsuffix="_2")
-    df = df[df[event_index] < df[event_index + "_2"]]
-    df = df[df[timestamp_key] <= df[start_timestamp_key + '_2']]
-
-    df.reset_index(inplace=True)
-
-    if business_hours:
-        if business_hours_slot is None:
-            business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-        df[constants.DEFAULT_FLOW_TIME] = df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+    chunks = list(get_partial_order_dataframe_chunks(df, start_timestamp_key=start_timestamp_key,
+                                                     timestamp_key=timestamp_key, case_id_glue=case_id_glue,
+                                                     activity_key=activity_key,
+                                                     sort_caseid_required=sort_caseid_required,
+                                                     sort_timestamp_along_case_id=sort_timestamp_along_case_id,
+                                                     reduce_dataframe=reduce_dataframe,
+                                                     keep_first_following=keep_first_following,
+                                                     business_hours=business_hours,
+                                                     business_hours_slot=business_hours_slot,
+                                                     workcalendar=workcalendar, event_index=event_index))
+    if chunks:
+        df = pd.concat(chunks, ignore_index=True)
     else:
-        df[constants.DEFAULT_FLOW_TIME] = (df[start_timestamp_key + "_2"] - df[timestamp_key]).astype('timedelta64[s]')
+        df, case_codes, indexes = __prepare_partial_order_dataframe(df.head(0), start_timestamp_key, timestamp_key,
+                                                                     case_id_glue, activity_key, False, False,
+                                                                     reduce_dataframe, event_index)
+        empty = np.zeros(0, dtype=np.int64)
+        df = __build_partial_order_chunk(df, case_id_glue, empty, empty, np.zeros(0, dtype=np.float64))
 
     if keep_first_following:
-        df = df.groupby(constants.DEFAULT_INDEX_KEY).first().reset_index()
+        df = df.sort_values(constants.DEFAULT_INDEX_KEY, kind="stable")
+        df = df[[constants.DEFAULT_INDEX_KEY] + [x for x in df.columns if x != constants.DEFAULT_INDEX_KEY]]
+        df = df.reset_index(drop=True)
 
     return df
 
@@ -14,9 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.discovery.dfg.variants import native, performance, freq_triples, case_attributes, clean
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["native", "performance", "freq_triples", "case_attributes", "clean"]
 
 if pkgutil.find_loader("polars"):
-    from pm4py.algo.discovery.dfg.variants import clean_polars
+    _submodules.append("clean_polars")
 
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -30,11 +30,13 @@ from pm4py.statistics.start_activities.log import get as log_sa_filter
 from pm4py.util import constants
 from pm4py.util import exec_utils
 from pm4py.util import xes_constants as xes
-from typing import Optional, Dict, Any, Union, Tuple
+from typing import Optional, Dict, Any, Union, Tuple, List
 from pm4py.objects.log.obj import EventLog, EventStream
 from pm4py.objects.petri_net.obj import PetriNet, Marking
+import numpy as np
 import pandas as pd
 from pm4py.objects.heuristics_net.obj import HeuristicsNet
+from pm4py.objects.log.util import log_index
 
 
 class Parameters(Enum):
@@ -225,6 +227,10 @@ def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Para
     """
     Discovers an Heuristics Net using Heuristics Miner
 
+    The DFG, the DFG of window 2 and the frequency triples are counted on the successions of the activities of the
+    cases. If an index is attached to the dataframe (see pm4py.objects.log.util.log_index), the counts are kept
+    in the index and reused by the following discoveries on the same dataframe (e.g. with different thresholds)
+
     Parameters
     ------------
     df
@@ -267,7 +273,22 @@ def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Para
     activities = list(activities_occurrences.keys())
     heu_net_decoration = exec_utils.get_param_value(Parameters.HEU_NET_DECORATION, parameters, "frequency")
 
-    if timestamp_key in df:
+    index = None
+    if start_timestamp_key is None or start_timestamp_key == timestamp_key:
+        # the DFG, the DFG of window 2 and the frequency triples are obtained from the successions of the events
+        # (counted once on the index of the dataframe, and reused if the index is attached to the dataframe)
+        index = log_index.get(df, parameters={log_index.Parameters.CASE_ID_KEY: case_id_glue,
+                                               log_index.Parameters.ACTIVITY_KEY: activity_key,
+                                               log_index.Parameters.TIMESTAMP_KEY: timestamp_key})
+        if index is None:
+            index = log_index.EventLogIndex(df, case_id_glue, activity_key, timestamp_key)
+        if index.timestamps_ns is None and timestamp_key in df:
+            # the timestamps are not datetimes: the events are sorted on their values
+            index = None
+
+    if index is not None:
+        dfg, dfg_window_2, frequency_triples = __get_successions(index)
+    elif timestamp_key in df:
         dfg = df_statistics.get_dfg_graph(df, case_id_glue=case_id_glue,
                                           activity_key=activity_key, timestamp_key=timestamp_key,
                                           start_timestamp_key=start_timestamp_key)
@@ -304,6 +325,31 @@ def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Para
     return heu_net
 
 
+def __get_successions(index: log_index.EventLogIndex) -> Tuple[Dict[Tuple[str, str], int], Dict[Tuple[str, str], int],
+                                                              Dict[Tuple[str, str, str], int]]:
+    """
+    Gets the DFG, the DFG of window 2 and the frequency triples from the successions of two and three events
+    of the cases of the index
+    """
+    activities = index.activities.tolist()
+    pairs, pair_counts = index.get_successions(2)
+    valid = (pairs >= 0).all(axis=1)
+    dfg = {(activities[a], activities[b]): c for a, b, c in
+           zip(pairs[valid, 0].tolist(), pairs[valid, 1].tolist(), pair_counts[valid].tolist())}
+    triples, triple_counts = index.get_successions(3)
+    # the events at distance two are the first and the last event of a succession of three events
+    valid = (triples[:, 0] >= 0) & (triples[:, 2] >= 0)
+    keys, inverse = np.unique(triples[valid, 0] * len(activities) + triples[valid, 2], return_inverse=True)
+    counts = np.bincount(inverse, weights=triple_counts[valid], minlength=len(keys)).astype(np.int64)
+    dfg_window_2 = {(activities[k // len(activities)], activities[k % len(activities)]): c for k, c in
+                    zip(keys.tolist(), counts.tolist())}
+    valid = (triples >= 0).all(axis=1)
+    freq_triples = {(activities[a], activities[b], activities[c]): n for a, b, c, n in
+                    zip(triples[valid, 0].tolist(), triples[valid, 1].tolist(), triples[valid, 2].tolist(),
+                        triple_counts[valid].tolist())}
+    return dfg, dfg_window_2, freq_triples
+
+
 def apply_heu_dfg(dfg, activities=None, activities_occurrences=None, start_activities=None, end_activities=None,
                   dfg_window_2=None, freq_triples=None, performance_dfg=None, parameters=None) -> HeuristicsNet:
     """
@@ -379,8 +425,14 @@ def calculate(heu_net, dependency_thresh=defaults.DEFAULT_DEPENDENCY_THRESH,
     """
     Calculate the dependency matrix, populate the nodes
 
+    The measures are computed on arrays of the counts of the DFG and of the frequency triples. The nodes of the
+    heuristics net are replaced, so the function can be applied again on the same heuristics net with different
+    thresholds (without computing again the DFG and the frequency triples)
+
     Parameters
     -------------
+    heu_net
+        Heuristics net
     dependency_thresh
         (Optional) dependency threshold
     and_measure_thresh
@@ -399,6 +451,7 @@ def calculate(heu_net, dependency_thresh=defaults.DEFAULT_DEPENDENCY_THRESH,
     if parameters is None:
         parameters = {}
     heu_net.min_dfg_occurrences = min_dfg_occurrences
+    heu_net.nodes = {}
     heu_net.dependency_matrix = None
     heu_net.dependency_matrix = {}
     heu_net.dfg_matrix = None
@@ -427,61 +480,86 @@ def calculate(heu_net, dependency_thresh=defaults.DEFAULT_DEPENDENCY_THRESH,
                 if act1 not in heu_net.freq_triples_matrix:
                     heu_net.freq_triples_matrix[act1] = {}
                 heu_net.freq_triples_matrix[act1][act2] = value
-    for el in heu_net.dfg:
+    # codes of the activities, and counts of the DFG as arrays (in the order of the DFG)
+    codes = {}
+    dfg_keys = list(heu_net.dfg)
+    dfg_values = list(heu_net.dfg.values())
+    perf_values = [heu_net.performance_dfg[el] for el in dfg_keys] if heu_net.performance_dfg is not None else \
+        dfg_values
+    sources = np.array([codes.setdefault(el[0], len(codes)) for el in dfg_keys], dtype=np.int64)
+    targets = np.array([codes.setdefault(el[1], len(codes)) for el in dfg_keys], dtype=np.int64)
+    counts = np.array(dfg_values) if dfg_values else np.zeros(0, dtype=np.int64)
+    loops = [(act1, act2, value) for act1 in heu_net.freq_triples_matrix for act2, value in
+             heu_net.freq_triples_matrix[act1].items()]
+    loops_sources = np.array([codes.setdefault(el[0], len(codes)) for el in loops], dtype=np.int64)
+    loops_targets = np.array([codes.setdefault(el[1], len(codes)) for el in loops], dtype=np.int64)
+    loops_counts = np.array([el[2] for el in loops]) if loops else np.zeros(0, dtype=np.int64)
+    num_codes = max(len(codes), 1)
+    dfg_lookup = __get_lookup(sources * num_codes + targets, counts)
+    triples_lookup = __get_lookup(loops_sources * num_codes + loops_targets, loops_counts)
+
+    # dependency measure of every couple of activities of the DFG
+    inverse_counts = dfg_lookup(targets * num_codes + sources)
+    dependencies = np.where(sources == targets, counts / (counts + 1),
+                            (counts - inverse_counts) / (counts + inverse_counts + 1))
+    dependencies_list = dependencies.tolist()
+    for i, el in enumerate(dfg_keys):
         act1 = el[0]
         act2 = el[1]
-        value = heu_net.dfg[el]
-        perf_value = heu_net.performance_dfg[el] if heu_net.performance_dfg is not None else heu_net.dfg[el]
         if act1 not in heu_net.dependency_matrix:
             heu_net.dependency_matrix[act1] = {}
             heu_net.dfg_matrix[act1] = {}
             heu_net.performance_matrix[act1] = {}
-        heu_net.dfg_matrix[act1][act2] = value
-        heu_net.performance_matrix[act1][act2] = perf_value
-        if not act1 == act2:
-            inv_couple = (act2, act1)
-            c1 = value
-            if inv_couple in heu_net.dfg:
-                c2 = heu_net.dfg[inv_couple]
-                dep = (c1 - c2) / (c1 + c2 + 1)
-            else:
-                dep = c1 / (c1 + 1)
-        else:
-            dep = value / (value + 1)
-        heu_net.dependency_matrix[act1][act2] = dep
-    for n1 in heu_net.dependency_matrix:
-        for n2 in heu_net.dependency_matrix[n1]:
-            condition1 = n1 in heu_net.activities_occurrences and heu_net.activities_occurrences[n1] >= min_act_count
-            condition2 = n2 in heu_net.activities_occurrences and heu_net.activities_occurrences[n2] >= min_act_count
-            condition3 = heu_net.dfg_matrix[n1][n2] >= min_dfg_occurrences
-            condition4 = heu_net.dependency_matrix[n1][n2] >= dependency_thresh
-            condition = condition1 and condition2 and condition3 and condition4
-            if condition:
-                if n1 not in heu_net.nodes:
-                    heu_net.nodes[n1] = Node(heu_net, n1, heu_net.activities_occurrences[n1],
-                                             is_start_node=(n1 in heu_net.start_activities),
-                                             is_end_node=(n1 in heu_net.end_activities),
-                                             default_edges_color=heu_net.default_edges_color[0],
-                                             node_type=heu_net.node_type, net_name=heu_net.net_name[0],
-                                             nodes_dictionary=heu_net.nodes)
-                if n2 not in heu_net.nodes:
-                    heu_net.nodes[n2] = Node(heu_net, n2, heu_net.activities_occurrences[n2],
-                                             is_start_node=(n2 in heu_net.start_activities),
-                                             is_end_node=(n2 in heu_net.end_activities),
-                                             default_edges_color=heu_net.default_edges_color[0],
-                                             node_type=heu_net.node_type, net_name=heu_net.net_name[0],
-                                             nodes_dictionary=heu_net.nodes)
-
-                repr_value = heu_net.performance_matrix[n1][n2]
-                heu_net.nodes[n1].add_output_connection(heu_net.nodes[n2], heu_net.dependency_matrix[n1][n2],
-                                                        heu_net.dfg_matrix[n1][n2], repr_value=repr_value)
-                heu_net.nodes[n2].add_input_connection(heu_net.nodes[n1], heu_net.dependency_matrix[n1][n2],
-                                                       heu_net.dfg_matrix[n1][n2], repr_value=repr_value)
+        heu_net.dfg_matrix[act1][act2] = dfg_values[i]
+        heu_net.performance_matrix[act1][act2] = perf_values[i]
+        heu_net.dependency_matrix[act1][act2] = dependencies_list[i]
+
+    # couples of activities satisfying the thresholds, in the order of the dependency matrix
+    # (by first occurrence of the source activity in the DFG, then in the order of the DFG)
+    frequent = np.zeros(num_codes, dtype=bool)
+    for act, code in codes.items():
+        frequent[code] = act in heu_net.activities_occurrences and heu_net.activities_occurrences[
+            act] >= min_act_count
+    condition = frequent[sources] & frequent[targets] & (counts >= min_dfg_occurrences) & (
+            dependencies >= dependency_thresh)
+    first_positions = np.full(num_codes, len(dfg_keys), dtype=np.int64)
+    np.minimum.at(first_positions, sources, np.arange(len(dfg_keys)))
+    order = np.lexsort((np.arange(len(dfg_keys)), first_positions[sources]))
+    for i in order[condition[order]].tolist():
+        n1 = dfg_keys[i][0]
+        n2 = dfg_keys[i][1]
+        if n1 not in heu_net.nodes:
+            heu_net.nodes[n1] = Node(heu_net, n1, heu_net.activities_occurrences[n1],
+                                     is_start_node=(n1 in heu_net.start_activities),
+                                     is_end_node=(n1 in heu_net.end_activities),
+                                     default_edges_color=heu_net.default_edges_color[0],
+                                     node_type=heu_net.node_type, net_name=heu_net.net_name[0],
+                                     nodes_dictionary=heu_net.nodes)
+        if n2 not in heu_net.nodes:
+            heu_net.nodes[n2] = Node(heu_net, n2, heu_net.activities_occurrences[n2],
+                                     is_start_node=(n2 in heu_net.start_activities),
+                                     is_end_node=(n2 in heu_net.end_activities),
+                                     default_edges_color=heu_net.default_edges_color[0],
+                                     node_type=heu_net.node_type, net_name=heu_net.net_name[0],
+                                     nodes_dictionary=heu_net.nodes)
+
+        repr_value = perf_values[i]
+        heu_net.nodes[n1].add_output_connection(heu_net.nodes[n2], dependencies_list[i], dfg_values[i],
+                                                repr_value=repr_value)
+        heu_net.nodes[n2].add_input_connection(heu_net.nodes[n1], dependencies_list[i], dfg_values[i],
+                                               repr_value=repr_value)
+
+    # loops of length two measure of the couples of the frequency triples matrix
+    loops_values = loops_counts + triples_lookup(loops_targets * num_codes + loops_sources)
+    loops_selected = (loops_values / (loops_values + 1) >= loops_length_two_thresh).tolist()
+    loops_dfg_counts = dfg_lookup(loops_sources * num_codes + loops_targets).tolist()
+
     for node in heu_net.nodes:
-        heu_net.nodes[node].calculate_and_measure_out(and_measure_thresh=and_measure_thresh)
-        heu_net.nodes[node].calculate_and_measure_in(and_measure_thresh=and_measure_thresh)
-        heu_net.nodes[node].calculate_loops_length_two(heu_net.dfg_matrix, heu_net.freq_triples_matrix,
-                                                       loops_length_two_thresh=loops_length_two_thresh)
+        code = codes[node]
+        __calculate_and_measures(heu_net.nodes[node], code, codes, num_codes, dfg_lookup, and_measure_thresh)
+    for i, el in enumerate(loops):
+        if loops_selected[i] and el[0] in heu_net.nodes:
+            heu_net.nodes[el[0]].loop_length_two[el[1]] = loops_dfg_counts[i]
     nodes = list(heu_net.nodes.keys())
     added_loops = set()
     for n1 in nodes:
@@ -533,3 +611,52 @@ def calculate(heu_net, dependency_thresh=defaults.DEFAULT_DEPENDENCY_THRESH,
                                       nodes_dictionary=heu_net.nodes)
 
     return heu_net
+
+
+def __get_lookup(keys: np.ndarray, values: np.ndarray):
+    """
+    Gets a function returning the values associated to the given keys (0 for the keys that are not present)
+    """
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+
+    def lookup(query: np.ndarray) -> np.ndarray:
+        if len(keys) == 0:
+            return np.zeros(np.shape(query), dtype=values.dtype)
+        positions = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+        return np.where(keys[positions] == query, values[positions], 0)
+
+    return lookup
+
+
+def __get_and_measures(names: List[Any], code: int, codes: Dict[Any, int], num_codes: int, dfg_lookup,
+                       and_measure_thresh: float, outgoing: bool) -> Dict[Any, Dict[Any, float]]:
+    """
+    Calculates the AND measure of the couples of output (input) nodes of a node, sorted by name
+    """
+    names = sorted(names)
+    other = np.array([codes[n] for n in names], dtype=np.int64)
+    # directly-follows counts between the nodes, and between the node and the other nodes
+    between = dfg_lookup(other.reshape(-1, 1) * num_codes + other.reshape(1, -1))
+    with_node = dfg_lookup(code * num_codes + other) if outgoing else dfg_lookup(other * num_codes + code)
+    values = (between + between.T) / (with_node.reshape(-1, 1) + with_node.reshape(1, -1) + 1)
+    rows, cols = np.triu_indices(len(names), 1)
+    selected = values[rows, cols] >= and_measure_thresh
+    and_measures = {}
+    for i, j, value in zip(rows[selected].tolist(), cols[selected].tolist(), values[rows, cols][selected].tolist()):
+        if names[i] not in and_measures:
+            and_measures[names[i]] = {}
+        and_measures[names[i]][names[j]] = value
+    return and_measures
+
+
+def __calculate_and_measures(node: Node, code: int, codes: Dict[Any, int], num_codes: int, dfg_lookup,
+                             and_measure_thresh: float):
+    """
+    Calculates the AND measures of the output and of the input relations of a node
+    (as Node.calculate_and_measure_out and Node.calculate_and_measure_in, on the arrays of the DFG)
+    """
+    node.and_measures_out = __get_and_measures([n.node_name for n in node.output_connections], code, codes,
+                                               num_codes, dfg_lookup, and_measure_thresh, True)
+    node.and_measures_in = __get_and_measures([n.node_name for n in node.input_connections], code, codes,
+                                              num_codes, dfg_lookup, and_measure_thresh, False)
@@ -15,7 +15,8 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from abc import ABC
-from typing import TypeVar, Generic, Optional
+from collections import Counter
+from typing import TypeVar, Generic, Optional, Collection, Any, Dict, List, Tuple
 
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 from pm4py.objects.dfg.obj import DFG
@@ -58,15 +59,93 @@ class IMDataStructureUVCL(IMDataStructureLog[UVCL]):
 
     def __init__(self, obj: UVCL, dfg: Optional[DFG] = None):
         super().__init__(obj)
+        # the projections can derive their DFG from the DFG of the log only if it has been discovered from the log
+        # (and not, for example, filtered)
+        self._dfg_of_log = dfg is None
         if dfg is None:
             self._dfg = comut.discover_dfg_uvcl(self._obj)
         else:
             self._dfg = dfg
+        self._variants = None
+        self._positions = None
+        self._variants_index = None
 
     @property
     def dfg(self) -> DFG:
         return self._dfg
 
+    def project_activities(self, removed: Collection[Any]) -> 'IMDataStructureUVCL':
+        """
+        Gets the data structure of the log in which the given activities are removed from the variants.
+        The DFG of the projected log is derived from the DFG of this log: only the variants containing the removed
+        activities (and the variants they are merged with) are visited.
+        When different variants are mapped to the same projected variant, the projected variant gets the count
+        of the last one (in the order of the log).
+
+        Parameters
+        ---------------
+        removed
+            Activities to remove
+
+        Returns
+        ---------------
+        projected
+            Data structure of the projected log
+        """
+        removed = set(removed)
+        log = self._obj
+        if not self._dfg_of_log:
+            projected = Counter()
+            for t in log:
+                projected[tuple(e for e in t if e not in removed)] = log[t]
+            return IMDataStructureUVCL(projected)
+
+        variants, positions, index = self.__get_variants_index()
+        affected = sorted(set(i for a in removed for i in index.get(a, [])))
+        projected = Counter(log)
+        graph = Counter(self._dfg.graph)
+        start_activities = Counter(self._dfg.start_activities)
+        end_activities = Counter(self._dfg.end_activities)
+        # last variant (position and count) mapped to every projected variant
+        last = {}
+        for i in affected:
+            t = variants[i]
+            self.__update_dfg(graph, start_activities, end_activities, t, -log[t])
+            del projected[t]
+            last[tuple(e for e in t if e not in removed)] = (i, log[t])
+        for t, (i, n) in last.items():
+            if t in log:
+                # the projected variant is also a variant of the log (not containing the removed activities)
+                if positions[t] > i:
+                    continue
+                self.__update_dfg(graph, start_activities, end_activities, t, -log[t])
+            self.__update_dfg(graph, start_activities, end_activities, t, n)
+            projected[t] = n
+        return IMDataStructureUVCL(projected, DFG(+graph, +start_activities, +end_activities))
+
+    def __get_variants_index(self) -> Tuple[List[Tuple[Any, ...]], Dict[Tuple[Any, ...], int], Dict[Any, List[int]]]:
+        """
+        Gets the variants of the log, their positions, and the positions of the variants containing every activity
+        """
+        if self._variants_index is None:
+            self._variants = list(self._obj)
+            self._positions = {t: i for i, t in enumerate(self._variants)}
+            self._variants_index = {}
+            for i, t in enumerate(self._variants):
+                for a in set(t):
+                    if a not in self._variants_index:
+                        self._variants_index[a] = []
+                    self._variants_index[a].append(i)
+        return self._variants, self._positions, self._variants_index
+
+    @staticmethod
+    def __update_dfg(graph: Counter, start_activities: Counter, end_activities: Counter, t: Tuple[Any, ...], n: int):
+        if len(t) > 0:
+            for i in range(0, len(t) - 1):
+                graph[(t[i], t[i + 1])] += n
+            start_activities[t[0]] += n
+            end_activities[t[len(t) - 1]] += n
+
 
 class IMDataStructureDFG(IMDataStructure[InductiveDFG]):
     """
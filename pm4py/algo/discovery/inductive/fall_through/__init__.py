@@ -14,5 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.discovery.inductive.fall_through import abc, activity_concurrent, activity_once_per_trace, empty_traces, \
-    flower, strict_tau_loop, tau_loop
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "abc", "activity_concurrent", "activity_once_per_trace", "empty_traces", "flower", "strict_tau_loop",
+    "tau_loop"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -16,7 +16,7 @@
 '''
 from collections import Counter
 from multiprocessing import Pool, Queue, Manager, Event
-from typing import Optional, Tuple, List, Any, Dict
+from typing import Optional, Tuple, List, Any, Dict, Collection
 
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
 from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
@@ -35,13 +35,13 @@ class Parameters(Enum):
 
 class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
     MULTI_PROCESSING_LOWER_BOUND = 20
+    # minimum work (number of candidates times the number of events of the variants) to evaluate
+    # the candidates in parallel: for smaller logs, the cost of sharing the log with the pool is not recovered
+    MULTI_PROCESSING_MIN_WORK = 100000
 
     @classmethod
-    def _process_candidate(cls, c: Any, log: UVCL, queue: Queue = None, ev: Event = None, parameters: Optional[Dict[str, Any]] = None):
-        l_alt = Counter()
-        for t in log:
-            l_alt[tuple(filter(lambda e: e != c, t))] = log[t]
-        cut = cls._find_cut(IMDataStructureUVCL(l_alt), ev, parameters=parameters)
+    def _process_candidate(cls, c: Any, obj: IMDataStructureUVCL, queue: Queue = None, ev: Event = None, parameters: Optional[Dict[str, Any]] = None):
+        cut = cls._find_cut(obj.project_activities([c]), ev, parameters=parameters)
         if queue is not None:
             queue.put((c, cut))
         return cut if cut is not None else None
@@ -55,20 +55,21 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
 
         log = obj.data_structure
         candidates = comut.get_alphabet(log)
-        if pool is None or manager is None or not enable_multiprocessing or len(candidates) <= ActivityConcurrentUVCL.MULTI_PROCESSING_LOWER_BOUND:
+        if pool is None or manager is None or not enable_multiprocessing or len(candidates) <= ActivityConcurrentUVCL.MULTI_PROCESSING_LOWER_BOUND \
+                or len(candidates) * sum(len(t) for t in log) < ActivityConcurrentUVCL.MULTI_PROCESSING_MIN_WORK:
             for a in candidates:
-                cut = cls._process_candidate(a, log, parameters=parameters)
+                cut = cls._process_candidate(a, obj, parameters=parameters)
                 if cut is not None:
                     return a
         else:
             q = manager.Queue()
             ev = manager.Event()
-            # avoid dangerous freealloc from Python's garbage collector
-            manager.support_list.append(q)
-            manager.support_list.append(ev)
+            # avoid dangerous freealloc from Python's garbage collector: the queue and the event are kept alive
+            # until all the tasks using them are completed (the manager is shared by the executions of the miner)
+            manager.support_list[:] = [x for x in manager.support_list if not all(r.ready() for r in x[2])]
 
-            for a in candidates:
-                pool.apply_async(cls._process_candidate, (a, log, q, ev, parameters))
+            results = [pool.apply_async(cls._process_candidate, (a, obj, q, ev, parameters)) for a in candidates]
+            manager.support_list.append((q, ev, results))
             potentials = set(candidates)
             while len(potentials) > 0:
                 (c, cut) = q.get(block=True)
@@ -81,11 +82,12 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
         return None
 
     @classmethod
-    def _find_cut(cls, obj: IMDataStructureUVCL, ev: Event, parameters: Optional[Dict[str, Any]] = None) -> Optional[Tuple[ProcessTree, List[IMDataStructureUVCL]]]:
+    def _find_cut(cls, obj: IMDataStructureUVCL, ev: Event, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
+        # only the existence of the cut is needed, hence the log is not projected on the groups of the cut
         for c in CutFactory.get_cuts(obj, IMInstance.IM, parameters=parameters):
             if ev is not None and ev.is_set():
                 return None
-            r = c.apply(obj, parameters)
+            r = c.holds(obj, parameters)
             if r is not None:
                 return r
         return None
@@ -0,0 +1,119 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Process pool (and manager) shared by the executions of the inductive miner.
+The pool and the manager are created lazily, when the first parallel task is submitted, and are reused by the
+following executions, until shutdown() is called (at the latest, at the exit of the interpreter).
+"""
+
+import atexit
+import os
+from multiprocessing import Pool, Manager
+from threading import Lock
+from typing import Optional
+
+_lock = Lock()
+_pool = None
+# number of worker processes of the pool, when it has been created
+_pool_size = None
+_manager = None
+_max_workers = None
+
+
+def get_max_workers() -> int:
+    """
+    Gets the number of worker processes of the pool (by default, the number of CPUs minus one, at least one)
+    """
+    if _max_workers is not None:
+        return _max_workers
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def set_max_workers(max_workers: Optional[int]):
+    """
+    Sets the number of worker processes of the pool (None: default). If the pool has already been created
+    with a different size, it is shut down, and it is created again at the next request
+
+    Parameters
+    ---------------
+    max_workers
+        Number of worker processes
+    """
+    global _max_workers
+    with _lock:
+        _max_workers = max(1, max_workers) if max_workers is not None else None
+        if _pool is not None and _pool_size != get_max_workers():
+            __shutdown_pool()
+
+
+def get_pool() -> Pool:
+    """
+    Gets the shared process pool, creating it if needed
+
+    Returns
+    ---------------
+    pool
+        Process pool
+    """
+    global _pool, _pool_size
+    with _lock:
+        if _pool is None:
+            _pool_size = get_max_workers()
+            _pool = Pool(_pool_size)
+        return _pool
+
+
+def get_manager() -> Manager:
+    """
+    Gets the shared manager (used to share queues and events with the tasks of the pool), creating it if needed
+
+    Returns
+    ---------------
+    manager
+        Manager
+    """
+    global _manager
+    with _lock:
+        if _manager is None:
+            _manager = Manager()
+            # objects (with the asynchronous results of the tasks using them) kept alive while the tasks are running
+            _manager.support_list = []
+        return _manager
+
+
+def shutdown():
+    """
+    Shuts down the shared pool and manager (they are created again at the next request)
+    """
+    global _manager
+    with _lock:
+        __shutdown_pool()
+        if _manager is not None:
+            _manager.shutdown()
+            _manager = None
+
+
+def __shutdown_pool():
+    global _pool, _pool_size
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+        _pool_size = None
+
+
+atexit.register(shutdown)
@@ -14,14 +14,14 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-import os
 from abc import abstractmethod, ABC
-from multiprocessing import Pool, Manager
+from copy import copy
 from typing import Optional, Tuple, List, TypeVar, Generic, Dict, Any
 
+from pm4py.algo.discovery.inductive import pool
 from pm4py.algo.discovery.inductive.base_case.factory import BaseCaseFactory
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL
 from pm4py.algo.discovery.inductive.fall_through.factory import FallThroughFactory
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.algo.discovery.inductive.visualization.process_tree_node import ProcessTreeNode
@@ -35,6 +35,18 @@ T = TypeVar('T', bound=IMDataStructure)
 
 class Parameters(Enum):
     MULTIPROCESSING = "multiprocessing"
+    PARALLEL_RECURSION = "parallel_recursion"
+    PARALLEL_RECURSION_MIN_SIZE = "parallel_recursion_min_size"
+
+
+def _apply_on_sub_log(miner_class, obj: T, parameters: Optional[Dict[str, Any]] = None) -> ProcessTree:
+    """
+    Applies the inductive miner on a sub-log in a worker process of the pool (sequentially)
+    """
+    parameters = copy(parameters) if parameters is not None else {}
+    parameters[Parameters.MULTIPROCESSING] = False
+    parameters[Parameters.PARALLEL_RECURSION] = False
+    return miner_class(parameters).apply(obj, parameters=parameters)
 
 
 class InductiveMinerFramework(ABC, Generic[T]):
@@ -48,18 +60,26 @@ class InductiveMinerFramework(ABC, Generic[T]):
     """
 
     def __init__(self, parameters: Optional[Dict[str, Any]] = None):
+        """
+        Parameters
+        ---------------
+        parameters
+            Parameters of the algorithm, including:
+            - Parameters.MULTIPROCESSING => evaluates the candidates of the activity-concurrent fall-through
+            in parallel
+            - Parameters.PARALLEL_RECURSION => mines the sub-logs returned by the cuts and the fall-throughs
+            in parallel (the discovered tree is the same as in the sequential mode)
+            - Parameters.PARALLEL_RECURSION_MIN_SIZE => minimum size (number of events, or number of arcs of the DFG)
+            of a sub-log to be mined in a worker process (default: 10000); smaller sub-logs are mined locally
+        """
         if parameters is None:
             parameters = {}
 
-        enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
-
-        if enable_multiprocessing:
-            self._pool = Pool(os.cpu_count() - 1)
-            self._manager = Manager()
-            self._manager.support_list = []
-        else:
-            self._pool = None
-            self._manager = None
+        # the processes are taken from the pool shared by the executions of the inductive miner
+        # (see pm4py.algo.discovery.inductive.pool), that is created only when the first parallel task is submitted
+        self._multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
+        self._parallel_recursion = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION, parameters, False)
+        self._parallel_recursion_min_size = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION_MIN_SIZE, parameters, 10000)
         
         self.tree_nodes_ls = [] # this line (& the next) is custom made for the Im-viz application
         self.node_id_counter = 0
@@ -71,7 +91,9 @@ class InductiveMinerFramework(ABC, Generic[T]):
         return CutFactory.find_cut(obj, self.instance(), parameters=parameters)
 
     def fall_through(self, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Tuple[ProcessTree, List[T]]:
-        return FallThroughFactory.fall_through(obj, self.instance(), self._pool, self._manager, parameters=parameters)
+        if self._multiprocessing:
+            return FallThroughFactory.fall_through(obj, self.instance(), pool.get_pool(), pool.get_manager(), parameters=parameters)
+        return FallThroughFactory.fall_through(obj, self.instance(), None, None, parameters=parameters)
 
     def apply(self, obj: T, parameters: Optional[Dict[str, Any]] = None) -> ProcessTree:
         tree = self.apply_base_cases(obj, parameters)
@@ -85,12 +107,43 @@ class InductiveMinerFramework(ABC, Generic[T]):
         return tree
 
     def _recurse(self, tree: ProcessTree, objs: List[T], parameters: Optional[Dict[str, Any]] = None):
-        children = [self.apply(obj, parameters=parameters) for obj in objs]
+        if self._parallel_recursion and len(objs) > 1:
+            children = self._recurse_parallel(objs, parameters=parameters)
+        else:
+            children = [self.apply(obj, parameters=parameters) for obj in objs]
         for c in children:
             c.parent = tree
         tree.children.extend(children)
         return tree
 
+    def _recurse_parallel(self, objs: List[T], parameters: Optional[Dict[str, Any]] = None) -> List[ProcessTree]:
+        """
+        Mines the sub-logs in parallel. The sub-logs reaching the minimum size are submitted to the pool,
+        except the biggest one, that is mined locally (so its own sub-logs can be submitted to the pool as well);
+        the smaller sub-logs are mined locally.
+        """
+        sizes = [self._sub_log_size(obj) for obj in objs]
+        biggest = max(range(len(objs)), key=lambda i: sizes[i])
+        async_results = {}
+        for i, obj in enumerate(objs):
+            if i != biggest and sizes[i] >= self._parallel_recursion_min_size:
+                async_results[i] = pool.get_pool().apply_async(_apply_on_sub_log, (type(self), obj, parameters))
+        children = [None] * len(objs)
+        for i, obj in enumerate(objs):
+            if i not in async_results:
+                children[i] = self.apply(obj, parameters=parameters)
+        for i, async_result in async_results.items():
+            children[i] = async_result.get()
+        return children
+
+    def _sub_log_size(self, obj: T) -> int:
+        """
+        Estimates the work needed to mine a sub-log (number of events, or number of arcs of the DFG)
+        """
+        if isinstance(obj, IMDataStructureUVCL):
+            return sum(len(t) * n for t, n in obj.data_structure.items())
+        return len(obj.dfg.graph)
+
     @abstractmethod
     def instance(self) -> IMInstance:
         pass
@@ -14,8 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.discovery.temporal_profile.variants import log
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["log"]
 
 if pkgutil.find_loader("pandas"):
-    from pm4py.algo.discovery.temporal_profile.variants import dataframe
+    _submodules.append("dataframe")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
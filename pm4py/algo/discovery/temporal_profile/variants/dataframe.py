@@ -19,7 +19,7 @@ from typing import Optional, Dict, Any
 
 import pandas as pd
 
-from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
+from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_aggregates
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
 
@@ -72,15 +72,12 @@ def apply(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> typi
 
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
-    efg = get_partial_order_dataframe(df, activity_key=activity_key, timestamp_key=timestamp_key,
-                                      start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
-                                      keep_first_following=False, business_hours=business_hours, business_hours_slot=business_hours_slots, workcalendar=workcalendar)
-    efg = efg[[activity_key, activity_key + "_2", "@@flow_time"]]
-    temporal_profile = efg.groupby([activity_key, activity_key + "_2"]).agg(["mean", "std"]).reset_index().fillna(
-        0).to_dict("records")
+    aggregates = get_partial_order_aggregates(df, activity_key=activity_key, timestamp_key=timestamp_key,
+                                              start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
+                                              keep_first_following=False, business_hours=business_hours,
+                                              business_hours_slot=business_hours_slots, workcalendar=workcalendar)
 
-    temporal_profile = {
-        (x[(activity_key, "")], x[(activity_key + "_2", "")]): (x[("@@flow_time", "mean")], x[("@@flow_time", "std")])
-        for x in temporal_profile}
+    # the standard deviation of the couples of activities happening once is set to 0
+    temporal_profile = {x: (y["mean"], y["stdev"] if y["count"] > 1 else 0.0) for x, y in aggregates.items()}
 
     return temporal_profile
@@ -584,9 +584,12 @@ def clean_dfg_based_on_noise_thresh(dfg, activities, noise_threshold, parameters
         most_common_paths = []
 
     new_dfg = None
+    # maximum count of an ingoing/outgoing edge of every activity (the edges are grouped once)
+    ingoing = dfg_utils.get_ingoing_edges(dfg)
+    outgoing = dfg_utils.get_outgoing_edges(dfg)
     activ_max_count = {}
     for act in activities:
-        activ_max_count[act] = dfg_utils.get_max_activity_count(dfg, act)
+        activ_max_count[act] = max([-1] + list(ingoing.get(act, {}).values()) + list(outgoing.get(act, {}).values()))
 
     for el in dfg:
         if type(el[0]) is str:
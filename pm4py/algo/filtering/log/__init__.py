@@ -14,6 +14,10 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.util.lazy_loading import lazy_submodules
 
-from pm4py.algo.filtering.log import attributes, end_activities, paths, \
-    cases, start_activities, timestamp, variants, ltl
+_submodules = [
+    "attributes", "end_activities", "paths", "cases", "start_activities", "timestamp", "variants", "ltl"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
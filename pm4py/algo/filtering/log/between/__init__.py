@@ -14,4 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.filtering.log.between import between_filter
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["between_filter"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
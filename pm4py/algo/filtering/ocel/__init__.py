@@ -14,4 +14,10 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.filtering.ocel import event_attributes, object_attributes, activity_type_matching, objects_ot_count, ot_endpoints
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "event_attributes", "object_attributes", "activity_type_matching", "objects_ot_count", "ot_endpoints"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,5 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.filtering.pandas import start_activities, end_activities, attributes, cases, \
-    pd_filtering_constants, variants, paths, timestamp, ltl
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "start_activities", "end_activities", "attributes", "cases", "pd_filtering_constants", "variants",
+    "paths", "timestamp", "ltl"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
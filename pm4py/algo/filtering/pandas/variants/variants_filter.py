@@ -19,11 +19,13 @@ from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.statistics.traces.generic.pandas import case_statistics
 from pm4py.statistics.traces.generic.pandas.case_statistics import get_variants_df
 from pm4py.statistics.variants.pandas import get as variants_get
+from pm4py.objects.log.util import log_index
 from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY, PARAMETER_CONSTANT_ACTIVITY_KEY
 from enum import Enum
 from pm4py.util import exec_utils
 from copy import copy
 from typing import Optional, Dict, Any, Union, Tuple, List
+import numpy as np
 import pandas as pd
 
 
@@ -62,6 +64,16 @@ def apply(df: pd.DataFrame, admitted_variants: List[List[str]], parameters: Opti
 
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+    index = log_index.get(df, parameters=parameters) if "variants_df" not in parameters else None
+    if index is not None and index.rows_in_order:
+        # the rows are selected through the variant of their case in the index attached to the dataframe
+        case_variants, variants = index.get_variants()
+        admitted = pd.Series(variants, dtype=object).isin(admitted_variants).to_numpy()
+        mask = np.append(admitted[case_variants], False)[index.row_case_codes]
+        ret = df[mask] if positive else df[~mask]
+        ret.attrs = copy(df.attrs) if hasattr(df, 'attrs') else {}
+        return ret
+
     variants_df = parameters["variants_df"] if "variants_df" in parameters else get_variants_df(df,
                                                                                                 parameters=parameters)
     variants_df = variants_df[variants_df["variant"].isin(admitted_variants)]
@@ -14,5 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.util.lazy_loading import lazy_submodules
 
-from pm4py.algo.organizational_mining import util, local_diagnostics, resource_profiles, roles, sna, network_analysis
+_submodules = ["util", "local_diagnostics", "resource_profiles", "roles", "sna", "network_analysis"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
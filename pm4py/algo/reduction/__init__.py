@@ -14,8 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.reduction import process_tree
-
 import warnings
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["process_tree"]
 
 warnings.warn("The reduction package will be removed in a future release.")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,8 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.simulation import playout
-
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["playout"]
+
 if pkgutil.find_loader("tree_generator"):
-    from pm4py.algo.simulation import tree_generator
+    _submodules.append("tree_generator")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
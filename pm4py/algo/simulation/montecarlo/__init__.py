@@ -14,9 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-
-from pm4py.algo.simulation.montecarlo import algorithm, variants, utils
-
 import warnings
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["algorithm", "variants", "utils"]
 
 warnings.warn("The simulation.montecarlo package will be removed in a future release.")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -15,7 +15,7 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from pm4py.algo.simulation.montecarlo.variants import petri_semaph_fifo
+from pm4py.algo.simulation.montecarlo.variants import petri_semaph_fifo, petri_discrete_event
 from pm4py.util import exec_utils
 from enum import Enum
 from typing import Optional, Dict, Any, Union, Tuple
@@ -27,11 +27,12 @@ from pm4py.objects.conversion.log import converter as log_converter
 
 class Variants(Enum):
     PETRI_SEMAPH_FIFO = petri_semaph_fifo
+    PETRI_DISCRETE_EVENT = petri_discrete_event
 
 
 DEFAULT_VARIANT = Variants.PETRI_SEMAPH_FIFO
 
-VERSIONS = {Variants.PETRI_SEMAPH_FIFO}
+VERSIONS = {Variants.PETRI_SEMAPH_FIFO, Variants.PETRI_DISCRETE_EVENT}
 
 
 def apply(log: Union[EventLog, pd.DataFrame], net: PetriNet, im: Marking, fm: Marking, variant=DEFAULT_VARIANT, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[EventLog, Dict[str, Any]]:
@@ -52,6 +53,7 @@ def apply(log: Union[EventLog, pd.DataFrame], net: PetriNet, im: Marking, fm: Ma
     variant
         Variant of the algorithm to use:
         - Variants.PETRI_SEMAPH_FIFO
+        - Variants.PETRI_DISCRETE_EVENT (discrete-event scheduler on a simulated clock, reproducible with a seed)
     parameters
         Parameters of the algorithm:
             Parameters.PARAM_NUM_SIMULATIONS => (default: 100)
@@ -0,0 +1,535 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+import heapq
+import logging
+import os
+from collections import deque
+from copy import copy
+from enum import Enum
+from statistics import median
+from time import time
+from typing import Optional, Dict, Any, Union, Tuple, List
+
+import numpy as np
+
+from pm4py.algo.simulation.montecarlo.utils import replay
+from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.statistics.traces.generic.log import case_arrival
+from pm4py.util import constants
+from pm4py.util import exec_utils
+from pm4py.util import xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    TOKEN_REPLAY_VARIANT = "token_replay_variant"
+    PARAM_NUM_SIMULATIONS = "num_simulations"
+    PARAM_FORCE_DISTRIBUTION = "force_distribution"
+    PARAM_ENABLE_DIAGNOSTICS = "enable_diagnostics"
+    PARAM_CASE_ARRIVAL_RATIO = "case_arrival_ratio"
+    PARAM_PROVIDED_SMAP = "provided_stochastic_map"
+    PARAM_MAP_RESOURCES_PER_PLACE = "map_resources_per_place"
+    PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE = "default_num_resources_per_place"
+    PARAM_MAX_STEPS_PER_CASE = "max_steps_per_case"
+    PARAM_SEED = "seed"
+    PARAM_MAX_WORKERS = "max_workers"
+
+
+class Outputs(Enum):
+    OUTPUT_PLACES_INTERVAL_TREES = "places_interval_trees"
+    OUTPUT_TRANSITIONS_INTERVAL_TREES = "transitions_interval_trees"
+    OUTPUT_CASES_EX_TIME = "cases_ex_time"
+    OUTPUT_MEDIAN_CASES_EX_TIME = "median_cases_ex_time"
+    OUTPUT_CASE_ARRIVAL_RATIO = "input_case_arrival_ratio"
+    OUTPUT_TOTAL_CASES_TIME = "total_cases_time"
+
+
+# kinds of the events of the simulation (at the same simulated time, they are processed in order of scheduling)
+_ARRIVAL = 0
+_STEP = 1
+_ACQUIRE = 2
+_FIRE = 3
+
+
+class _Case(object):
+    def __init__(self, id: int, marking: Marking):
+        self.id = id
+        self.marking = marking
+        self.trace = Trace()
+        self.steps = 0
+        # times in which the tokens of the case entered the places
+        self.entered = {}
+        # units of the resources of the places acquired by the case
+        self.held = []
+        # transition being fired, with its sampled execution time, the time of the request and the output arcs
+        # for which the resources still need to be acquired
+        self.transition = None
+        self.duration = 0.0
+        self.request_time = 0.0
+        self.pending_arcs = None
+        # place for which the case is waiting in the queue
+        self.waiting_for = None
+        self.terminated_correctly = False
+
+
+class DiscreteEventSimulator(object):
+    def __init__(self, net: PetriNet, im: Marking, fm: Marking, smap, resources_per_places: Dict[Any, int],
+                 default_num_resources_per_places: int, max_steps_per_case: int):
+        """
+        Simulates the cases on the accepting Petri net with a single-threaded discrete-event scheduler.
+        Every place is a resource with a given number of units: a token in a place occupies a unit, and a transition
+        can fire only after acquiring a unit of each of its output places (waiting in a FIFO queue when no unit is
+        available). The firing of a transition completes after its (sampled) execution time, or when the
+        resources have been acquired if the waiting was longer, releasing the units of its input places.
+        When a case would wait forever (all the cases holding the units of the place are waiting, directly or
+        indirectly, for units held by waiting cases), it acquires the unit beyond the capacity of the place.
+
+        Parameters
+        -------------
+        net
+            Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+        im
+            Initial marking
+        fm
+            Final marking
+        smap
+            Stochastic map
+        resources_per_places
+            Number of resources available per place
+        default_num_resources_per_places
+            Default number of resources per place when not specified
+        max_steps_per_case
+            Maximum number of transitions fired by a case (the case is discarded when it is exceeded)
+        """
+        self.net = net
+        self.im = im
+        self.fm = fm
+        self.smap = smap
+        self.source = list(im)[0]
+        self.max_steps_per_case = max_steps_per_case
+        self.available = {p: resources_per_places[p] if p in resources_per_places else default_num_resources_per_places
+                          for p in net.places}
+        self.queues = {p: deque() for p in net.places}
+        self.holders = {p: [] for p in net.places}
+        # the enabled transitions are sorted, so that the simulation only depends on the seed of the random generator
+        self.transitions_order = {t: i for i, t in enumerate(
+            sorted(net.transitions, key=lambda t: (t.label is None, str(t.label), str(t.name))))}
+        self.places_intervals = {p: [] for p in net.places}
+        self.transitions_intervals = {t: [] for t in net.transitions}
+        self.cases = []
+        self._events = []
+        self._seq = 0
+
+    def schedule(self, timestamp: float, kind: int, case: _Case):
+        heapq.heappush(self._events, (timestamp, self._seq, kind, case))
+        self._seq += 1
+
+    def run(self, no_simulations: int, start_time: float, case_arrival_ratio: float) -> List[_Case]:
+        """
+        Simulates the given number of cases, arriving at regular intervals
+
+        Returns
+        -------------
+        cases
+            Simulated cases (in order of arrival)
+        """
+        for i in range(no_simulations):
+            case = _Case(i, self.im)
+            self.cases.append(case)
+            self.schedule(start_time + i * case_arrival_ratio, _ARRIVAL, case)
+
+        while self._events:
+            timestamp, seq, kind, case = heapq.heappop(self._events)
+            if kind == _ARRIVAL:
+                self.__arrival(case, timestamp)
+            elif kind == _STEP:
+                self.__step(case, timestamp)
+            elif kind == _ACQUIRE:
+                self.__acquire(case, timestamp)
+            else:
+                self.__fire(case, timestamp)
+
+        return self.cases
+
+    def __arrival(self, case: _Case, timestamp: float):
+        if self.available[self.source] > 0 or self.__is_deadlocked(case, self.source):
+            self.__take(case, self.source)
+            case.entered[self.source] = [timestamp]
+            self.schedule(timestamp, _STEP, case)
+        else:
+            case.pending_arcs = None
+            case.waiting_for = self.source
+            self.queues[self.source].append(case)
+
+    def __enabled_transitions(self, marking: Marking) -> List[PetriNet.Transition]:
+        candidates = {a.target for p in marking for a in p.out_arcs}
+        enabled = [t for t in candidates if all(marking[a.source] >= a.weight for a in t.in_arcs)]
+        return sorted(enabled, key=lambda t: self.transitions_order[t])
+
+    def __pick_transition(self, et: List[PetriNet.Transition]) -> PetriNet.Transition:
+        # chooses a transition according to the weights of the stochastic map (as stochastic_utils.pick_transition)
+        if len(et) == 1:
+            return et[0]
+        weights = [self.smap[t].get_weight() if t in self.smap else 1.0 for t in et]
+        total = sum(weights)
+        if total == 0:
+            weights = [1.0] * len(et)
+            total = float(len(et))
+        r = np.random.random_sample() * total
+        for t, w in zip(et, weights):
+            r -= w
+            if r < 0:
+                return t
+        return et[-1]
+
+    def __step(self, case: _Case, timestamp: float):
+        if self.fm <= case.marking:
+            case.terminated_correctly = True
+            self.__release_all(case, timestamp)
+            return
+        et = self.__enabled_transitions(case.marking)
+        if not et or case.steps >= self.max_steps_per_case:
+            self.__release_all(case, timestamp)
+            return
+        case.steps += 1
+        ct = self.__pick_transition(et)
+        simulated_execution_plus_waiting_time = -1
+        while simulated_execution_plus_waiting_time < 0:
+            simulated_execution_plus_waiting_time = self.smap[ct].get_value() if ct in self.smap else 0.0
+        case.transition = ct
+        case.duration = simulated_execution_plus_waiting_time
+        case.request_time = timestamp
+        case.pending_arcs = deque(ct.out_arcs)
+        self.__acquire(case, timestamp)
+
+    def __acquire(self, case: _Case, timestamp: float):
+        # acquires the resources of the output places, in order, waiting in the queue of the first busy one
+        while case.pending_arcs:
+            place = case.pending_arcs[0].target
+            if self.available[place] <= 0 and not self.__is_deadlocked(case, place):
+                case.waiting_for = place
+                self.queues[place].append(case)
+                return
+            self.__take(case, place)
+            case.pending_arcs.popleft()
+
+        waiting_time = timestamp - case.request_time
+        if waiting_time > 0:
+            self.transitions_intervals[case.transition].append((case.request_time, timestamp))
+        self.schedule(case.request_time + max(case.duration, waiting_time), _FIRE, case)
+
+    def __fire(self, case: _Case, timestamp: float):
+        ct = case.transition
+        marking = copy(case.marking)
+        for arc in ct.in_arcs:
+            marking[arc.source] -= arc.weight
+            if marking[arc.source] <= 0:
+                del marking[arc.source]
+        for arc in ct.out_arcs:
+            marking[arc.target] += arc.weight
+        case.marking = marking
+        if ct.label is not None:
+            case.trace.append(Event({xes_constants.DEFAULT_NAME_KEY: ct.label,
+                                     xes_constants.DEFAULT_TIMESTAMP_KEY: datetime.datetime.fromtimestamp(timestamp)}))
+        for arc in ct.out_arcs:
+            if arc.target not in case.entered:
+                case.entered[arc.target] = []
+            case.entered[arc.target].append(timestamp)
+        for arc in ct.in_arcs:
+            place = arc.source
+            if case.entered.get(place):
+                entered = case.entered[place].pop(0)
+                if timestamp - entered > 0:
+                    self.places_intervals[place].append((entered, timestamp))
+            if place in case.held:
+                self.__release(case, place, timestamp)
+        case.transition = None
+        self.schedule(timestamp, _STEP, case)
+
+    def __take(self, case: _Case, place: PetriNet.Place):
+        self.available[place] -= 1
+        case.held.append(place)
+        self.holders[place].append(case)
+
+    def __is_deadlocked(self, case: _Case, place: PetriNet.Place) -> bool:
+        # checks whether all the cases holding the units of the place are (transitively) waiting
+        seen = {place}
+        stack = [place]
+        while stack:
+            for holder in self.holders[stack.pop()]:
+                if holder is case:
+                    continue
+                if holder.waiting_for is None:
+                    return False
+                if holder.waiting_for not in seen:
+                    seen.add(holder.waiting_for)
+                    stack.append(holder.waiting_for)
+        return True
+
+    def __release(self, case: _Case, place: PetriNet.Place, timestamp: float):
+        case.held.remove(place)
+        self.holders[place].remove(case)
+        if self.queues[place]:
+            # the unit is handed over to the first case waiting for it
+            waiting = self.queues[place].popleft()
+            waiting.waiting_for = None
+            waiting.held.append(place)
+            self.holders[place].append(waiting)
+            if waiting.pending_arcs is None:
+                # case waiting to enter the source place
+                waiting.entered[place] = [timestamp]
+                self.schedule(timestamp, _STEP, waiting)
+            else:
+                waiting.pending_arcs.popleft()
+                self.schedule(timestamp, _ACQUIRE, waiting)
+        else:
+            self.available[place] += 1
+
+    def __release_all(self, case: _Case, timestamp: float):
+        for place in list(case.held):
+            self.__release(case, place, timestamp)
+
+
+def apply(log: EventLog, net: PetriNet, im: Marking, fm: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Tuple[EventLog, Dict[str, Any]]:
+    """
+    Performs a Monte Carlo simulation of an accepting Petri net without duplicate transitions and where the preset is always
+    distinct from the postset, using a discrete-event scheduler on a simulated clock (the cases are simulated by a
+    single thread, without waiting for the simulated times; the places are FIFO resources).
+    The simulation is reproducible when a seed is provided.
+
+    Parameters
+    -------------
+    log
+        Event log
+    net
+        Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm:
+            PARAM_NUM_SIMULATIONS => (default: 100)
+            PARAM_FORCE_DISTRIBUTION => Force a particular stochastic distribution (e.g. normal) when the stochastic map
+            is discovered from the log (default: None; no distribution is forced)
+            PARAM_ENABLE_DIAGNOSTICS => Enable the printing of diagnostics (default: True)
+            PARAM_CASE_ARRIVAL_RATIO => Case arrival of new cases (default: None; inferred from the log)
+            PARAM_PROVIDED_SMAP => Stochastic map that is used in the simulation (default: None; inferred from the log)
+            PARAM_MAP_RESOURCES_PER_PLACE => Specification of the number of resources available per place
+            (default: None; each place gets the default number of resources)
+            PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE => Default number of resources per place when not specified
+            (default: 1; each place gets 1 resource and has to wait for the resource to finish)
+            PARAM_MAX_STEPS_PER_CASE => Maximum number of transitions fired by a case; the cases exceeding it
+            are discarded, as the deadlocked ones (default: 10000)
+            PARAM_SEED => Seed of the NumPy random generator used by the simulation (default: None; the state of the
+            generator is not changed)
+
+    Returns
+    ------------
+    simulated_log
+        Simulated event log
+    simulation_result
+        Result of the simulation:
+            Outputs.OUTPUT_PLACES_INTERVAL_TREES => inteval trees that associate to each place the times in which it was occupied.
+            Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES => interval trees that associate to each transition the intervals of time
+            in which it could not fire because some token was in the output.
+            Outputs.OUTPUT_CASES_EX_TIME => Throughput time of the cases included in the simulated log
+            Outputs.OUTPUT_MEDIAN_CASES_EX_TIME => Median of the throughput times
+            Outputs.OUTPUT_CASE_ARRIVAL_RATIO => Case arrival ratio that was specified in the simulation
+            Outputs.OUTPUT_TOTAL_CASES_TIME => Total time occupied by cases of the simulated log
+    """
+    if parameters is None:
+        parameters = {}
+
+    from intervaltree import IntervalTree, Interval
+
+    no_simulations = exec_utils.get_param_value(Parameters.PARAM_NUM_SIMULATIONS, parameters,
+                                                100)
+    enable_diagnostics = exec_utils.get_param_value(Parameters.PARAM_ENABLE_DIAGNOSTICS, parameters,
+                                                    True)
+    resources_per_places = exec_utils.get_param_value(Parameters.PARAM_MAP_RESOURCES_PER_PLACE, parameters,
+                                                      None)
+    default_num_resources_per_places = exec_utils.get_param_value(Parameters.PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE,
+                                                                  parameters, 1)
+    max_steps_per_case = exec_utils.get_param_value(Parameters.PARAM_MAX_STEPS_PER_CASE, parameters, 10000)
+    seed = exec_utils.get_param_value(Parameters.PARAM_SEED, parameters, None)
+
+    if resources_per_places is None:
+        resources_per_places = {}
+
+    logging.basicConfig()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.DEBUG)
+
+    # the random variables of the stochastic map, and the choice of the transitions, use the global
+    # NumPy generator: it is seeded for the simulation, and its state is restored afterwards
+    random_state = np.random.get_state() if seed is not None else None
+    try:
+        if seed is not None:
+            np.random.seed(seed)
+        smap, case_arrival_ratio = __get_smap_and_case_arrival_ratio(log, net, im, fm, parameters)
+
+        # the start timestamp is set to 1000000 instead of 0 to avoid problems with 32 bit machines
+        simulator = DiscreteEventSimulator(net, im, fm, smap, resources_per_places, default_num_resources_per_places,
+                                           max_steps_per_case)
+        cases = simulator.run(no_simulations, 1000000, case_arrival_ratio)
+    finally:
+        if random_state is not None:
+            np.random.set_state(random_state)
+
+    if enable_diagnostics:
+        logger.info(str(time()) + " ended the Monte carlo simulation.")
+
+    cases = [case for case in cases if case.terminated_correctly]
+    cases_ex_time = []
+    for case in cases:
+        if case.trace:
+            cases_ex_time.append(case.trace[-1][xes_constants.DEFAULT_TIMESTAMP_KEY].timestamp() -
+                                 case.trace[0][xes_constants.DEFAULT_TIMESTAMP_KEY].timestamp())
+        else:
+            cases_ex_time.append(0)
+
+    log = EventLog([case.trace for case in cases])
+    timestamps = [ev[xes_constants.DEFAULT_TIMESTAMP_KEY].timestamp() for trace in log for ev in trace]
+
+    places_interval_trees = {p: IntervalTree(Interval(*x) for x in y)
+                             for p, y in simulator.places_intervals.items()}
+    transitions_interval_trees = {t.name: IntervalTree(Interval(*x) for x in y)
+                                  for t, y in simulator.transitions_intervals.items()}
+
+    return log, {Outputs.OUTPUT_PLACES_INTERVAL_TREES.value: places_interval_trees,
+                 Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES.value: transitions_interval_trees,
+                 Outputs.OUTPUT_CASES_EX_TIME.value: cases_ex_time,
+                 Outputs.OUTPUT_MEDIAN_CASES_EX_TIME.value: median(cases_ex_time) if cases_ex_time else 0,
+                 Outputs.OUTPUT_CASE_ARRIVAL_RATIO.value: case_arrival_ratio,
+                 Outputs.OUTPUT_TOTAL_CASES_TIME.value: max(timestamps) - min(timestamps) if timestamps else 0}
+
+
+def __get_smap_and_case_arrival_ratio(log: EventLog, net: PetriNet, im: Marking, fm: Marking,
+                                      parameters: Dict[Union[str, Parameters], Any]):
+    """
+    Gets the stochastic map (when it is not provided, it is discovered replaying the log) and the case arrival ratio
+    """
+    force_distribution = exec_utils.get_param_value(Parameters.PARAM_FORCE_DISTRIBUTION, parameters,
+                                                    None)
+    enable_diagnostics = exec_utils.get_param_value(Parameters.PARAM_ENABLE_DIAGNOSTICS, parameters,
+                                                    True)
+    case_arrival_ratio = exec_utils.get_param_value(Parameters.PARAM_CASE_ARRIVAL_RATIO, parameters,
+                                                    None)
+    smap = exec_utils.get_param_value(Parameters.PARAM_PROVIDED_SMAP, parameters,
+                                      None)
+
+    if case_arrival_ratio is None:
+        case_arrival_ratio = case_arrival.get_case_arrival_avg(log, parameters=parameters)
+
+    # when the user does not specify any map from transitions to random variables,
+    # a replay operation is performed
+    if smap is None:
+        logger = logging.getLogger(__name__)
+        if enable_diagnostics:
+            logger.info(str(time()) + " started the replay operation.")
+        if force_distribution is not None:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, force_distribution=force_distribution,
+                                                   parameters=parameters)
+        else:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, parameters=parameters)
+        if enable_diagnostics:
+            logger.info(str(time()) + " ended the replay operation.")
+
+    return smap, case_arrival_ratio
+
+
+def _apply_replication(net: PetriNet, im: Marking, fm: Marking, places: List[PetriNet.Place],
+                       parameters: Dict[Union[str, Parameters], Any]) -> Tuple[EventLog, Dict[str, Any]]:
+    """
+    Performs a replication of the simulation (in a worker process). The interval trees of the places are returned
+    in the order of the provided list of places, since the places of the worker are copies of the original ones.
+    """
+    log, result = apply(EventLog(), net, im, fm, parameters=parameters)
+    places_interval_trees = result[Outputs.OUTPUT_PLACES_INTERVAL_TREES.value]
+    result[Outputs.OUTPUT_PLACES_INTERVAL_TREES.value] = [places_interval_trees[p] for p in places]
+    return log, result
+
+
+def apply_replications(log: EventLog, net: PetriNet, im: Marking, fm: Marking, num_replications: int,
+                       parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> List[Tuple[EventLog, Dict[str, Any]]]:
+    """
+    Performs independent replications of the Monte Carlo simulation, in parallel processes.
+    The stochastic map and the case arrival ratio are computed once; every replication gets its own seed, derived
+    from the provided seed (hence, the replications are reproducible when a seed is provided).
+
+    Parameters
+    -------------
+    log
+        Event log
+    net
+        Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+    im
+        Initial marking
+    fm
+        Final marking
+    num_replications
+        Number of replications
+    parameters
+        Parameters of the algorithm (see apply), including:
+            PARAM_MAX_WORKERS => Number of worker processes (default: number of CPUs; if 1, the replications are
+            performed in the current process)
+
+    Returns
+    ------------
+    replications
+        List of the results (simulated log, simulation result) of every replication
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_workers = exec_utils.get_param_value(Parameters.PARAM_MAX_WORKERS, parameters, os.cpu_count() or 1)
+    seed = exec_utils.get_param_value(Parameters.PARAM_SEED, parameters, None)
+
+    smap, case_arrival_ratio = __get_smap_and_case_arrival_ratio(log, net, im, fm, parameters)
+    seeds = [int(x.generate_state(1)[0]) for x in np.random.SeedSequence(seed).spawn(num_replications)]
+
+    replications_parameters = []
+    for replication_seed in seeds:
+        replication_parameters = {x: y for x, y in parameters.items() if
+                                  x not in {Parameters.PARAM_PROVIDED_SMAP, Parameters.PARAM_CASE_ARRIVAL_RATIO,
+                                            Parameters.PARAM_SEED, Parameters.PARAM_PROVIDED_SMAP.value,
+                                            Parameters.PARAM_CASE_ARRIVAL_RATIO.value, Parameters.PARAM_SEED.value}}
+        replication_parameters[Parameters.PARAM_PROVIDED_SMAP] = smap
+        replication_parameters[Parameters.PARAM_CASE_ARRIVAL_RATIO] = case_arrival_ratio
+        replication_parameters[Parameters.PARAM_SEED] = replication_seed
+        replications_parameters.append(replication_parameters)
+
+    if max_workers <= 1 or num_replications <= 1:
+        return [apply(EventLog(), net, im, fm, parameters=x) for x in replications_parameters]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    places = list(net.places)
+    replications = []
+    with ProcessPoolExecutor(max_workers=min(max_workers, num_replications)) as executor:
+        futures = [executor.submit(_apply_replication, net, im, fm, places, x) for x in replications_parameters]
+        for future in futures:
+            replication_log, result = future.result()
+            result[Outputs.OUTPUT_PLACES_INTERVAL_TREES.value] = dict(
+                zip(places, result[Outputs.OUTPUT_PLACES_INTERVAL_TREES.value]))
+            replications.append((replication_log, result))
+
+    return replications
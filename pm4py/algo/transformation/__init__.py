@@ -14,5 +14,9 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.transformation import log_to_trie, log_to_features, ocel
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["log_to_trie", "log_to_features", "ocel"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,9 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.transformation.log_to_features import algorithm, variants
-
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["algorithm", "variants"]
 
 if pkgutil.find_loader("sklearn"):
-    from pm4py.algo.transformation.log_to_features import util
+    _submodules.append("util")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
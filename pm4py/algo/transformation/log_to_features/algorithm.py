@@ -21,13 +21,15 @@ import pandas as pd
 
 from pm4py.objects.log.obj import EventLog, EventStream
 from pm4py.util import exec_utils
-from pm4py.algo.transformation.log_to_features.variants import event_based, trace_based, temporal
+from pm4py.algo.transformation.log_to_features.variants import event_based, trace_based, temporal, \
+    trace_based_dataframe
 
 
 class Variants(Enum):
     EVENT_BASED = event_based
     TRACE_BASED = trace_based
     TEMPORAL = temporal
+    TRACE_BASED_DATAFRAME = trace_based_dataframe
 
 
 def apply(log: Union[EventLog, pd.DataFrame, EventStream], variant: Any = Variants.TRACE_BASED,
@@ -46,6 +48,8 @@ def apply(log: Union[EventLog, pd.DataFrame, EventStream], variant: Any = Varian
         - Variants.TRACE_BASED => extracts for each trace a single numerical vector containing the features
             of the trace
         - Variants.TEMPORAL => extracts temporal features from the traditional event log
+        - Variants.TRACE_BASED_DATAFRAME => extracts from a dataframe (columnar computation) the features of
+            Variants.TRACE_BASED, as a NumPy or scipy.sparse matrix
 
     Returns
     ---------------
@@ -17,13 +17,14 @@
 from enum import Enum
 from typing import Optional, Dict, Any, Union, Tuple, List, Set
 
+import numpy as np
 import pandas as pd
 
 from pm4py.objects.conversion.log import converter
 from pm4py.objects.log.obj import EventLog, Trace, Event
 from pm4py.objects.log.util import dataframe_utils
 from pm4py.util import constants
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, intervals
 from pm4py.util import xes_constants as xes
 from pm4py.util import xes_constants
 
@@ -187,42 +188,37 @@ def resource_workload(log: EventLog, parameters: Optional[Dict[Union[str, Parame
     if parameters is None:
         parameters = {}
 
-    from intervaltree.intervaltree import IntervalTree, Interval
-
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
     resource_key = exec_utils.get_param_value(Parameters.RESOURCE_KEY, parameters, xes_constants.DEFAULT_RESOURCE_KEY)
     epsilon = exec_utils.get_param_value(Parameters.EPSILON, parameters, 0.000001)
     default_not_present = exec_utils.get_param_value(Parameters.DEFAULT_NOT_PRESENT, parameters, 0)
 
-    tree_dict = {}
-    for case in log:
+    # lead time of the cases, and cases in which every resource is involved
+    cases_intervals = []
+    resources_cases = {}
+    for index, case in enumerate(log):
         if case:
-            resources = set(x[resource_key] for x in case)
-            st = case[0][start_timestamp_key].timestamp() - epsilon
-            ct = case[-1][timestamp_key].timestamp() + epsilon
-            for res in resources:
-                if res not in tree_dict:
-                    tree_dict[res] = IntervalTree()
-                tree_dict[res].add(Interval(st, ct))
+            cases_intervals.append((case[0][start_timestamp_key].timestamp() - epsilon,
+                                    case[-1][timestamp_key].timestamp() + epsilon))
+            for res in set(x[resource_key] for x in case):
+                if res not in resources_cases:
+                    resources_cases[res] = []
+                resources_cases[res].append(index)
+        else:
+            cases_intervals.append((0.0, 0.0))
+    cases_intervals = np.array(cases_intervals, dtype=float).reshape(-1, 2)
 
-    resources_list = sorted(list(tree_dict))
+    resources_list = sorted(list(resources_cases))
 
-    data = []
+    data = np.full((len(log), len(resources_list)), default_not_present, dtype=object)
     feature_names = ["resource_workload@@"+r for r in resources_list]
 
-    for case in log:
-        data.append([])
-        resources = set(x[resource_key] for x in case)
-        st = case[0][start_timestamp_key].timestamp() - epsilon
-        ct = case[-1][timestamp_key].timestamp() + epsilon
-        for res in resources_list:
-            if res in resources:
-                data[-1].append(len(tree_dict[res][st:ct]))
-            else:
-                data[-1].append(default_not_present)
+    for j, res in enumerate(resources_list):
+        begins, ends = cases_intervals[resources_cases[res], 0], cases_intervals[resources_cases[res], 1]
+        data[resources_cases[res], j] = intervals.count_overlapping(begins, ends, begins, ends).tolist()
 
-    return data, feature_names
+    return data.tolist(), feature_names
 
 
 def work_in_progress(log: EventLog, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Tuple[Any, List[str]]:
@@ -247,30 +243,20 @@ def work_in_progress(log: EventLog, parameters: Optional[Dict[Union[str, Paramet
     if parameters is None:
         parameters = {}
 
-    from intervaltree.intervaltree import IntervalTree, Interval
-
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
     epsilon = exec_utils.get_param_value(Parameters.EPSILON, parameters, 0.000001)
     default_not_present = exec_utils.get_param_value(Parameters.DEFAULT_NOT_PRESENT, parameters, 0)
 
-    tree = IntervalTree()
-    for case in log:
-        if case:
-            st = case[0][start_timestamp_key].timestamp() - epsilon
-            ct = case[-1][timestamp_key].timestamp() + epsilon
-            tree.add(Interval(st, ct))
+    non_empty = [index for index, case in enumerate(log) if case]
+    begins = np.array([log[i][0][start_timestamp_key].timestamp() for i in non_empty], dtype=float) - epsilon
+    ends = np.array([log[i][-1][timestamp_key].timestamp() for i in non_empty], dtype=float) + epsilon
 
-    data = []
+    data = [[default_not_present] for case in log]
     feature_names = ["@@work_in_progress"]
 
-    for case in log:
-        if case:
-            st = case[0][start_timestamp_key].timestamp() - epsilon
-            ct = case[-1][timestamp_key].timestamp() + epsilon
-            data.append([len(tree[st:ct])])
-        else:
-            data.append([default_not_present])
+    for index, count in zip(non_empty, intervals.count_overlapping(begins, ends, begins, ends).tolist()):
+        data[index] = [count]
 
     return data, feature_names
 
@@ -0,0 +1,789 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Columnar extraction, from a Pandas dataframe, of the features of the trace_based variant (a vector for each case).
+
+The features (names and values) are the same that the trace_based variant extracts from the event log obtained
+by converting the dataframe: the cases are considered in the order of their first event in the dataframe, and the
+events of every case in the order of the rows. The computations are done on the NumPy arrays of the columns,
+with the events grouped by case, and the features are returned as a dense NumPy matrix or as a scipy.sparse
+matrix. With apply_chunks, the matrix is produced in chunks of cases (for feature tables larger than the memory).
+
+When the attributes are not specified, they are selected among the columns of the dataframe with the criteria
+of the trace_based variant (all the cases are considered, and the attributes are taken in the order of the columns).
+"""
+
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Tuple, List, Iterator, Callable
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import constants, exec_utils, intervals, xes_constants
+
+
+class Parameters(Enum):
+    ENABLE_ACTIVITY_DEF_REPRESENTATION = "enable_activity_def_representation"
+    ENABLE_SUCC_DEF_REPRESENTATION = "enable_succ_def_representation"
+    STR_TRACE_ATTRIBUTES = "str_tr_attr"
+    STR_EVENT_ATTRIBUTES = "str_ev_attr"
+    NUM_TRACE_ATTRIBUTES = "num_tr_attr"
+    NUM_EVENT_ATTRIBUTES = "num_ev_attr"
+    STR_EVSUCC_ATTRIBUTES = "str_evsucc_attr"
+    FEATURE_NAMES = "feature_names"
+    BLACKLIST = "blacklist"
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    RESOURCE_KEY = constants.PARAMETER_CONSTANT_RESOURCE_KEY
+    EPSILON = "epsilon"
+    DEFAULT_NOT_PRESENT = "default_not_present"
+    ENABLE_ALL_EXTRA_FEATURES = "enable_all_extra_features"
+    ENABLE_CASE_DURATION = "enable_case_duration"
+    ENABLE_TIMES_FROM_FIRST_OCCURRENCE = "enable_times_from_first_occurrence"
+    ENABLE_TIMES_FROM_LAST_OCCURRENCE = "enable_times_from_last_occurrence"
+    ENABLE_DIRECT_PATHS_TIMES_LAST_OCC = "enable_direct_paths_times_last_occ"
+    ENABLE_INDIRECT_PATHS_TIMES_LAST_OCC = "enable_indirect_paths_times_last_occ"
+    ENABLE_WORK_IN_PROGRESS = "enable_work_in_progress"
+    ENABLE_RESOURCE_WORKLOAD = "enable_resource_workload"
+    ENABLE_FIRST_LAST_ACTIVITY_INDEX = "enable_first_last_activity_index"
+    ENABLE_MAX_CONCURRENT_EVENTS = "enable_max_concurrent_events"
+    ENABLE_MAX_CONCURRENT_EVENTS_PER_ACTIVITY = "enable_max_concurrent_events_per_activity"
+    CASE_ATTRIBUTE_PREFIX = constants.CASE_ATTRIBUTE_PREFIX
+    SPARSE = "sparse"
+    CHUNK_SIZE = "chunk_size"
+
+
+# maximum number of couples of events generated at once (indirect paths)
+MAX_PAIRS_PER_CHUNK = 10000000
+
+
+class EventTable(object):
+    def __init__(self, df: pd.DataFrame, case_id_key: str):
+        """
+        Groups the events of a dataframe by case (the cases in the order of their first event, the events of a case
+        in the order of the rows). The events without case identifier are not considered
+
+        Parameters
+        ---------------
+        df
+            Dataframe
+        case_id_key
+            Column of the case identifier
+        """
+        self.df = df
+        case_codes, self.cases = pd.factorize(df[case_id_key])
+        present = np.flatnonzero(case_codes >= 0)
+        # positions of the rows of the events, grouped by case
+        self.order = present[np.argsort(case_codes[present], kind="stable")]
+        self.num_cases = len(self.cases)
+        self.case_starts = np.zeros(self.num_cases + 1, dtype=np.int64)
+        np.cumsum(np.bincount(case_codes[present], minlength=self.num_cases), out=self.case_starts[1:])
+        self.event_cases = np.repeat(np.arange(self.num_cases), np.diff(self.case_starts))
+        self.positions = np.arange(len(self.order)) - self.case_starts[self.event_cases]
+        self._seconds = {}
+
+    def values(self, column: str) -> np.ndarray:
+        """
+        Values of a column for the events, grouped by case
+        """
+        return self.df[column].to_numpy()[self.order]
+
+    def first_values(self, column: str) -> np.ndarray:
+        """
+        Values of a column for the first event of every case
+        """
+        return self.df[column].to_numpy()[self.order[self.case_starts[:-1]]]
+
+    def seconds(self, column: str) -> np.ndarray:
+        """
+        Values of a timestamp column for the events (grouped by case), as seconds since the epoch
+        (rounded to the microsecond, as Timestamp.timestamp())
+        """
+        if column not in self._seconds:
+            series = self.df[column]
+            if getattr(series.dt, "tz", None) is not None:
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            ns = series.to_numpy(dtype="datetime64[ns]").view(np.int64)[self.order]
+            self._seconds[column] = np.round(ns / 10 ** 9, 6)
+        return self._seconds[column]
+
+
+def __string_codes(values: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+    """
+    Factorizes the values by their string representation (as str() would represent them)
+    """
+    codes, uniques = pd.factorize(values)
+    reps = [str(x) for x in uniques]
+    missing = np.flatnonzero(codes < 0)
+    if len(missing):
+        missing_codes, missing_reps = pd.factorize(np.array([str(x) for x in values[missing].tolist()], dtype=object))
+        codes[missing] = missing_codes + len(reps)
+        reps = reps + list(missing_reps)
+    # different values may have the same representation
+    rep_codes, reps = pd.factorize(np.array(reps, dtype=object))
+    return rep_codes[codes], list(reps)
+
+
+def __activity_codes(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorizes the activities (codes sorted according to the activities; missing activities get the code -1)
+    """
+    try:
+        return pd.factorize(values, sort=True)
+    except TypeError:
+        return pd.factorize(values)
+
+
+def __sorted_reps(codes_reps: List[Tuple[int, str]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Sorts the (distinct) feature names, returning the names and the column of every code
+    """
+    names = sorted(set(name for code, name in codes_reps))
+    columns = {name: i for i, name in enumerate(names)}
+    code_columns = np.full(max([code for code, name in codes_reps], default=-1) + 1, -1, dtype=np.int64)
+    for code, name in codes_reps:
+        code_columns[code] = columns[name]
+    return names, code_columns
+
+
+def __one_hot(rows: np.ndarray, cols: np.ndarray, num_rows: int, num_cols: int):
+    from scipy.sparse import coo_matrix
+
+    keys = np.unique(rows.astype(np.int64) * num_cols + cols)
+    return coo_matrix((np.ones(len(keys)), (keys // num_cols, keys % num_cols)), shape=(num_rows, num_cols))
+
+
+def __block(rows: np.ndarray, cols: np.ndarray, values: np.ndarray, num_rows: int, num_cols: int, default: Any):
+    """
+    Builds a block of the features matrix (sparse if the default value is 0, otherwise dense)
+    """
+    from scipy.sparse import coo_matrix
+
+    if default == 0:
+        return coo_matrix((values.astype(np.float64), (rows, cols)), shape=(num_rows, num_cols))
+    block = np.full((num_rows, num_cols), default, dtype=np.float64)
+    block[rows, cols] = values
+    return block
+
+
+def __last_per_key(keys: np.ndarray) -> np.ndarray:
+    """
+    Positions of the last occurrence of every key
+    """
+    _, reversed_positions = np.unique(keys[::-1], return_index=True)
+    return len(keys) - 1 - reversed_positions
+
+
+# every feature family is described by its feature names and by a function providing the block of the features
+# matrix for the cases c0:c1, as a tuple (first event, last event + 1, cases of the events, number of cases)
+
+
+def __string_trace_attribute(table: EventTable, attribute: str, case_attribute_prefix: str):
+    column = case_attribute_prefix + attribute
+    if column in table.df.columns:
+        codes, reps = __string_codes(table.first_values(column))
+    elif attribute == xes_constants.DEFAULT_TRACEID_KEY:
+        codes, reps = __string_codes(np.asarray(table.cases, dtype=object))
+    else:
+        codes, reps = np.zeros(table.num_cases, dtype=np.int64), ["UNDEFINED"]
+    names, code_columns = __sorted_reps([(i, "trace:" + str(attribute) + "@" + r) for i, r in enumerate(reps)])
+
+    def block(c0, c1):
+        return __one_hot(np.arange(c1 - c0), code_columns[codes[c0:c1]], c1 - c0, len(names))
+
+    return names, block
+
+
+def __string_event_attribute(table: EventTable, attribute: str):
+    if attribute in table.df.columns:
+        codes, reps = __string_codes(table.values(attribute))
+        names, code_columns = __sorted_reps([(i, "event:" + str(attribute) + "@" + r) for i, r in enumerate(reps)])
+
+        def block(c0, c1):
+            s0, s1 = table.case_starts[c0], table.case_starts[c1]
+            return __one_hot(table.event_cases[s0:s1] - c0, code_columns[codes[s0:s1]], c1 - c0, len(names))
+    else:
+        names = ["event:" + str(attribute) + "@UNDEFINED"]
+
+        def block(c0, c1):
+            return __one_hot(np.arange(c1 - c0), np.zeros(c1 - c0, dtype=np.int64), c1 - c0, 1)
+
+    return names, block
+
+
+def __string_succession_attribute(table: EventTable, attribute: str):
+    undefined = "succession:" + str(attribute) + "@UNDEFINED"
+    n = len(table.order)
+    # couples of consecutive events of the same case
+    succ = np.flatnonzero(table.event_cases[:-1] == table.event_cases[1:]) if n > 1 else np.zeros(0, dtype=np.int64)
+    if attribute in table.df.columns and len(succ):
+        codes, reps = __string_codes(table.values(attribute))
+        pair_codes, pairs = pd.factorize(codes[succ].astype(np.int64) * len(reps) + codes[succ + 1])
+        codes_reps = [(i, "succession:" + str(attribute) + "@" + reps[p // len(reps)] + "#" + reps[p % len(reps)])
+                      for i, p in enumerate(pairs.tolist())]
+    else:
+        pair_codes, codes_reps = np.zeros(0, dtype=np.int64), []
+        succ = np.zeros(0, dtype=np.int64)
+    with_succ = np.zeros(table.num_cases, dtype=bool)
+    with_succ[table.event_cases[succ]] = True
+    undefined_code = len(codes_reps)
+    if not with_succ.all():
+        codes_reps.append((undefined_code, undefined))
+    names, code_columns = __sorted_reps(codes_reps)
+    succ_cases = table.event_cases[succ]
+
+    def block(c0, c1):
+        i0, i1 = np.searchsorted(succ_cases, [c0, c1])
+        no_succ = np.flatnonzero(~with_succ[c0:c1])
+        rows = np.concatenate([succ_cases[i0:i1] - c0, no_succ])
+        cols = np.concatenate([code_columns[pair_codes[i0:i1]],
+                               np.full(len(no_succ), code_columns[undefined_code] if len(no_succ) else 0)])
+        return __one_hot(rows, cols, c1 - c0, len(names))
+
+    return names, block
+
+
+def __numeric_trace_attribute(table: EventTable, attribute: str, case_attribute_prefix: str):
+    column = case_attribute_prefix + attribute
+    if column not in table.df.columns:
+        raise Exception("at least a trace without trace attribute: " + attribute)
+    values = table.first_values(column).astype(np.float64)
+
+    def block(c0, c1):
+        return values[c0:c1].reshape(-1, 1)
+
+    return ["trace:" + attribute], block
+
+
+def __numeric_event_attribute(table: EventTable, attribute: str):
+    if attribute not in table.df.columns:
+        raise Exception("at least a trace without any event with event attribute: " + attribute)
+    values = table.values(attribute)
+    # the last value (different from None) of every case
+    valid = np.not_equal(values, None) if values.dtype == object else np.ones(len(values), dtype=bool)
+    last = np.maximum.reduceat(np.where(valid, np.arange(len(values)), -1), table.case_starts[:-1]) \
+        if table.num_cases else np.zeros(0, dtype=np.int64)
+    if np.any(last < table.case_starts[:-1]):
+        raise Exception("at least a trace without any event with event attribute: " + attribute)
+    values = values[last].astype(np.float64)
+
+    def block(c0, c1):
+        return values[c0:c1].reshape(-1, 1)
+
+    return ["event:" + attribute], block
+
+
+def __case_duration(table: EventTable, start_timestamp_key: str, timestamp_key: str):
+    durations = table.seconds(timestamp_key)[table.case_starts[1:] - 1] - \
+                table.seconds(start_timestamp_key)[table.case_starts[:-1]]
+
+    def block(c0, c1):
+        return durations[c0:c1].reshape(-1, 1)
+
+    return ["@@caseDuration"], block
+
+
+def __times_from_occurrence_activity(table: EventTable, activity_key: str, start_timestamp_key: str,
+                                     timestamp_key: str, default_not_present: Any, first: bool):
+    act_codes, activities = __activity_codes(table.values(activity_key))
+    num_acts = len(activities)
+    prefixes = ("startToFirstOcc@@", "firstOccToEnd@@") if first else ("startToLastOcc@@", "lastOccToEnd@@")
+    names = [prefix + str(act) for act in activities for prefix in prefixes]
+    events = np.flatnonzero(act_codes >= 0)
+    keys = table.event_cases[events].astype(np.int64) * max(num_acts, 1) + act_codes[events]
+    # first (last) occurrence of every activity in every case
+    events = events[np.unique(keys, return_index=True)[1] if first else __last_per_key(keys)]
+    st, ct = table.seconds(start_timestamp_key), table.seconds(timestamp_key)
+    cases = table.event_cases[events]
+    from_start = st[events] - ct[table.case_starts[cases]]
+    to_end = st[table.case_starts[cases + 1] - 1] - ct[events]
+
+    def block(c0, c1):
+        i0, i1 = np.searchsorted(cases, [c0, c1])
+        rows = np.repeat(cases[i0:i1] - c0, 2)
+        cols = np.stack([2 * act_codes[events[i0:i1]], 2 * act_codes[events[i0:i1]] + 1], axis=1).ravel()
+        values = np.stack([from_start[i0:i1], to_end[i0:i1]], axis=1).ravel()
+        return __block(rows, cols, values, c1 - c0, len(names), default_not_present)
+
+    return names, block
+
+
+def __first_last_activity_index(table: EventTable, activity_key: str, default_not_present: Any):
+    act_codes, activities = __activity_codes(table.values(activity_key))
+    num_acts = len(activities)
+    names = [prefix + str(act) for act in activities for prefix in ("firstIndexAct@@", "lastIndexAct@@")]
+    events = np.flatnonzero(act_codes >= 0)
+    keys = table.event_cases[events].astype(np.int64) * max(num_acts, 1) + act_codes[events]
+    first_events = events[np.unique(keys, return_index=True)[1]]
+    last_events = events[__last_per_key(keys)]
+    cases = table.event_cases[first_events]
+
+    def block(c0, c1):
+        i0, i1 = np.searchsorted(cases, [c0, c1])
+        rows = np.repeat(cases[i0:i1] - c0, 2)
+        cols = np.stack([2 * act_codes[first_events[i0:i1]], 2 * act_codes[first_events[i0:i1]] + 1], axis=1).ravel()
+        values = np.stack([table.positions[first_events[i0:i1]], table.positions[last_events[i0:i1]]], axis=1).ravel()
+        return __block(rows, cols, values, c1 - c0, len(names), default_not_present)
+
+    return names, block
+
+
+def __paths_block(cases: np.ndarray, paths: np.ndarray, values: np.ndarray, path_columns: np.ndarray,
+                  c0: int, c1: int, num_names: int, default_not_present: Any):
+    """
+    Block of the features of the paths, given the performance of the (last) occurrences of the paths in the cases
+    """
+    i0, i1 = np.searchsorted(cases, [c0, c1])
+    return __block(cases[i0:i1] - c0, path_columns[paths[i0:i1]], values[i0:i1], c1 - c0, num_names,
+                   default_not_present)
+
+
+def __paths_names(prefix: str, path_codes: np.ndarray, activities: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    num_acts = max(len(activities), 1)
+    names = [prefix + str(activities[p // num_acts]) + "##" + str(activities[p % num_acts])
+             for p in path_codes.tolist()]
+    path_columns = np.full(num_acts * num_acts, -1, dtype=np.int64)
+    path_columns[path_codes] = np.arange(len(path_codes))
+    return names, path_columns
+
+
+def __last_occurrences(cases: np.ndarray, paths: np.ndarray, values: np.ndarray, num_paths: int):
+    """
+    Keeps the last occurrence of every path in every case (sorting the occurrences by case)
+    """
+    keys = cases.astype(np.int64) * num_paths + paths
+    last = __last_per_key(keys)
+    last = last[np.argsort(keys[last], kind="stable")]
+    return cases[last], paths[last], values[last]
+
+
+def __direct_paths_times_last_occ(table: EventTable, activity_key: str, start_timestamp_key: str,
+                                  timestamp_key: str, default_not_present: Any):
+    act_codes, activities = __activity_codes(table.values(activity_key))
+    num_acts = max(len(activities), 1)
+    src = np.flatnonzero(table.event_cases[:-1] == table.event_cases[1:]) if len(act_codes) > 1 else \
+        np.zeros(0, dtype=np.int64)
+    src = src[(act_codes[src] >= 0) & (act_codes[src + 1] >= 0)]
+    paths = act_codes[src].astype(np.int64) * num_acts + act_codes[src + 1]
+    names, path_columns = __paths_names("directPathPerformanceLastOcc@@", np.unique(paths), activities)
+    perf = table.seconds(start_timestamp_key)[src + 1] - table.seconds(timestamp_key)[src]
+    positive = perf > 0
+    cases, paths, perf = __last_occurrences(table.event_cases[src[positive]], paths[positive], perf[positive],
+                                            num_acts * num_acts)
+
+    def block(c0, c1):
+        return __paths_block(cases, paths, perf, path_columns, c0, c1, len(names), default_not_present)
+
+    return names, block
+
+
+def __couples_at_distance(table: EventTable, s0: int, s1: int, min_distance: int) -> Iterator[
+    Tuple[np.ndarray, np.ndarray]]:
+    """
+    Generates, in chunks, the couples of events (i, j) of the same case with j >= i + min_distance,
+    for the events s0:s1 (in the order of i and j)
+    """
+    ends = table.case_starts[table.event_cases[s0:s1] + 1]
+    counts = np.maximum(ends - np.arange(s0, s1) - min_distance, 0)
+    cumulative = np.cumsum(counts)
+    start = 0
+    while start < len(counts):
+        done = cumulative[start - 1] if start > 0 else 0
+        end = max(start + 1, int(np.searchsorted(cumulative, done + MAX_PAIRS_PER_CHUNK, side="right")))
+        chunk_counts = counts[start:end]
+        first = np.repeat(np.arange(s0 + start, s0 + end), chunk_counts)
+        offsets = np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        yield first, first + min_distance + (np.arange(len(first)) - offsets)
+        start = end
+
+
+def __indirect_paths_times_last_occ(table: EventTable, activity_key: str, start_timestamp_key: str,
+                                    timestamp_key: str, default_not_present: Any):
+    act_codes, activities = __activity_codes(table.values(activity_key))
+    num_acts = max(len(activities), 1)
+    st, ct = table.seconds(start_timestamp_key), table.seconds(timestamp_key)
+
+    # the path (a, b) occurs in a case iff the first occurrence of a precedes the last occurrence of b
+    # by at least two positions
+    events = np.flatnonzero(act_codes >= 0)
+    keys = table.event_cases[events].astype(np.int64) * num_acts + act_codes[events]
+    first_events = events[np.unique(keys, return_index=True)[1]]
+    last_events = events[__last_per_key(keys)]
+    group_cases = table.event_cases[first_events]
+    group_starts = np.searchsorted(group_cases, np.arange(table.num_cases + 1))
+    sizes = np.diff(group_starts)[group_cases]
+    left = np.repeat(np.arange(len(first_events)), sizes)
+    right = group_starts[group_cases[left]] + (np.arange(len(left)) - np.repeat(np.cumsum(sizes) - sizes, sizes))
+    occurring = table.positions[first_events[left]] + 2 <= table.positions[last_events[right]]
+    paths = np.unique(act_codes[first_events[left[occurring]]].astype(np.int64) * num_acts +
+                      act_codes[first_events[right[occurring]]])
+    names, path_columns = __paths_names("indirectPathPerformanceLastOcc@@", paths, activities)
+
+    def block(c0, c1):
+        cases, paths, perf = [], [], []
+        for src, tgt in __couples_at_distance(table, table.case_starts[c0], table.case_starts[c1], 2):
+            valid = (act_codes[src] >= 0) & (act_codes[tgt] >= 0) & (st[tgt] - ct[src] > 0)
+            src, tgt = src[valid], tgt[valid]
+            cases.append(table.event_cases[src])
+            paths.append(act_codes[src].astype(np.int64) * num_acts + act_codes[tgt])
+            perf.append(st[tgt] - ct[src])
+        if cases:
+            cases, paths, perf = __last_occurrences(np.concatenate(cases), np.concatenate(paths),
+                                                    np.concatenate(perf), num_acts * num_acts)
+        else:
+            cases, paths, perf = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+        return __paths_block(cases, paths, perf, path_columns, c0, c1, len(names), default_not_present)
+
+    return names, block
+
+
+def __case_intervals(table: EventTable, start_timestamp_key: str, timestamp_key: str,
+                     epsilon: float) -> Tuple[np.ndarray, np.ndarray]:
+    begins = table.seconds(start_timestamp_key)[table.case_starts[:-1]] - epsilon
+    ends = table.seconds(timestamp_key)[table.case_starts[1:] - 1] + epsilon
+    return begins, ends
+
+
+def __work_in_progress(table: EventTable, start_timestamp_key: str, timestamp_key: str, epsilon: float):
+    begins, ends = __case_intervals(table, start_timestamp_key, timestamp_key, epsilon)
+    counts = intervals.count_overlapping(begins, ends, begins, ends).astype(np.float64)
+
+    def block(c0, c1):
+        return counts[c0:c1].reshape(-1, 1)
+
+    return ["@@work_in_progress"], block
+
+
+def __resource_workload(table: EventTable, resource_key: str, start_timestamp_key: str, timestamp_key: str,
+                        epsilon: float, default_not_present: Any):
+    begins, ends = __case_intervals(table, start_timestamp_key, timestamp_key, epsilon)
+    res_codes, resources = __activity_codes(table.values(resource_key))
+    num_res = max(len(resources), 1)
+    events = np.flatnonzero(res_codes >= 0)
+    # cases in which every resource is involved (sorted by resource and case)
+    keys = np.unique(res_codes[events].astype(np.int64) * max(table.num_cases, 1) + table.event_cases[events])
+    keys_res, keys_cases = keys // max(table.num_cases, 1), keys % max(table.num_cases, 1)
+    counts = np.zeros(len(keys), dtype=np.int64)
+    res_starts = np.searchsorted(keys_res, np.arange(num_res + 1))
+    for r in range(len(resources)):
+        cases = keys_cases[res_starts[r]:res_starts[r + 1]]
+        counts[res_starts[r]:res_starts[r + 1]] = intervals.count_overlapping(begins[cases], ends[cases],
+                                                                              begins[cases], ends[cases])
+    by_case = np.lexsort((keys_res, keys_cases))
+    keys_res, keys_cases, counts = keys_res[by_case], keys_cases[by_case], counts[by_case]
+    names = ["resource_workload@@" + str(r) for r in resources]
+
+    def block(c0, c1):
+        i0, i1 = np.searchsorted(keys_cases, [c0, c1])
+        return __block(keys_cases[i0:i1] - c0, keys_res[i0:i1], counts[i0:i1], c1 - c0, len(names),
+                       default_not_present)
+
+    return names, block
+
+
+def __first_later_start(table: EventTable, s0: int, s1: int, start_timestamp_key: str,
+                        timestamp_key: str) -> np.ndarray:
+    """
+    For every event i of s0:s1, the position of the first following event of the same case starting after
+    the completion of i (the end of the case, if there is none)
+    """
+    st = table.seconds(start_timestamp_key)[s0:s1]
+    ct = table.seconds(timestamp_key)[s0:s1]
+    n = s1 - s0
+    ends = table.case_starts[table.event_cases[s0:s1] + 1] - s0
+    # maxima of the start timestamps on windows of 2^k events (sparse table)
+    levels = [st]
+    while (1 << len(levels)) <= max(int(np.max(ends - np.arange(n))) if n else 0, 1):
+        prev, step = levels[-1], 1 << (len(levels) - 1)
+        levels.append(np.maximum(prev, np.append(prev[step:], np.full(min(step, n), -np.inf))))
+    pos = np.arange(1, n + 1)
+    for k in range(len(levels) - 1, -1, -1):
+        can = (pos + (1 << k) <= ends)
+        can[can] = levels[k][pos[can]] <= ct[can]
+        pos[can] += 1 << k
+    return pos + s0
+
+
+def __max_concurrent_events(table: EventTable, start_timestamp_key: str, timestamp_key: str):
+    def block(c0, c1):
+        s0, s1 = table.case_starts[c0], table.case_starts[c1]
+        conc = __first_later_start(table, s0, s1, start_timestamp_key, timestamp_key) - np.arange(s0, s1) - 1
+        values = np.zeros(c1 - c0)
+        np.maximum.at(values, table.event_cases[s0:s1] - c0, conc)
+        return values.reshape(-1, 1)
+
+    return ["@@max_concurrent_activities_general"], block
+
+
+def __max_concurrent_events_per_activity(table: EventTable, activity_key: str, start_timestamp_key: str,
+                                         timestamp_key: str):
+    act_values = table.values(activity_key)
+    # same order of the activities as the trace_based variant
+    activities = list(set(pd.unique(act_values).tolist()))
+    act_codes = pd.Index(activities).get_indexer(act_values)
+    num_acts = max(len(activities), 1)
+    names = ["@@max_concurrent_activities_like_" + str(x) for x in activities]
+
+    def block(c0, c1):
+        s0, s1 = table.case_starts[c0], table.case_starts[c1]
+        n = s1 - s0
+        following = __first_later_start(table, s0, s1, start_timestamp_key, timestamp_key) - s0
+        # events of every activity of every case, sorted by position
+        groups = (table.event_cases[s0:s1] - c0).astype(np.int64) * num_acts + act_codes[s0:s1]
+        by_group = np.lexsort((np.arange(n), groups))
+        group_keys = groups[by_group] * (n + 1) + by_group
+        rank = np.empty(n, dtype=np.int64)
+        rank[by_group] = np.arange(n)
+        # events of the same activity between i (excluded) and the first event starting after i (excluded)
+        conc = np.searchsorted(group_keys, groups * (n + 1) + following, side="left") - rank - 1
+        # the value of an activity is the one of its last occurrence, excluding the last event of the case
+        events = np.flatnonzero(table.positions[s0:s1] < np.diff(table.case_starts)[table.event_cases[s0:s1]] - 1)
+        events = events[__last_per_key(groups[events])]
+        values = np.zeros((c1 - c0, len(activities)))
+        values[table.event_cases[s0:s1][events] - c0, act_codes[s0:s1][events]] = conc[events]
+        return values
+
+    return names, block
+
+
+def __select_attributes(df: pd.DataFrame, table: EventTable, case_attribute_prefix: str) -> Tuple[
+    List[str], List[str], List[str], List[str]]:
+    """
+    Selects the string and numeric trace and event attributes to use in the default representation
+    """
+    from pm4py.statistics.attributes.log.select import DEFAULT_MAX_CASES_FOR_ATTR_SELECTION
+    max_diff_occ = DEFAULT_MAX_CASES_FOR_ATTR_SELECTION / 4
+
+    def classify(values: pd.Series, str_attr: List[str], num_attr: List[str], attribute: str):
+        if pd.api.types.is_bool_dtype(values.dtype):
+            return
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            num_attr.append(attribute)
+        elif pd.api.types.infer_dtype(values, skipna=True) == "string" and values.nunique(
+                dropna=False) < max_diff_occ:
+            str_attr.append(attribute)
+
+    str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr = [], [], [], []
+    for column in df.columns:
+        if column == case_attribute_prefix + xes_constants.DEFAULT_TRACEID_KEY or \
+                column == xes_constants.DEFAULT_TRANSITION_KEY:
+            continue
+        if column.startswith(case_attribute_prefix):
+            classify(pd.Series(table.first_values(column)).infer_objects(), str_tr_attr, num_tr_attr,
+                     column.replace(case_attribute_prefix, ""))
+        else:
+            classify(df[column], str_ev_attr, num_ev_attr, column)
+    return str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr
+
+
+def __get_families(df: pd.DataFrame, table: EventTable, parameters: Dict[Any, Any]) -> List[
+        Tuple[List[str], Callable[[int, int], Any]]]:
+    """
+    Gets the feature families (feature names, function providing the block of the features of the cases c0:c1),
+    in the order of the features of the trace_based variant
+    """
+    str_tr_attr = exec_utils.get_param_value(Parameters.STR_TRACE_ATTRIBUTES, parameters, None)
+    num_tr_attr = exec_utils.get_param_value(Parameters.NUM_TRACE_ATTRIBUTES, parameters, None)
+    str_ev_attr = exec_utils.get_param_value(Parameters.STR_EVENT_ATTRIBUTES, parameters, None)
+    num_ev_attr = exec_utils.get_param_value(Parameters.NUM_EVENT_ATTRIBUTES, parameters, None)
+    str_evsucc_attr = exec_utils.get_param_value(Parameters.STR_EVSUCC_ATTRIBUTES, parameters, None)
+    feature_names = exec_utils.get_param_value(Parameters.FEATURE_NAMES, parameters, None)
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, "case:")
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters,
+                                                     xes_constants.DEFAULT_TIMESTAMP_KEY)
+    resource_key = exec_utils.get_param_value(Parameters.RESOURCE_KEY, parameters, xes_constants.DEFAULT_RESOURCE_KEY)
+    epsilon = exec_utils.get_param_value(Parameters.EPSILON, parameters, 0.000001)
+    default_not_present = exec_utils.get_param_value(Parameters.DEFAULT_NOT_PRESENT, parameters, 0)
+    enable_all = exec_utils.get_param_value(Parameters.ENABLE_ALL_EXTRA_FEATURES, parameters, False)
+
+    if str_tr_attr is None and num_tr_attr is None and str_ev_attr is None and num_ev_attr is None:
+        # default representation
+        blacklist = exec_utils.get_param_value(Parameters.BLACKLIST, parameters, [])
+        str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr = __select_attributes(df, table, case_attribute_prefix)
+        if exec_utils.get_param_value(Parameters.ENABLE_SUCC_DEF_REPRESENTATION, parameters, True):
+            str_evsucc_attr = [activity_key]
+        if exec_utils.get_param_value(Parameters.ENABLE_ACTIVITY_DEF_REPRESENTATION, parameters,
+                                      True) and activity_key not in str_ev_attr:
+            str_ev_attr.append(activity_key)
+        str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr = [[x for x in attrs if x not in blacklist] for attrs in
+                                                              (str_tr_attr, str_ev_attr, num_tr_attr, num_ev_attr)]
+        if str_evsucc_attr is not None:
+            str_evsucc_attr = [x for x in str_evsucc_attr if x not in blacklist]
+
+    families = []
+    families.extend(__string_trace_attribute(table, x, case_attribute_prefix) for x in (str_tr_attr or []))
+    families.extend(__string_event_attribute(table, x) for x in (str_ev_attr or []))
+    families.extend(__numeric_trace_attribute(table, x, case_attribute_prefix) for x in (num_tr_attr or []))
+    families.extend(__numeric_event_attribute(table, x) for x in (num_ev_attr or []))
+    families.extend(__string_succession_attribute(table, x) for x in (str_evsucc_attr or []))
+    if feature_names is not None:
+        families = [__restrict_to_feature_names(families, feature_names)]
+
+    if exec_utils.get_param_value(Parameters.ENABLE_CASE_DURATION, parameters, enable_all):
+        families.append(__case_duration(table, start_timestamp_key, timestamp_key))
+    if exec_utils.get_param_value(Parameters.ENABLE_TIMES_FROM_FIRST_OCCURRENCE, parameters, enable_all):
+        families.append(__times_from_occurrence_activity(table, activity_key, start_timestamp_key, timestamp_key,
+                                                         default_not_present, True))
+    if exec_utils.get_param_value(Parameters.ENABLE_TIMES_FROM_LAST_OCCURRENCE, parameters, enable_all):
+        families.append(__times_from_occurrence_activity(table, activity_key, start_timestamp_key, timestamp_key,
+                                                         default_not_present, False))
+    if exec_utils.get_param_value(Parameters.ENABLE_DIRECT_PATHS_TIMES_LAST_OCC, parameters, enable_all):
+        families.append(__direct_paths_times_last_occ(table, activity_key, start_timestamp_key, timestamp_key,
+                                                      default_not_present))
+    if exec_utils.get_param_value(Parameters.ENABLE_INDIRECT_PATHS_TIMES_LAST_OCC, parameters, enable_all):
+        families.append(__indirect_paths_times_last_occ(table, activity_key, start_timestamp_key, timestamp_key,
+                                                        default_not_present))
+    if exec_utils.get_param_value(Parameters.ENABLE_WORK_IN_PROGRESS, parameters, enable_all):
+        families.append(__work_in_progress(table, start_timestamp_key, timestamp_key, epsilon))
+    if exec_utils.get_param_value(Parameters.ENABLE_RESOURCE_WORKLOAD, parameters, enable_all):
+        families.append(__resource_workload(table, resource_key, start_timestamp_key, timestamp_key, epsilon,
+                                            default_not_present))
+    if exec_utils.get_param_value(Parameters.ENABLE_FIRST_LAST_ACTIVITY_INDEX, parameters, enable_all):
+        families.append(__first_last_activity_index(table, activity_key, exec_utils.get_param_value(
+            Parameters.DEFAULT_NOT_PRESENT, parameters, -1)))
+    if exec_utils.get_param_value(Parameters.ENABLE_MAX_CONCURRENT_EVENTS, parameters, enable_all):
+        families.append(__max_concurrent_events(table, start_timestamp_key, timestamp_key))
+    if exec_utils.get_param_value(Parameters.ENABLE_MAX_CONCURRENT_EVENTS_PER_ACTIVITY, parameters, enable_all):
+        families.append(__max_concurrent_events_per_activity(table, activity_key, start_timestamp_key,
+                                                             timestamp_key))
+    return families
+
+
+def __restrict_to_feature_names(families, feature_names: List[str]):
+    """
+    Maps the features of the attributes to the provided feature names (the other features are discarded)
+    """
+    from scipy.sparse import hstack, coo_matrix
+
+    columns = {name: i for i, name in enumerate(feature_names)}
+    mapping = np.array([columns.get(name, -1) for names, block in families for name in names], dtype=np.int64)
+
+    def block(c0, c1):
+        blocks = [b(c0, c1) for names, b in families]
+        if not blocks:
+            return coo_matrix((c1 - c0, len(feature_names)))
+        matrix = hstack([coo_matrix(b) for b in blocks]).tocoo()
+        cols = mapping[matrix.col]
+        keep = cols >= 0
+        return coo_matrix((matrix.data[keep], (matrix.row[keep], cols[keep])), shape=(c1 - c0, len(feature_names)))
+
+    return list(feature_names), block
+
+
+def __assemble(families, c0: int, c1: int, sparse: bool):
+    from scipy.sparse import hstack, csr_matrix, issparse
+
+    blocks = [block(c0, c1) for names, block in families]
+    if sparse:
+        if not blocks:
+            return csr_matrix((c1 - c0, 0))
+        return hstack([b if issparse(b) else csr_matrix(b) for b in blocks]).tocsr()
+    if not blocks:
+        return np.zeros((c1 - c0, 0))
+    return np.hstack([b.toarray() if issparse(b) else b for b in blocks])
+
+
+def apply_chunks(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Tuple[
+        List[str], Iterator[Any]]:
+    """
+    Extracts the features from a dataframe, producing the features matrix in chunks of cases
+
+    Parameters
+    -----------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm (see apply), including:
+        - Parameters.CHUNK_SIZE => number of cases of every chunk (default: 10000)
+
+    Returns
+    -----------------
+    feature_names
+        Names of the features, in order
+    chunks
+        Iterator over the features matrices of the chunks of cases (the cases in the order of their first event
+        in the dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
+    chunk_size = max(1, exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 10000))
+
+    table = EventTable(df, case_id_key)
+    families = __get_families(df, table, parameters)
+    feature_names = [name for names, block in families for name in names]
+
+    def chunks():
+        for c0 in range(0, table.num_cases, chunk_size):
+            yield __assemble(families, c0, min(c0 + chunk_size, table.num_cases), sparse)
+
+    return feature_names, chunks()
+
+
+def apply(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Tuple[Any, List[str]]:
+    """
+    Extracts the features from a dataframe (a vector for each case), with the same feature names and values
+    of the trace_based variant
+
+    Parameters
+    -----------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - STR_TRACE_ATTRIBUTES => string trace attributes to consider in the features extraction
+        - STR_EVENT_ATTRIBUTES => string event attributes to consider in the features extraction
+        - NUM_TRACE_ATTRIBUTES => numeric trace attributes to consider in the features extraction
+        - NUM_EVENT_ATTRIBUTES => numeric event attributes to consider in the features extraction
+        - STR_EVSUCC_ATTRIBUTES => succession of event attributes to consider in the features extraction
+        - FEATURE_NAMES => features to consider (in the given order)
+        - ENABLE_ALL_EXTRA_FEATURES => enables all the extra features
+        - ENABLE_CASE_DURATION, ENABLE_TIMES_FROM_FIRST_OCCURRENCE, ENABLE_TIMES_FROM_LAST_OCCURRENCE,
+        ENABLE_DIRECT_PATHS_TIMES_LAST_OCC, ENABLE_INDIRECT_PATHS_TIMES_LAST_OCC, ENABLE_WORK_IN_PROGRESS,
+        ENABLE_RESOURCE_WORKLOAD, ENABLE_FIRST_LAST_ACTIVITY_INDEX, ENABLE_MAX_CONCURRENT_EVENTS,
+        ENABLE_MAX_CONCURRENT_EVENTS_PER_ACTIVITY => enable the extra features (see the trace_based variant)
+        - SPARSE => returns the features as a scipy.sparse CSR matrix (default: False, dense NumPy matrix)
+
+    Returns
+    -------------
+    data
+        Features matrix (a row for each case, in the order of their first event in the dataframe)
+    feature_names
+        Names of the features, in order
+    """
+    if parameters is None:
+        parameters = {}
+
+    parameters = dict(parameters)
+    parameters[Parameters.CHUNK_SIZE] = max(1, df[exec_utils.get_param_value(
+        Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)].nunique())
+    feature_names, chunks = apply_chunks(df, parameters=parameters)
+    sparse = exec_utils.get_param_value(Parameters.SPARSE, parameters, False)
+    data = list(chunks)
+    if data:
+        return data[0], feature_names
+    if sparse:
+        from scipy.sparse import csr_matrix
+        return csr_matrix((0, len(feature_names))), feature_names
+    return np.zeros((0, len(feature_names))), feature_names
@@ -14,8 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.transformation.log_to_interval_tree import algorithm, variants
-
 import warnings
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["algorithm", "variants"]
 
 warnings.warn("The log_to_interval_tree package will be removed in a future release.")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
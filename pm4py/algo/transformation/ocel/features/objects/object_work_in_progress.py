@@ -17,6 +17,7 @@
 from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any
 from pm4py.algo.transformation.ocel.features.objects import object_lifecycle_duration
+from pm4py.util import intervals
 import pandas as pd
 
 
@@ -43,23 +44,14 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     if parameters is None:
         parameters = {}
 
-    from intervaltree import Interval, IntervalTree
-    
     data, feature_names = object_lifecycle_duration.apply(ocel, parameters=parameters)
     obj_dur = pd.DataFrame(data, columns=feature_names)
-    obj_dur = obj_dur[["@@object_lifecycle_start_timestamp", "@@object_lifecycle_end_timestamp"]].to_dict("records")
     small_k = 10**-5
 
-    tree = IntervalTree()
+    begins = obj_dur["@@object_lifecycle_start_timestamp"].to_numpy(dtype=float) - small_k
+    ends = obj_dur["@@object_lifecycle_end_timestamp"].to_numpy(dtype=float) + small_k
 
-    for el in obj_dur:
-        tree.add(Interval(el["@@object_lifecycle_start_timestamp"] - small_k,
-                          el["@@object_lifecycle_end_timestamp"] + small_k))
-
-    data = []
+    data = [[x] for x in intervals.count_overlapping(begins, ends, begins, ends).tolist()]
     feature_names = ["@@object_wip"]
 
-    for el in obj_dur:
-        data.append([len(tree[el["@@object_lifecycle_start_timestamp"] - small_k: el["@@object_lifecycle_end_timestamp"] + small_k])])
-
     return data, feature_names
@@ -14,9 +14,63 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any, Set, Tuple
 
+import numpy as np
+
+from pm4py.algo.transformation.ocel.graphs import util
+from pm4py.objects.ocel.obj import OCEL
+
+
+def apply_edges(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the object cobirth graph on the factorized identifiers of the objects (see apply)
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    edges
+        Deduplicated edges (array of shape (number of edges, 2) containing the codes of the objects, the code of the first object being lower than the code of the second one)
+    object_ids
+        Identifiers of the objects, indexed by their code
+    """
+    if parameters is None:
+        parameters = {}
+
+    events, objects, object_ids = util.get_relations(ocel)
+    first_events, last_events = util.get_first_last_events(events, objects, len(object_ids))
+    # every object is "unseen" only in its first event
+    unseen = first_events[objects] == events
+    return util.pairs_in_groups(events[unseen], objects[unseen]), object_ids
+
+
+def apply_adjacency(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object cobirth graph as a sparse adjacency matrix (see apply)
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    adjacency
+        Adjacency matrix (scipy.sparse.csr_matrix, undirected, containing both the directions of every edge), indexed by the codes of the objects
+    object_ids
+        Identifiers of the objects, indexed by their code
+    """
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_adjacency(edges, object_ids, symmetric=True), object_ids
+
 
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
     """
@@ -39,26 +93,5 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
     object_cobirth_graph
         Object cobirth graph (undirected)
     """
-    if parameters is None:
-        parameters = {}
-
-    graph = set()
-
-    ordered_events = list(ocel.events[ocel.event_id_column])
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].apply(list).to_dict()
-    set_objects = set()
-
-    for ev in ordered_events:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
-
-        for o1 in rel_obj_unseen:
-            for o2 in rel_obj_unseen:
-                if o1 < o2:
-                    graph.add((o1, o2))
-
-        for obj in rel_obj_unseen:
-            set_objects.add(obj)
-
-    return graph
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_set(edges, object_ids)
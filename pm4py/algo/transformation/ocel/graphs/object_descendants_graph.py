@@ -14,9 +14,63 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any, Set, Tuple
 
+import numpy as np
+
+from pm4py.algo.transformation.ocel.graphs import util
+from pm4py.objects.ocel.obj import OCEL
+
+
+def apply_edges(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the object descendants graph on the factorized identifiers of the objects (see apply)
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    edges
+        Deduplicated edges (array of shape (number of edges, 2) containing the codes of the objects)
+    object_ids
+        Identifiers of the objects, indexed by their code
+    """
+    if parameters is None:
+        parameters = {}
+
+    events, objects, object_ids = util.get_relations(ocel)
+    first_events, last_events = util.get_first_last_events(events, objects, len(object_ids))
+    unseen = first_events[objects] == events
+    seen = ~unseen
+    return util.cross_pairs(events[seen], objects[seen], events[unseen], objects[unseen]), object_ids
+
+
+def apply_adjacency(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object descendants graph as a sparse adjacency matrix (see apply)
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    adjacency
+        Adjacency matrix (scipy.sparse.csr_matrix, directed), indexed by the codes of the objects
+    object_ids
+        Identifiers of the objects, indexed by their code
+    """
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_adjacency(edges, object_ids, symmetric=False), object_ids
+
 
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
     """
@@ -39,24 +93,5 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
     object_descendant_graph
         Object descendant graph (directed)
     """
-    if parameters is None:
-        parameters = {}
-
-    graph = set()
-
-    ordered_events = list(ocel.events[ocel.event_id_column])
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].apply(list).to_dict()
-    set_objects = set()
-
-    for ev in ordered_events:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
-        if rel_obj_seen and rel_obj_unseen:
-            for o1 in rel_obj_seen:
-                for o2 in rel_obj_unseen:
-                    graph.add((o1, o2))
-        for obj in rel_obj_unseen:
-            set_objects.add(obj)
-
-    return graph
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_set(edges, object_ids)
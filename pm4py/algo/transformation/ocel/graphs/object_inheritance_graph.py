@@ -14,70 +14,88 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any, Set, Tuple
-from copy import copy
 
+import numpy as np
 
-def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
+from pm4py.algo.transformation.ocel.graphs import util
+from pm4py.objects.ocel.obj import OCEL
+
+
+def apply_edges(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculates the object descendants graph.
-    Two objects o1 and o2, both related to an event e, are connected if:
-    - e is the last event of the lifecycle of o1
-    - e is the first event of the lifecycle of o2
-    
+    Calculates the object inheritance graph on the factorized identifiers of the objects (see apply)
+
     Parameters
     -----------------
     ocel
         Object-centric event log
     parameters
         Parameters of the algorithm
-    
+
     Returns
     -----------------
-    object_inheritance_graph
-        Object inheritance graph (directed)
+    edges
+        Deduplicated edges (array of shape (number of edges, 2) containing the codes of the objects)
+    object_ids
+        Identifiers of the objects, indexed by their code
     """
     if parameters is None:
         parameters = {}
 
-    graph = set()
-
-    ordered_events = list(ocel.events[ocel.event_id_column])
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].apply(list).to_dict()
-    last_event_per_obj = {}
-    set_objects = set()
-
-    ordered_events_revert = copy(ordered_events)
-    ordered_events_revert.reverse()
-
-    for ev in ordered_events_revert:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
+    events, objects, object_ids = util.get_relations(ocel)
+    first_events, last_events = util.get_first_last_events(events, objects, len(object_ids))
+    first = first_events[objects] == events
+    last = last_events[objects] == events
+    edges = util.cross_pairs(events[last], objects[last], events[first], objects[first])
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    # the pairs of objects connected in both the directions are removed
+    num_objects = max(len(object_ids), 1)
+    keys = edges[:, 0] * num_objects + edges[:, 1]
+    reverse_keys = edges[:, 1] * num_objects + edges[:, 0]
+    return edges[~np.isin(keys, reverse_keys)], object_ids
 
-        for obj in rel_obj_unseen:
-            last_event_per_obj[obj] = ev
-            set_objects.add(obj)
 
-    set_objects = set()
+def apply_adjacency(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object inheritance graph as a sparse adjacency matrix (see apply)
 
-    for ev in ordered_events:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
-        rel_obj_last = {x for x in rel_obj if last_event_per_obj[x] == ev}
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
 
-        for o2 in rel_obj_unseen:
-            for o1 in rel_obj_last:
-                if o1 != o2:
-                    graph.add((o1, o2))
-            set_objects.add(o2)
+    Returns
+    -----------------
+    adjacency
+        Adjacency matrix (scipy.sparse.csr_matrix, directed), indexed by the codes of the objects
+    object_ids
+        Identifiers of the objects, indexed by their code
+    """
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_adjacency(edges, object_ids, symmetric=False), object_ids
 
-    graph_it = list(graph)
-    for el in graph_it:
-        if (el[1], el[0]) in graph:
-            graph.remove((el[0], el[1]))
-            graph.remove((el[1], el[0]))
 
-    return graph
+def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
+    """
+    Calculates the object descendants graph.
+    Two objects o1 and o2, both related to an event e, are connected if:
+    - e is the last event of the lifecycle of o1
+    - e is the first event of the lifecycle of o2
+    
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+    
+    Returns
+    -----------------
+    object_inheritance_graph
+        Object inheritance graph (directed)
+    """
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_set(edges, object_ids)
@@ -14,14 +14,17 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any, Set, Tuple
 
+import numpy as np
 
-def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
+from pm4py.algo.transformation.ocel.graphs import util
+from pm4py.objects.ocel.obj import OCEL
+
+
+def apply_edges(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculates the object interaction graph. Two objects are connected iff they are both related to an event
-    of the OCEL.
+    Calculates the object interaction graph on the factorized identifiers of the objects (see apply)
 
     Parameters
     -----------------
@@ -32,21 +35,56 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
 
     Returns
     -----------------
-    object_interaction_graph
-        Object interaction graph (as set of tuples; undirected)
+    edges
+        Deduplicated edges (array of shape (number of edges, 2) containing the codes of the objects, the code of the first object being lower than the code of the second one)
+    object_ids
+        Identifiers of the objects, indexed by their code
     """
     if parameters is None:
         parameters = {}
 
-    graph = set()
+    events, objects, object_ids = util.get_relations(ocel, ordered=False)
+    return util.pairs_in_groups(events, objects), object_ids
+
 
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].apply(list).to_dict()
+def apply_adjacency(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object interaction graph as a sparse adjacency matrix (see apply)
 
-    for ev in ev_rel_obj:
-        rel_obj = ev_rel_obj[ev]
-        for o1 in rel_obj:
-            for o2 in rel_obj:
-                if o1 < o2:
-                    graph.add((o1, o2))
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
 
-    return graph
+    Returns
+    -----------------
+    adjacency
+        Adjacency matrix (scipy.sparse.csr_matrix, undirected, containing both the directions of every edge), indexed by the codes of the objects
+    object_ids
+        Identifiers of the objects, indexed by their code
+    """
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_adjacency(edges, object_ids, symmetric=True), object_ids
+
+
+def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
+    """
+    Calculates the object interaction graph. Two objects are connected iff they are both related to an event
+    of the OCEL.
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    object_interaction_graph
+        Object interaction graph (as set of tuples; undirected)
+    """
+    edges, object_ids = apply_edges(ocel, parameters=parameters)
+    return util.to_set(edges, object_ids)
@@ -0,0 +1,217 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Utilities for the computation of the object graphs on the factorized identifiers of the events and of the objects.
+The edges of a graph are returned as an array of shape (number of edges, 2) containing the codes of the objects,
+along with the array of the object identifiers (sorted, the code of an object being its position in the array).
+"""
+
+from typing import Tuple, Set
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.ocel.obj import OCEL
+
+# maximum number of pairs of objects generated at once
+MAX_PAIRS_PER_CHUNK = 10000000
+
+
+def get_relations(ocel: OCEL, ordered: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the (deduplicated) relations between the events and the objects of the OCEL, as codes
+
+    Parameters
+    ---------------
+    ocel
+        Object-centric event log
+    ordered
+        If True, the code of an event is its position in the events dataframe (the relations of the events
+        that are not in the events dataframe are discarded); otherwise, the events of the relations are factorized
+
+    Returns
+    ---------------
+    events
+        Codes of the events of the relations (sorted)
+    objects
+        Codes of the objects of the relations (sorted, among the relations of the same event)
+    object_ids
+        Identifiers of the objects (sorted), indexed by their code
+    """
+    obj_codes, object_ids = pd.factorize(ocel.relations[ocel.object_id_column], sort=True)
+    if ordered:
+        ev_codes = pd.Index(ocel.events[ocel.event_id_column]).get_indexer(ocel.relations[ocel.event_id_column])
+        obj_codes = obj_codes[ev_codes >= 0]
+        ev_codes = ev_codes[ev_codes >= 0]
+    else:
+        ev_codes = pd.factorize(ocel.relations[ocel.event_id_column])[0]
+    num_objects = max(len(object_ids), 1)
+    keys = np.unique(ev_codes.astype(np.int64) * num_objects + obj_codes)
+    return keys // num_objects, keys % num_objects, np.asarray(object_ids)
+
+
+def get_first_last_events(events: np.ndarray, objects: np.ndarray, num_objects: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the code of the first and of the last event of every object
+
+    Parameters
+    ---------------
+    events
+        Codes of the events of the relations
+    objects
+        Codes of the objects of the relations
+    num_objects
+        Number of objects
+
+    Returns
+    ---------------
+    first_events
+        Code of the first event of every object (-1 if the object is not related to any event)
+    last_events
+        Code of the last event of every object (-1 if the object is not related to any event)
+    """
+    first_events = np.full(num_objects, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(first_events, objects, events)
+    first_events[first_events == np.iinfo(np.int64).max] = -1
+    last_events = np.full(num_objects, -1, dtype=np.int64)
+    np.maximum.at(last_events, objects, events)
+    return first_events, last_events
+
+
+def pairs_in_groups(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Gets the pairs (values[i], values[j]), i < j, of the elements belonging to the same group.
+    The groups should be sorted; if the values are sorted (and distinct) inside every group, then
+    the first element of every pair is lower than the second one.
+
+    Parameters
+    ---------------
+    groups
+        Group of every element (sorted)
+    values
+        Value of every element
+
+    Returns
+    ---------------
+    pairs
+        Deduplicated pairs (array of shape (number of pairs, 2))
+    """
+    n = len(groups)
+    if n == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    num_values = int(values.max()) + 1
+    group_starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    group_ends = np.r_[group_starts[1:], n]
+    # number of pairs having every element as first element
+    counts = np.repeat(group_ends, group_ends - group_starts) - np.arange(n) - 1
+    cumulative = np.cumsum(counts)
+    keys = []
+    start = 0
+    while start < n:
+        # the elements are split in chunks generating at most MAX_PAIRS_PER_CHUNK pairs (at least one element)
+        done = cumulative[start - 1] if start > 0 else 0
+        end = max(start + 1, int(np.searchsorted(cumulative, done + MAX_PAIRS_PER_CHUNK, side="right")))
+        chunk_counts = counts[start:end]
+        first = np.repeat(np.arange(start, end), chunk_counts)
+        offsets = np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        second = first + 1 + (np.arange(len(first)) - offsets)
+        keys.append(np.unique(values[first].astype(np.int64) * num_values + values[second]))
+        start = end
+    keys = np.unique(np.concatenate(keys))
+    return np.stack([keys // num_values, keys % num_values], axis=1)
+
+
+def cross_pairs(left_groups: np.ndarray, left_values: np.ndarray, right_groups: np.ndarray,
+                right_values: np.ndarray) -> np.ndarray:
+    """
+    Gets the (deduplicated) pairs (left value, right value) of the elements belonging to the same group
+
+    Parameters
+    ---------------
+    left_groups
+        Group of every element of the left side
+    left_values
+        Value of every element of the left side
+    right_groups
+        Group of every element of the right side
+    right_values
+        Value of every element of the right side
+
+    Returns
+    ---------------
+    pairs
+        Deduplicated pairs (array of shape (number of pairs, 2))
+    """
+    left = pd.DataFrame({"group": left_groups, "left": left_values})
+    right = pd.DataFrame({"group": right_groups, "right": right_values})
+    merged = left.merge(right, on="group")
+    return unique_edges(merged["left"].to_numpy(), merged["right"].to_numpy())
+
+
+def unique_edges(sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Deduplicates the edges (sorting them)
+    """
+    if len(sources) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    edges = np.stack([sources.astype(np.int64), targets.astype(np.int64)], axis=1)
+    return np.unique(edges, axis=0)
+
+
+def to_set(edges: np.ndarray, object_ids: np.ndarray) -> Set[Tuple[str, str]]:
+    """
+    Transforms the edges of a graph to a set of tuples of object identifiers
+
+    Parameters
+    ---------------
+    edges
+        Edges (array of shape (number of edges, 2) of codes of the objects)
+    object_ids
+        Identifiers of the objects, indexed by their code
+
+    Returns
+    ---------------
+    graph
+        Set of tuples of object identifiers
+    """
+    return set(zip(object_ids[edges[:, 0]].tolist(), object_ids[edges[:, 1]].tolist()))
+
+
+def to_adjacency(edges: np.ndarray, object_ids: np.ndarray, symmetric: bool = False):
+    """
+    Transforms the edges of a graph to a sparse adjacency matrix
+
+    Parameters
+    ---------------
+    edges
+        Edges (array of shape (number of edges, 2) of codes of the objects)
+    object_ids
+        Identifiers of the objects, indexed by their code
+    symmetric
+        If True, the matrix contains both the directions of every edge (undirected graphs)
+
+    Returns
+    ---------------
+    adjacency
+        Adjacency matrix (scipy.sparse.csr_matrix), indexed by the codes of the objects
+    """
+    from scipy.sparse import csr_matrix
+
+    rows, cols = edges[:, 0], edges[:, 1]
+    if symmetric:
+        rows, cols = np.concatenate([rows, cols]), np.concatenate([cols, rows])
+    return csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(len(object_ids), len(object_ids)))
@@ -99,7 +99,7 @@ def get_prefixes_from_log(log: Union[EventLog, pd.DataFrame], length: int, case_
         return get_prefixes.get_prefixes_from_log(log, length)
 
 
-def extract_features_dataframe(log: Union[EventLog, pd.DataFrame], str_tr_attr=None, num_tr_attr=None, str_ev_attr=None, num_ev_attr=None, str_evsucc_attr=None, activity_key="concept:name", timestamp_key="time:timestamp", case_id_key="case:concept:name", resource_key="org:resource", **kwargs) -> pd.DataFrame:
+def extract_features_dataframe(log: Union[EventLog, pd.DataFrame], str_tr_attr=None, num_tr_attr=None, str_ev_attr=None, num_ev_attr=None, str_evsucc_attr=None, activity_key="concept:name", timestamp_key="time:timestamp", case_id_key="case:concept:name", resource_key="org:resource", columnar: bool = False, **kwargs) -> pd.DataFrame:
     """
     Extracts a dataframe containing the features of each case of the provided log object
 
@@ -112,6 +112,7 @@ def extract_features_dataframe(log: Union[EventLog, pd.DataFrame], str_tr_attr=N
     :param timestamp_key: the attribute to be used as timestamp
     :param case_id_key: the attribute to be used as case identifier
     :param resource_key: the attribute to be used as resource
+    :param columnar: (for Pandas dataframes) computes directly on the columns of the dataframe the features extracted from an event log (string/numeric attributes, successions and the extra features), instead of the default features of a dataframe
     :rtype: ``pd.DataFrame``
 
     .. code-block:: python3
@@ -139,11 +140,18 @@ def extract_features_dataframe(log: Union[EventLog, pd.DataFrame], str_tr_attr=N
 
     from pm4py.algo.transformation.log_to_features import algorithm as log_to_features
 
+    variant = log_to_features.Variants.TRACE_BASED
     if check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, case_id_key=case_id_key, timestamp_key=timestamp_key)
+        if columnar:
+            variant = log_to_features.Variants.TRACE_BASED_DATAFRAME
+            parameters[constants.PARAMETER_CONSTANT_RESOURCE_KEY] = resource_key
 
-    data, feature_names = log_to_features.apply(log, parameters=parameters)
+    data, feature_names = log_to_features.apply(log, variant=variant, parameters=parameters)
 
+    if hasattr(data, "tocoo"):
+        # sparse matrix (columnar extraction with the "sparse" parameter)
+        return pd.DataFrame.sparse.from_spmatrix(data, columns=feature_names)
     return pd.DataFrame(data, columns=feature_names)
 
 
@@ -14,9 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects import log, petri_net, transition_system, conversion, process_tree, \
-    dfg, trie, org
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["log", "petri_net", "transition_system", "conversion", "process_tree", "dfg", "trie", "org"]
 
 if pkgutil.find_loader("networkx"):
-    from pm4py.objects import bpmn
+    _submodules.append("bpmn")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,4 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.conversion.dfg.variants import to_petri_net_activity_defines_place, to_petri_net_invisibles_no_duplicates
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["to_petri_net_activity_defines_place", "to_petri_net_invisibles_no_duplicates"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
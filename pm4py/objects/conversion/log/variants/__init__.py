@@ -14,4 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.conversion.log.variants import to_data_frame, to_event_stream, to_event_log, df_to_event_log_1v, df_to_event_log_nv
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["to_data_frame", "to_event_stream", "to_event_log", "df_to_event_log_1v", "df_to_event_log_nv"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
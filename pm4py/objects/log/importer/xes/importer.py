@@ -17,7 +17,7 @@
 import pkgutil
 from enum import Enum
 
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex
+from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, iterparse_dataframe
 
 
 class Variants(Enum):
@@ -26,6 +26,7 @@ class Variants(Enum):
     ITERPARSE_MEM_COMPRESSED = iterparse_mem_compressed
     ITERPARSE_20 = iterparse_20
     CHUNK_REGEX = chunk_regex
+    ITERPARSE_DATAFRAME = iterparse_dataframe
 
 
 if pkgutil.find_loader("lxml"):
@@ -53,11 +54,12 @@ def apply(path, parameters=None, variant=DEFAULT_VARIANT):
         Variant of the algorithm to use, including:
             - Variants.ITERPARSE
             - Variants.LINE_BY_LINE
+            - Variants.ITERPARSE_DATAFRAME (imports the log directly into a Pandas dataframe)
 
     Returns
     -----------
     log
-        Trace log object
+        Trace log object (Pandas dataframe for Variants.ITERPARSE_DATAFRAME)
     """
     if variant == 'nonstandard':
         variant = Variants.LINE_BY_LINE
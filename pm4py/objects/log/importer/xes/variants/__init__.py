@@ -14,4 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, chunk_regex
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["iterparse", "line_by_line", "iterparse_mem_compressed", "chunk_regex"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
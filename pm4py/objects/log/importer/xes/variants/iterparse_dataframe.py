@@ -0,0 +1,724 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import gzip
+import logging
+import pkgutil
+import sys
+from array import array
+from enum import Enum
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import exec_utils, constants
+from pm4py.util import xes_constants
+from pm4py.util.dt_parsing import parser as dt_parser
+
+
+class Parameters(Enum):
+    TIMESTAMP_SORT = "timestamp_sort"
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    REVERSE_SORT = "reverse_sort"
+    MAX_TRACES = "max_traces"
+    SHOW_PROGRESS_BAR = "show_progress_bar"
+    DECOMPRESS_SERIALIZATION = "decompress_serialization"
+    ENCODING = "encoding"
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    CATEGORICAL_STRINGS = "categorical_strings"
+
+
+# ITERPARSE EVENTS
+_EVENT_END = 'end'
+_EVENT_START = 'start'
+
+# KINDS OF COLUMN BUFFERS
+_KIND_STRING = "string"
+_KIND_INT = "int"
+_KIND_FLOAT = "float"
+_KIND_BOOLEAN = "boolean"
+_KIND_DATE = "date"
+_KIND_OBJECT = "object"
+
+_ATTRIBUTE_TAGS = {xes_constants.TAG_STRING: _KIND_STRING, xes_constants.TAG_ID: _KIND_STRING,
+                   xes_constants.TAG_INT: _KIND_INT, xes_constants.TAG_FLOAT: _KIND_FLOAT,
+                   xes_constants.TAG_BOOLEAN: _KIND_BOOLEAN, xes_constants.TAG_DATE: _KIND_DATE}
+
+_NESTING_TAGS = {xes_constants.TAG_LIST, xes_constants.TAG_VALUES, xes_constants.TAG_CONTAINER}
+
+
+class ColumnBuffer(object):
+    """
+    Buffer collecting the (sparse) values of a single attribute.
+
+    Values are kept in typed arrays (row positions, integers, floats, booleans), strings are
+    stored as categorical codes and timestamps as raw strings that are parsed in a single vectorized
+    pass when the column is materialized. If values of different types are observed for the same
+    attribute, the buffer falls back to a list of Python objects.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.rows = array('q')
+        if kind == _KIND_STRING:
+            self.values = array('i')
+            self.categories = {}
+        elif kind == _KIND_INT:
+            self.values = array('q')
+        elif kind == _KIND_FLOAT:
+            self.values = array('d')
+        elif kind == _KIND_BOOLEAN:
+            self.values = array('b')
+        else:
+            self.values = []
+
+    def append(self, row, kind, value):
+        if kind != self.kind and self.kind != _KIND_OBJECT:
+            self.__to_object()
+        if self.kind == _KIND_STRING:
+            code = self.categories.get(value)
+            if code is None:
+                code = len(self.categories)
+                self.categories[value] = code
+            self.values.append(code)
+        elif self.kind == _KIND_OBJECT:
+            self.values.append(_to_python_value(kind, value))
+        else:
+            try:
+                self.values.append(value)
+            except OverflowError:
+                # integers not fitting in 64 bits
+                self.__to_object()
+                self.values.append(value)
+        self.rows.append(row)
+
+    def replace_last(self, value):
+        """
+        Replaces the last value of the buffer with a Python object (e.g., a nested attribute)
+        """
+        if self.kind != _KIND_OBJECT:
+            self.__to_object()
+        self.values[-1] = value
+
+    def __to_object(self):
+        if self.kind == _KIND_STRING:
+            categories = list(self.categories)
+            values = [categories[c] for c in self.values]
+        elif self.kind == _KIND_BOOLEAN:
+            values = [bool(v) for v in self.values]
+        else:
+            values = [_to_python_value(self.kind, v) for v in self.values]
+        self.kind = _KIND_OBJECT
+        self.values = values
+        self.categories = None
+
+    def to_array(self, length, categorical_strings=False):
+        """
+        Materializes the column as a NumPy array (or Pandas array) of the provided length
+
+        Parameters
+        -------------
+        length
+            Number of rows of the resulting column
+        categorical_strings
+            Provides string columns as Pandas categoricals instead of object arrays
+
+        Returns
+        -------------
+        column
+            Column values
+        """
+        rows = np.frombuffer(self.rows, dtype=np.int64) if self.rows else np.zeros(0, dtype=np.int64)
+        covered = np.zeros(length, dtype=bool)
+        covered[rows] = True
+        is_full = bool(covered.all())
+
+        if self.kind == _KIND_STRING:
+            codes = np.full(length, -1, dtype=np.int32)
+            codes[rows] = np.frombuffer(self.values, dtype=np.int32)
+            categories = np.empty(len(self.categories) + 1, dtype=object)
+            categories[:-1] = list(self.categories)
+            categories[-1] = np.nan
+            if categorical_strings:
+                return pd.Categorical.from_codes(codes, categories=categories[:-1])
+            # the code -1 selects the last category (NaN)
+            return categories[codes]
+        elif self.kind == _KIND_INT:
+            values = np.frombuffer(self.values, dtype=np.int64)
+            if is_full:
+                column = np.empty(length, dtype=np.int64)
+            else:
+                column = np.full(length, np.nan, dtype=np.float64)
+            column[rows] = values
+            return column
+        elif self.kind == _KIND_FLOAT:
+            column = np.full(length, np.nan, dtype=np.float64)
+            column[rows] = np.frombuffer(self.values, dtype=np.float64)
+            return column
+        elif self.kind == _KIND_BOOLEAN:
+            values = np.frombuffer(self.values, dtype=np.int8).astype(bool)
+            if is_full:
+                column = np.empty(length, dtype=bool)
+            else:
+                column = np.full(length, np.nan, dtype=object)
+            column[rows] = values
+            return column
+        elif self.kind == _KIND_DATE:
+            column = np.full(length, np.iinfo(np.int64).min, dtype=np.int64)
+            column[rows] = _parse_dates(self.values)
+            return pd.DatetimeIndex(column.view("datetime64[ns]")).tz_localize("UTC")
+        column = np.full(length, np.nan, dtype=object)
+        values = np.empty(len(self.values), dtype=object)
+        values[:] = self.values
+        column[rows] = values
+        return column
+
+
+def _to_python_value(kind, value):
+    if kind == _KIND_DATE:
+        try:
+            return dt_parser.get().apply(value)
+        except (TypeError, ValueError):
+            return None
+    elif kind == _KIND_BOOLEAN:
+        return bool(value)
+    return value
+
+
+def _parse_dates(values):
+    """
+    Parses a list of XES date strings in a single vectorized pass
+
+    Parameters
+    -------------
+    values
+        Date strings
+
+    Returns
+    -------------
+    int_values
+        Array of nanoseconds since the epoch (UTC); unparsable dates are mapped to NaT
+    """
+    values = np.asarray(values, dtype=object)
+    try:
+        parsed = pd.to_datetime(values, utc=True, format="ISO8601")
+    except (ValueError, TypeError):
+        parsed = pd.to_datetime(values, utc=True, errors="coerce")
+    return parsed.asi8
+
+
+def count_traces(context):
+    """
+    Efficiently count the number of traces of a XES event log
+
+    Parameters
+    -------------
+    context
+        XML iterparse context
+    Returns
+    -------------
+    num_traces
+        Number of traces of the XES log
+    """
+    num_traces = 0
+
+    for tree_event, elem in context:
+        if tree_event == _EVENT_START:  # starting to read
+            if elem.tag.endswith(xes_constants.TAG_TRACE):
+                num_traces = num_traces + 1
+        elem.clear()
+
+    del context
+
+    return num_traces
+
+
+def import_from_context(context, num_traces, parameters=None):
+    """
+    Import a XES log from an iterparse context directly into a Pandas dataframe.
+
+    The values of the attributes are streamed into per-column buffers, without building the intermediate
+    EventLog/EventStream objects. Nested attributes (lists and attributes with children) are materialized
+    as Python objects (dictionaries with the value and the children of the attribute) in object columns,
+    as done by the ITERPARSE importer followed by the conversion to dataframe.
+
+    Parameters
+    --------------
+    context
+        Iterparse context
+    num_traces
+        Number of traces of the XES log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    --------------
+    df
+        Pandas dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_no_traces_to_import = exec_utils.get_param_value(Parameters.MAX_TRACES, parameters, sys.maxsize)
+    timestamp_sort = exec_utils.get_param_value(Parameters.TIMESTAMP_SORT, parameters, False)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    reverse_sort = exec_utils.get_param_value(Parameters.REVERSE_SORT, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters,
+                                                       constants.CASE_ATTRIBUTE_PREFIX)
+    categorical_strings = exec_utils.get_param_value(Parameters.CATEGORICAL_STRINGS, parameters, False)
+
+    progress = None
+    if pkgutil.find_loader("tqdm") and show_progress_bar:
+        from tqdm.auto import tqdm
+        progress = tqdm(total=num_traces, desc="parsing log, completed traces :: ")
+
+    event_columns = {}
+    trace_columns = {}
+    # output columns, in order of first appearance
+    columns_order = {}
+    # for each event, the index of its trace
+    event_trace = array('q')
+
+    in_log = False
+    in_trace = False
+    in_event = False
+    # depth of the current element inside an attribute of the trace/event
+    attribute_depth = 0
+    # key, kind and value of the current attribute of the trace/event
+    top_key = top_kind = top_value = None
+    # attributes containing the current element, when the attribute of the trace/event has children
+    # (None for the skipped ones)
+    nested = None
+    num_events = 0
+    num_read_traces = 0
+    trace_keys = []
+
+    for tree_event, elem in context:
+        tag = elem.tag
+        if tag[0] == "{":
+            tag = tag.rpartition("}")[2]
+
+        if tree_event == _EVENT_START:
+            kind = _ATTRIBUTE_TAGS.get(tag)
+            if kind is not None or tag in _NESTING_TAGS:
+                if attribute_depth > 0:
+                    if nested is None:
+                        nested = [[top_key, top_kind, top_value, None] if top_kind is not None else None]
+                    nested.append(__start_child(elem, tag, kind, nested[-1]))
+                    attribute_depth += 1
+                    continue
+                top_kind = None
+                if tag == xes_constants.TAG_LIST and (in_event or in_trace):
+                    # lists have no value, and are stored when their end is reached
+                    top_key, top_kind, top_value = elem.get(xes_constants.KEY_KEY), _KIND_OBJECT, None
+                elif kind is not None and (in_event or in_trace):
+                    key = elem.get(xes_constants.KEY_KEY)
+                    value = elem.get(xes_constants.KEY_VALUE)
+                    if kind == _KIND_INT:
+                        try:
+                            value = int(value)
+                        except (TypeError, ValueError):
+                            logging.info("failed to parse int: " + str(value))
+                            kind = None
+                    elif kind == _KIND_FLOAT:
+                        try:
+                            value = float(value)
+                        except (TypeError, ValueError):
+                            logging.info("failed to parse float: " + str(value))
+                            kind = None
+                    elif kind == _KIND_BOOLEAN:
+                        value = str(value).lower() == "true"
+                    elif value is None or key is None:
+                        kind = None
+                    if kind is not None:
+                        if in_event:
+                            columns = event_columns
+                            row = num_events
+                        else:
+                            columns = trace_columns
+                            row = num_read_traces
+                            trace_keys.append(key)
+                        if key not in columns:
+                            columns[key] = ColumnBuffer(kind)
+                        columns[key].append(row, kind, value)
+                        if in_event and key not in columns_order:
+                            columns_order[key] = False
+                        top_key, top_kind, top_value = key, kind, value
+                if in_event or in_trace:
+                    attribute_depth += 1
+                continue
+
+            elif tag == xes_constants.TAG_EVENT:
+                if in_event:
+                    raise SyntaxError('file contains <event> in another <event> tag')
+                if in_trace:
+                    in_event = True
+                continue
+
+            elif tag == xes_constants.TAG_TRACE:
+                if num_read_traces >= max_no_traces_to_import:
+                    break
+                if in_trace:
+                    raise SyntaxError('file contains <trace> in another <trace> tag')
+                in_trace = True
+                continue
+
+            elif tag == xes_constants.TAG_LOG:
+                if in_log:
+                    raise SyntaxError('file contains > 1 <log> tags')
+                in_log = True
+                continue
+
+        elif tree_event == _EVENT_END:
+            elem.clear()
+            if elem.getprevious() is not None:
+                try:
+                    del elem.getparent()[0]
+                except TypeError:
+                    pass
+
+            if tag in _ATTRIBUTE_TAGS or tag in _NESTING_TAGS:
+                if attribute_depth > 0:
+                    attribute_depth -= 1
+                    is_list = attribute_depth == 0 and tag == xes_constants.TAG_LIST and top_kind is not None
+                    if nested is not None:
+                        attribute = nested.pop()
+                        if attribute is not None and tag != xes_constants.TAG_VALUES:
+                            value = attribute[2] if attribute[3] is None else {
+                                xes_constants.KEY_VALUE: _to_python_value(attribute[1], attribute[2]),
+                                xes_constants.KEY_CHILDREN: attribute[3]}
+                            if nested:
+                                if nested[-1] is not None:
+                                    if type(nested[-1][3]) is list:
+                                        nested[-1][3].append((attribute[0], value))
+                                    else:
+                                        nested[-1][3][attribute[0]] = value
+                            elif is_list:
+                                top_value = value
+                            else:
+                                # the attribute of the trace/event, already stored, is replaced by its children
+                                columns = event_columns if in_event else trace_columns
+                                columns[top_key].replace_last(value)
+                        if not nested:
+                            nested = None
+                    if is_list:
+                        # an empty list is a missing value of the column
+                        kind, value = (_KIND_OBJECT, top_value) if top_value is not None else (_KIND_FLOAT, np.nan)
+                        if in_event:
+                            columns = event_columns
+                            row = num_events
+                        else:
+                            columns = trace_columns
+                            row = num_read_traces
+                            trace_keys.append(top_key)
+                        if top_key not in columns:
+                            columns[top_key] = ColumnBuffer(kind)
+                        columns[top_key].append(row, kind, value)
+                        if in_event and top_key not in columns_order:
+                            columns_order[top_key] = False
+                continue
+
+            elif tag == xes_constants.TAG_EVENT:
+                if in_event:
+                    event_trace.append(num_read_traces)
+                    num_events = num_events + 1
+                    in_event = False
+                    if trace_keys:
+                        # case attributes are placed after the attributes of the first event that sees them
+                        for key in trace_keys:
+                            if (key, True) not in columns_order:
+                                columns_order[(key, True)] = True
+                        trace_keys = []
+                continue
+
+            elif tag == xes_constants.TAG_TRACE:
+                if trace_keys and num_events > 0 and event_trace[-1] == num_read_traces:
+                    for key in trace_keys:
+                        if (key, True) not in columns_order:
+                            columns_order[(key, True)] = True
+                trace_keys = []
+                num_read_traces = num_read_traces + 1
+                in_trace = False
+
+                if progress is not None:
+                    progress.update()
+                continue
+
+    # gracefully close progress bar
+    if progress is not None:
+        progress.close()
+    del context, progress
+
+    event_trace = np.frombuffer(event_trace, dtype=np.int64) if event_trace else np.zeros(0, dtype=np.int64)
+
+    data = {}
+    for key in columns_order:
+        if type(key) is tuple:
+            # case attributes are materialized at trace level and then broadcast to the events
+            trace_column = trace_columns[key[0]].to_array(num_read_traces, categorical_strings=categorical_strings)
+            if isinstance(trace_column, pd.DatetimeIndex):
+                data[case_attribute_prefix + key[0]] = trace_column.take(event_trace)
+            elif isinstance(trace_column, pd.Categorical):
+                data[case_attribute_prefix + key[0]] = pd.Categorical.from_codes(
+                    trace_column.codes.take(event_trace), categories=trace_column.categories)
+            else:
+                data[case_attribute_prefix + key[0]] = trace_column.take(event_trace)
+        else:
+            data[key] = event_columns[key].to_array(num_events, categorical_strings=categorical_strings)
+
+    df = pd.DataFrame(data, index=pd.RangeIndex(num_events))
+
+    if timestamp_sort and timestamp_key in df.columns:
+        df = __sort_timestamp(df, event_trace, timestamp_key, reverse_sort)
+
+    # sets the activity key as default classifier in the log's properties
+    df.attrs[constants.PARAMETER_CONSTANT_ACTIVITY_KEY] = xes_constants.DEFAULT_NAME_KEY
+    df.attrs[constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY] = xes_constants.DEFAULT_NAME_KEY
+    # sets the default timestamp key
+    df.attrs[constants.PARAMETER_CONSTANT_TIMESTAMP_KEY] = xes_constants.DEFAULT_TIMESTAMP_KEY
+    # sets the default resource key
+    df.attrs[constants.PARAMETER_CONSTANT_RESOURCE_KEY] = xes_constants.DEFAULT_RESOURCE_KEY
+    # sets the default transition key
+    df.attrs[constants.PARAMETER_CONSTANT_TRANSITION_KEY] = xes_constants.DEFAULT_TRANSITION_KEY
+    # sets the default group key
+    df.attrs[constants.PARAMETER_CONSTANT_GROUP_KEY] = xes_constants.DEFAULT_GROUP_KEY
+
+    return df
+
+
+def __start_child(elem, tag, kind, parent):
+    """
+    Reads a child of a nested attribute
+
+    Parameters
+    -------------
+    elem
+        Element of the child
+    tag
+        Tag of the element
+    kind
+        Kind of the value of the element (None for lists, values, containers)
+    parent
+        Parent attribute (list containing the key, the kind, the value and the children), None if skipped
+
+    Returns
+    -------------
+    attribute
+        Attribute of the child (the parent itself for the values of a list); None if the child (and its
+        children) should be skipped
+    """
+    if parent is None:
+        return None
+    if parent[3] is None:
+        # the children of the values of a list are kept as a list of (key, value) pairs
+        # (only when the values are the first child of the list)
+        parent[3] = [] if tag == xes_constants.TAG_VALUES else {}
+        if tag == xes_constants.TAG_VALUES:
+            return parent
+    key = elem.get(xes_constants.KEY_KEY)
+    value = elem.get(xes_constants.KEY_VALUE)
+    if tag == xes_constants.TAG_LIST:
+        return [key, _KIND_OBJECT, None, None]
+    elif kind is None:
+        # containers (and values not being the first child of a list) are not imported
+        return None
+    elif kind == _KIND_INT:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            logging.info("failed to parse int: " + str(value))
+            return None
+    elif kind == _KIND_FLOAT:
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            logging.info("failed to parse float: " + str(value))
+            return None
+    elif kind == _KIND_BOOLEAN:
+        value = str(value).lower() == "true"
+    elif kind == _KIND_DATE:
+        value = _to_python_value(kind, value)
+        if value is None:
+            logging.info("failed to parse date: " + str(elem.get(xes_constants.KEY_VALUE)))
+            return None
+        kind = _KIND_OBJECT
+    return [key, kind, value, None]
+
+
+def __sort_timestamp(df, event_trace, timestamp_key, reverse_sort):
+    """
+    Sorts the events inside each trace by timestamp, and the traces by the timestamp
+    of their first event (same semantics as the sorting of the EventLog object)
+    """
+    timestamps = df[timestamp_key].values.view(np.int64)
+    if reverse_sort:
+        timestamps = -timestamps
+    # stable sort of the events inside the traces
+    order = np.lexsort((timestamps, event_trace))
+    sorted_trace = event_trace[order]
+    sorted_timestamps = timestamps[order]
+    first_positions = np.r_[0, np.flatnonzero(sorted_trace[1:] != sorted_trace[:-1]) + 1] if len(order) else \
+        np.zeros(0, dtype=np.int64)
+    trace_lengths = np.diff(np.r_[first_positions, len(order)])
+    first_timestamps = np.repeat(sorted_timestamps[first_positions], trace_lengths)
+    order = order[np.lexsort((np.arange(len(order)), first_timestamps))]
+    return df.take(order).reset_index(drop=True)
+
+
+def apply(filename, parameters=None):
+    """
+    Imports an XES file directly into a Pandas dataframe
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort log by timestamp
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the log by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the case attributes' columns (default: case:)
+            Parameters.CATEGORICAL_STRINGS -> provides the string attributes as categorical columns (default: False)
+
+    Returns
+    -------
+    df
+        Pandas dataframe
+    """
+    return import_log(filename, parameters)
+
+
+def import_log(filename, parameters=None):
+    """
+    Imports an XES file directly into a Pandas dataframe
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort log by timestamp
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the log by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the case attributes' columns (default: case:)
+            Parameters.CATEGORICAL_STRINGS -> provides the string attributes as categorical columns (default: False)
+
+    Returns
+    -------
+    df
+        Pandas dataframe
+    """
+    from lxml import etree
+
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
+    is_compressed = filename.lower().endswith(".gz")
+
+    if pkgutil.find_loader("tqdm") and show_progress_bar:
+        if is_compressed:
+            f = gzip.open(filename, "rb")
+        else:
+            f = open(filename, "rb")
+        context = etree.iterparse(f, events=[_EVENT_START, _EVENT_END], encoding=encoding)
+        num_traces = count_traces(context)
+        f.close()
+    else:
+        # avoid the iteration to calculate the number of traces is "tqdm" is not used
+        num_traces = 0
+
+    if is_compressed:
+        f = gzip.open(filename, "rb")
+    else:
+        f = open(filename, "rb")
+    context = etree.iterparse(f, events=[_EVENT_START, _EVENT_END], encoding=encoding)
+
+    try:
+        return import_from_context(context, num_traces, parameters=parameters)
+    finally:
+        f.close()
+
+
+def import_from_string(log_string, parameters=None):
+    """
+    Deserialize a text/binary string representing a XES log directly into a Pandas dataframe
+
+    Parameters
+    -----------
+    log_string
+        String that contains the XES
+    parameters
+        Parameters of the algorithm, including
+            Parameters.TIMESTAMP_SORT -> Specify if we should sort log by timestamp
+            Parameters.TIMESTAMP_KEY -> If sort is enabled, then sort the log by using this key
+            Parameters.REVERSE_SORT -> Specify in which direction the log should be sorted
+            Parameters.MAX_TRACES -> Specify the maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.SHOW_PROGRESS_BAR -> Enables/disables the progress bar (default: True)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.DECOMPRESS_SERIALIZATION -> the string is a gzip-compressed serialization (default: False)
+
+    Returns
+    -----------
+    df
+        Pandas dataframe
+    """
+    from lxml import etree
+
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
+    decompress_serialization = exec_utils.get_param_value(Parameters.DECOMPRESS_SERIALIZATION, parameters, False)
+
+    if type(log_string) is str:
+        log_string = log_string.encode(constants.DEFAULT_ENCODING)
+
+    if pkgutil.find_loader("tqdm") and show_progress_bar:
+        # first iteration: count the number of traces
+        b = BytesIO(log_string)
+        if decompress_serialization:
+            s = gzip.GzipFile(fileobj=b, mode="rb")
+        else:
+            s = b
+        context = etree.iterparse(s, events=[_EVENT_START, _EVENT_END], encoding=encoding)
+        num_traces = count_traces(context)
+    else:
+        # avoid the iteration to calculate the number of traces is "tqdm" is not used
+        num_traces = 0
+
+    # second iteration: actually read the content
+    b = BytesIO(log_string)
+    if decompress_serialization:
+        s = gzip.GzipFile(fileobj=b, mode="rb")
+    else:
+        s = b
+    context = etree.iterparse(s, events=[_EVENT_START, _EVENT_END], encoding=encoding)
+
+    return import_from_context(context, num_traces, parameters=parameters)
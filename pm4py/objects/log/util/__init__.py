@@ -14,11 +14,16 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.log.util import insert_classifier, log, sampling, \
-    sorting, index_attribute, get_class_representation, get_prefixes, \
-    get_log_encoded, interval_lifecycle, basic_filter, \
-    filtering_utils, split_train_test, xes, artificial
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "insert_classifier", "log", "sampling", "sorting", "index_attribute", "get_class_representation",
+    "get_prefixes", "get_log_encoded", "interval_lifecycle", "basic_filter", "filtering_utils",
+    "split_train_test", "xes", "artificial", "log_index"
+]
 
 if pkgutil.find_loader("pandas"):
-    from pm4py.objects.log.util import dataframe_utils
+    _submodules.append("dataframe_utils")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -0,0 +1,365 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Index of the cases of a dataframe (integer codes of the cases and of the activities, order of the events,
+boundaries of the cases, variants), computed once and reused by the pandas statistics, filters and discovery
+algorithms applied to the same dataframe.
+
+The index is opt-in: it is computed and attached to a dataframe with attach(), and it is used by the algorithms
+(through get()) only for the dataframe to which it is attached, and only for the same case identifier, activity
+and timestamp columns. The index is kept in a registry (not in the dataframe), and it is discarded when the
+dataframe is garbage collected. A change of the dataframe is detected (in constant time) by checking its length,
+its columns, the types of the indexed columns and the identity of their arrays of values, hence the replacement
+of a column (or of the dataframe) is detected. The values changed in place (e.g. with df.loc[...] = ...) are
+not detected: after such changes, invalidate() should be called to discard the index.
+
+The events are indexed in the order given by the case identifier and the timestamp (the order of the rows
+is kept among the events of a case having the same timestamp), as in a dataframe prepared with format_dataframe.
+The events without case identifier are placed at the end, and do not belong to any case. The algorithms which
+consider the events in the order of the rows use the index only when, in every case, the order of the rows
+is the order of the timestamps (rows_in_order).
+"""
+
+import weakref
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Tuple, List
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import constants, xes_constants, exec_utils
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+# indexes attached to the dataframes (id of the dataframe => (columns) => index)
+_registry = {}
+
+
+def _factorize(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorizes a column (codes sorted according to the values when possible; missing values get the code -1).
+    The strings are sorted as a NumPy unicode array, which is much faster than sorting Python objects
+    """
+    codes, uniques = pd.factorize(values)
+    codes, uniques = codes.astype(np.int64, copy=False), np.asarray(uniques)
+    if len(uniques) > 1:
+        try:
+            keys = uniques.astype(str) if pd.api.types.infer_dtype(uniques, skipna=False) == "string" else uniques
+            order = np.argsort(keys, kind="stable")
+        except TypeError:
+            return codes, uniques
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        codes = np.where(codes >= 0, ranks[codes], -1)
+        uniques = uniques[order]
+    return codes, uniques
+
+
+def _timestamps_to_ns(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the nanoseconds since the epoch, and the mask of the missing values, of a timestamp column
+    """
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+    values = series.to_numpy(dtype="datetime64[ns]")
+    return values.view(np.int64), np.isnat(values)
+
+
+def _column_identity(values: pd.Series) -> int:
+    """
+    Gets the identity of the array of values of a column (the address of its data, when available)
+    """
+    array = values.array
+    for attribute in ("_ndarray", "_codes"):
+        if hasattr(array, attribute):
+            array = getattr(array, attribute)
+            break
+    if isinstance(array, np.ndarray):
+        return array.__array_interface__["data"][0]
+    return id(array)
+
+
+def _fingerprint(df: pd.DataFrame, columns: Tuple[str, ...]) -> Tuple:
+    present = [c for c in columns if c in df.columns]
+    return len(df), tuple(df.columns), tuple(str(df[c].dtype) for c in present), tuple(
+        _column_identity(df[c]) for c in present)
+
+
+class EventLogIndex(object):
+    def __init__(self, df: pd.DataFrame, case_id_key: str, activity_key: str, timestamp_key: Optional[str]):
+        """
+        Computes the index of a dataframe
+
+        Parameters
+        ---------------
+        df
+            Dataframe
+        case_id_key
+            Column of the case identifier
+        activity_key
+            Column of the activity
+        timestamp_key
+            Column of the timestamp (if it is not in the dataframe, or it does not contain datetimes, the events
+            of every case are indexed in the order of the rows)
+        """
+        self.case_id_key = case_id_key
+        self.activity_key = activity_key
+        self.timestamp_key = timestamp_key
+        # computed when the index is attached to the dataframe
+        self.fingerprint = None
+
+        row_case_codes, self.case_ids = _factorize(df[case_id_key])
+        row_activity_codes, self.activities = _factorize(df[activity_key])
+        sort_case_codes = np.where(row_case_codes >= 0, row_case_codes, np.iinfo(np.int64).max)
+        if timestamp_key in df.columns and pd.api.types.is_datetime64_any_dtype(df[timestamp_key]):
+            ts_ns, ts_nat = _timestamps_to_ns(df[timestamp_key])
+            sort_ts = np.where(ts_nat, np.iinfo(np.int64).max, ts_ns)
+            # permutation of the rows sorting them by case and timestamp (the missing timestamps at the end),
+            # not computed when the rows are already sorted (e.g. after format_dataframe)
+            same_case = sort_case_codes[1:] == sort_case_codes[:-1]
+            if np.all(sort_case_codes[1:] >= sort_case_codes[:-1]) and np.all(
+                    sort_ts[1:][same_case] >= sort_ts[:-1][same_case]):
+                self.order = np.arange(len(df))
+            else:
+                self.order = np.lexsort((sort_ts, sort_case_codes))
+            self.timestamps_ns, self.timestamps_nat = ts_ns[self.order], ts_nat[self.order]
+        else:
+            self.order = np.argsort(sort_case_codes, kind="stable")
+            self.timestamps_ns, self.timestamps_nat = None, None
+
+        # code of the case of every row of the dataframe
+        self.row_case_codes = row_case_codes
+        # tells if, in every case, the events sorted by timestamp are in the order of the rows
+        same_case = (row_case_codes[self.order[1:]] == row_case_codes[self.order[:-1]]) & (
+                row_case_codes[self.order[1:]] >= 0)
+        self.rows_in_order = bool(np.all(self.order[1:][same_case] > self.order[:-1][same_case]))
+        # codes of the cases and of the activities of the events (sorted by case and timestamp)
+        self.case_codes = row_case_codes[self.order]
+        self.activity_codes = row_activity_codes[self.order]
+        # the events of the case c are the events case_starts[c]:case_starts[c+1]
+        self.case_starts = np.zeros(len(self.case_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_case_codes[row_case_codes >= 0], minlength=len(self.case_ids)),
+                  out=self.case_starts[1:])
+        self._variants = None
+        self._successions = {}
+
+    @property
+    def columns(self) -> Tuple[str, str, str]:
+        return self.case_id_key, self.activity_key, self.timestamp_key
+
+    @property
+    def num_cases(self) -> int:
+        return len(self.case_ids)
+
+    def is_valid(self, df: pd.DataFrame) -> bool:
+        """
+        Checks that the dataframe has not changed since the index has been attached to it (the values changed
+        in place are not detected)
+        """
+        return self.fingerprint is not None and _fingerprint(df, self.columns) == self.fingerprint
+
+    def get_first_events(self) -> np.ndarray:
+        """
+        Gets the position (in the sorted events) of the first event of every case
+        """
+        return self.case_starts[:-1]
+
+    def get_last_events(self) -> np.ndarray:
+        """
+        Gets the position (in the sorted events) of the last event of every case
+        """
+        return self.case_starts[1:] - 1
+
+    def get_last_timestamped_events(self) -> np.ndarray:
+        """
+        Gets the position (in the sorted events) of the last event having a timestamp of every case
+        (the first event, for the cases without timestamps)
+        """
+        valid = (self.case_codes >= 0) & ~self.timestamps_nat
+        counts = np.bincount(self.case_codes[valid], minlength=self.num_cases)
+        return self.case_starts[:-1] + np.maximum(counts, 1) - 1
+
+    def count_activities(self, events: np.ndarray) -> Dict[Any, int]:
+        """
+        Counts the activities of the given events (positions in the sorted events), by decreasing count
+        """
+        codes = self.activity_codes[events]
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.activities))
+        present = np.flatnonzero(counts)
+        present = present[np.argsort(-counts[present], kind="stable")]
+        return dict(zip(self.activities[present].tolist(), counts[present].tolist()))
+
+    def get_first_rows(self) -> np.ndarray:
+        """
+        Gets the position (in the dataframe) of the first row of every case
+        """
+        if self.num_cases == 0:
+            return np.zeros(0, dtype=np.int64)
+        return np.minimum.reduceat(self.order[:self.case_starts[-1]], self.case_starts[:-1])
+
+    def get_variants(self) -> Tuple[np.ndarray, List[Tuple[Any, ...]]]:
+        """
+        Gets the variants of the cases (computed once)
+
+        Returns
+        ---------------
+        case_variants
+            Identifier of the variant of every case
+        variants
+            Variants (tuples of activities), indexed by their identifier
+        """
+        if self._variants is None:
+            from pm4py.objects.log.util import pandas_numpy_variants
+            case_variants, representatives = pandas_numpy_variants.encode_variants(self.activity_codes,
+                                                                                   self.case_starts)
+            variants = pandas_numpy_variants.decode_variants(self.activity_codes, self.case_starts, representatives,
+                                                             self.activities)
+            self._variants = (case_variants, variants)
+        return self._variants
+
+    def get_variants_count(self) -> Dict[Tuple[Any, ...], int]:
+        """
+        Gets the dictionary associating to every variant the number of cases
+        """
+        case_variants, variants = self.get_variants()
+        counts = np.bincount(case_variants, minlength=len(variants)).tolist()
+        return {variants[i]: counts[i] for i in range(len(variants))}
+
+    def get_successions(self, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts the successions of length consecutive events of the same case (computed once for every length)
+
+        Parameters
+        ---------------
+        length
+            Length of the successions
+
+        Returns
+        ---------------
+        successions
+            Codes of the activities of the distinct successions (array of shape (number of successions, length),
+            sorted; -1 for the events without activity)
+        counts
+            Number of occurrences of every succession
+        """
+        if length not in self._successions:
+            n = int(self.case_starts[-1])
+            if n >= length:
+                # the events are grouped by case: the first and the last event of a succession belong to the same case
+                starts = np.flatnonzero(self.case_codes[:n - length + 1] == self.case_codes[length - 1:n])
+            else:
+                starts = np.zeros(0, dtype=np.int64)
+            codes = np.stack([self.activity_codes[starts + k] for k in range(length)], axis=1).astype(np.int64)
+            base = len(self.activities) + 1
+            if base ** length < np.iinfo(np.int64).max:
+                keys = np.zeros(len(starts), dtype=np.int64)
+                for k in range(length):
+                    keys = keys * base + (codes[:, k] + 1)
+                keys, counts = np.unique(keys, return_counts=True)
+                successions = np.zeros((len(keys), length), dtype=np.int64)
+                for k in range(length - 1, -1, -1):
+                    successions[:, k] = keys % base - 1
+                    keys = keys // base
+            else:
+                successions, counts = np.unique(codes, axis=0, return_counts=True)
+            self._successions[length] = (successions, counts)
+        return self._successions[length]
+
+
+def __get_columns(parameters: Optional[Dict[Union[str, Parameters], Any]]) -> Tuple[str, str, str]:
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    return case_id_key, activity_key, timestamp_key
+
+
+def attach(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> EventLogIndex:
+    """
+    Computes the index of a dataframe (if a valid one is not already attached) and attaches it to the dataframe,
+    so that it is used by the following computations on the same dataframe
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    parameters
+        Parameters, including:
+        - Parameters.CASE_ID_KEY => the column of the case identifier (default: case:concept:name)
+        - Parameters.ACTIVITY_KEY => the column of the activity (default: concept:name)
+        - Parameters.TIMESTAMP_KEY => the column of the timestamp (default: time:timestamp)
+
+    Returns
+    ---------------
+    index
+        Index of the dataframe
+    """
+    index = get(df, parameters=parameters)
+    if index is None:
+        columns = __get_columns(parameters)
+        index = EventLogIndex(df, *columns)
+        index.fingerprint = _fingerprint(df, columns)
+        key = id(df)
+        if key not in _registry:
+            _registry[key] = {}
+            weakref.finalize(df, _registry.pop, key, None)
+        _registry[key][columns] = index
+    return index
+
+
+def get(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Optional[EventLogIndex]:
+    """
+    Gets the index attached to the dataframe for the given columns (None if no valid index is attached)
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    parameters
+        Parameters, including:
+        - Parameters.CASE_ID_KEY => the column of the case identifier (default: case:concept:name)
+        - Parameters.ACTIVITY_KEY => the column of the activity (default: concept:name)
+        - Parameters.TIMESTAMP_KEY => the column of the timestamp (default: time:timestamp)
+
+    Returns
+    ---------------
+    index
+        Index of the dataframe (or None)
+    """
+    indexes = _registry.get(id(df))
+    if not indexes or not isinstance(df, pd.DataFrame):
+        return None
+    columns = __get_columns(parameters)
+    index = indexes.get(columns)
+    if index is not None and not index.is_valid(df):
+        del indexes[columns]
+        index = None
+    return index
+
+
+def invalidate(df: pd.DataFrame):
+    """
+    Discards the indexes attached to the dataframe (to be called after changing in place the values of the
+    dataframe)
+    """
+    if id(df) in _registry:
+        _registry[id(df)].clear()
@@ -16,10 +16,10 @@
 '''
 import pandas as pd
 from enum import Enum
-from pm4py.util import constants, xes_constants, pandas_utils, exec_utils
+from typing import Tuple, List, Any
+from pm4py.util import constants, xes_constants, exec_utils
 import numpy as np
-from collections import Counter
-from pm4py.util import variants_util
+from pm4py.objects.log.util import log_index
 
 
 class Parameters(Enum):
@@ -29,6 +29,121 @@ class Parameters(Enum):
     INDEX_KEY = "index_key"
 
 
+# multipliers of the polynomial hash of the sequences of activity codes (arithmetic modulo 2^64)
+HASH_BASE = 0x100000001B3
+HASH_LENGTH = 0x9E3779B97F4A7C15
+
+
+def encode_variants(activity_codes: np.ndarray, case_starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the variant of every case from the codes of the activities of the events, grouped by case
+    (the events of the case c are the events case_starts[c]:case_starts[c+1], and every case has at least one event).
+
+    The sequences of codes of the cases are hashed (vectorially) with a polynomial hash; then, every case is compared
+    to the first case having the same hash, and the (rare) cases colliding with a different sequence are resolved
+    separately.
+
+    Parameters
+    ------------------
+    activity_codes
+        Codes of the activities of the events
+    case_starts
+        Position of the first event of every case (followed by the number of events)
+
+    Returns
+    ------------------
+    case_variants
+        Identifier of the variant of every case (the variants are numbered in the order of their first case)
+    representatives
+        First case of every variant
+    """
+    num_cases = len(case_starts) - 1
+    if num_cases <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    starts = case_starts[:-1]
+    codes = activity_codes[:case_starts[-1]].astype(np.int64, copy=False)
+    lengths = np.diff(case_starts)
+    event_cases = np.repeat(np.arange(num_cases), lengths)
+    positions = np.arange(len(codes)) - starts[event_cases]
+
+    powers = np.ones(int(lengths.max()), dtype=np.uint64)
+    np.cumprod(np.full(len(powers) - 1, HASH_BASE, dtype=np.uint64), out=powers[1:])
+    hashes = np.add.reduceat((codes + 1).astype(np.uint64) * powers[positions], starts)
+    hashes += lengths.astype(np.uint64) * np.uint64(HASH_LENGTH)
+    case_variants = pd.factorize(hashes)[0].astype(np.int64, copy=False)
+    representatives = np.unique(case_variants, return_index=True)[1]
+
+    # compares the events of every case with the corresponding events of the first case having the same hash
+    rep_cases = representatives[case_variants]
+    rep_lengths = lengths[rep_cases]
+    rep_events = case_starts[rep_cases][event_cases] + np.minimum(positions, rep_lengths[event_cases] - 1)
+    collisions = (lengths != rep_lengths) | np.logical_or.reduceat(codes != codes[rep_events], starts)
+    if collisions.any():
+        resolved = {}
+        for c in np.flatnonzero(collisions).tolist():
+            variant = tuple(codes[case_starts[c]:case_starts[c + 1]].tolist())
+            if variant not in resolved:
+                resolved[variant] = len(representatives) + len(resolved)
+            case_variants[c] = resolved[variant]
+        case_variants = pd.factorize(case_variants)[0].astype(np.int64, copy=False)
+        representatives = np.unique(case_variants, return_index=True)[1]
+
+    return case_variants, representatives
+
+
+def decode_variants(activity_codes: np.ndarray, case_starts: np.ndarray, representatives: np.ndarray,
+                    activities: np.ndarray) -> List[Tuple[Any, ...]]:
+    """
+    Decodes the variants (from the events of their first case) into tuples of activities
+
+    Parameters
+    ------------------
+    activity_codes
+        Codes of the activities of the events
+    case_starts
+        Position of the first event of every case (followed by the number of events)
+    representatives
+        First case of every variant
+    activities
+        Activities, indexed by their code (the code -1 is associated to a missing activity)
+
+    Returns
+    ------------------
+    variants
+        Variants (tuples of activities), indexed by their identifier
+    """
+    activities = np.append(np.asarray(activities, dtype=object), np.nan)
+    return [tuple(activities[activity_codes[case_starts[c]:case_starts[c + 1]]].tolist()) for c in
+            representatives.tolist()]
+
+
+def get_variants_table(dataframe: pd.DataFrame, parameters=None) -> Tuple[np.ndarray, np.ndarray, List[Tuple[Any, ...]]]:
+    """
+    Gets the variant of every case of a Pandas dataframe, along with the table of the variants
+
+    Parameters
+    ------------------
+    dataframe
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ACTIVITY_KEY => the activity
+        - Parameters.TIMESTAMP_KEY => the timestamp (of the index attached to the dataframe)
+
+    Returns
+    ------------------
+    cases
+        Identifiers of the cases (sorted)
+    case_variants
+        Identifier of the variant of every case
+    variants
+        Variants (tuples of activities), indexed by their identifier
+    """
+    index = __get_index(dataframe, parameters)
+    return (index.case_ids,) + index.get_variants()
+
+
 def apply(dataframe: pd.DataFrame, parameters=None):
     """
     Returns the variants from a Pandas dataframe (through Numpy)
@@ -41,7 +156,7 @@ def apply(dataframe: pd.DataFrame, parameters=None):
         Parameters of the algorithm, including:
         - Parameters.CASE_ID_KEY => the case identifier
         - Parameters.ACTIVITY_KEY => the activity
-        - Parameters.TIMESTAMP_KEY => the timestamp
+        - Parameters.TIMESTAMP_KEY => the timestamp (of the index attached to the dataframe)
         - Parameters.INDEX_KEY => the index
 
     Returns
@@ -49,31 +164,21 @@ def apply(dataframe: pd.DataFrame, parameters=None):
     variants_dict
         Dictionary associating to each variant the number of occurrences in the dataframe
     """
-    if parameters is None:
-        parameters = {}
-
-    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
-    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
-    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
-    index_key = exec_utils.get_param_value(Parameters.INDEX_KEY, parameters, constants.DEFAULT_INDEX_KEY)
-
-    if not (hasattr(dataframe, "attrs") and dataframe.attrs):
-        # dataframe has not been initialized through format_dataframe
-        dataframe = pandas_utils.insert_index(dataframe, index_key)
-        dataframe.sort_values([case_id_key, timestamp_key, index_key])
-
-    cases = dataframe[case_id_key].to_numpy()
-    activities = dataframe[activity_key].to_numpy()
+    return __get_index(dataframe, parameters).get_variants_count()
 
-    c_unq, c_ind, c_counts = np.unique(cases, return_index=True, return_counts=True)
-    variants = Counter()
 
-    for i in range(len(c_ind)):
-        si = c_ind[i]
-        ei = si + c_counts[i]
-        acts = tuple(activities[si:ei])
-        variants[acts] += 1
-
-    variants = {x: y for x, y in variants.items()}
+def __get_index(dataframe: pd.DataFrame, parameters) -> log_index.EventLogIndex:
+    """
+    Gets the index attached to the dataframe (when the rows of every case are in the order of the timestamps),
+    or computes a (not attached) index of the dataframe keeping the order of the rows among the events of a case.
+    The cases are sorted by their identifier
+    """
+    if parameters is None:
+        parameters = {}
 
-    return variants
+    index = log_index.get(dataframe, parameters=parameters)
+    if index is None or not index.rows_in_order:
+        case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+        index = log_index.EventLogIndex(dataframe, case_id_key, activity_key, None)
+    return index
@@ -14,8 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.ocel.exporter import util, csv, jsonocel
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["util", "csv", "jsonocel"]
 
 if pkgutil.find_loader("lxml"):
-    from pm4py.objects.ocel.exporter import xmlocel
+    _submodules.append("xmlocel")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
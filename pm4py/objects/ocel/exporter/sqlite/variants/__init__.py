@@ -14,5 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.util.lazy_loading import lazy_submodules
 
-from pm4py.objects.ocel.exporter.sqlite.variants import pandas_exporter
+_submodules = ["pandas_exporter"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
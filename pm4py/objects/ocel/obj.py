@@ -18,6 +18,7 @@ from enum import Enum
 
 from pm4py.objects.ocel import constants
 from pm4py.util import exec_utils
+import numpy as np
 import pandas as pd
 from copy import copy, deepcopy
 
@@ -69,13 +70,22 @@ class OCEL(object):
         Transforms the current OCEL data structure into a Pandas dataframe containing the events with their
         attributes and the related objects per object type.
         """
-        object_types = self.relations[self.object_type_column].unique()
-        table = self.events.copy().set_index(self.event_id_column)
-        for ot in object_types:
-            table[ot_prefix + ot] = \
-                self.relations[self.relations[self.object_type_column] == ot].groupby(self.event_id_column)[
-                    self.object_id_column].apply(list)
-        table = table.reset_index()
+        table = self.events.set_index(self.event_id_column).reset_index()
+        # a single pass over the relations, grouped by object type and event (keeping the order of the relations)
+        ot_codes, object_types = pd.factorize(self.relations[self.object_type_column])
+        ev_positions = pd.Index(table[self.event_id_column]).get_indexer(self.relations[self.event_id_column])
+        order = np.lexsort((ev_positions, ot_codes))
+        order = order[ev_positions[order] >= 0]
+        object_ids = self.relations[self.object_id_column].to_numpy()[order].tolist()
+        keys = ot_codes[order].astype(np.int64) * (len(table) + 1) + ev_positions[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) > 0 else np.empty(0, dtype=np.int64)
+        ends = np.r_[starts[1:], len(keys)]
+        groups_ot = ot_codes[order][starts]
+        groups_ev = ev_positions[order][starts]
+        groups = [object_ids[i:j] for i, j in zip(starts.tolist(), ends.tolist())]
+        for index, ot in enumerate(object_types):
+            lower, upper = np.searchsorted(groups_ot, [index, index + 1])
+            table[ot_prefix + ot] = pd.Series(groups[lower:upper], index=groups_ev[lower:upper], dtype=object)
         return table
 
     def get_summary(self) -> str:
@@ -24,6 +24,8 @@ import pandas as pd
 
 class Parameters(Enum):
     OCEL_TYPE_PREFIX = ocel_constants.PARAM_OBJECT_TYPE_PREFIX_EXTENDED
+    CHUNK_SIZE = "chunk_size"
+    YIELD_CHUNKS = "yield_chunks"
 
 
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
@@ -37,19 +39,36 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     parameters
         Parameters of the method, including:
         - Parameters.OCEL_TYPE_PREFIX => the prefix of the object types in the OCEL (default: ocel:type)
+        - Parameters.CHUNK_SIZE => number of events converted together from the columns of the extended table
+        (default: 10000)
+        - Parameters.YIELD_CHUNKS => if True, yields the lists of the events of every chunk (default: False)
 
     Returns
     ----------------
     yielded event
-        The events of the OCEL, one by one.
+        The events of the OCEL, one by one (or the lists of events of every chunk). Every event is a dictionary
+        of its (non-missing) attributes, along with the lists of the related objects per object type.
     """
     if parameters is None:
         parameters = {}
 
     ot_prefix = exec_utils.get_param_value(Parameters.OCEL_TYPE_PREFIX, parameters,
                                            ocel_constants.DEFAULT_OBJECT_TYPE_PREFIX_EXTENDED)
+    chunk_size = max(1, exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 10000))
+    yield_chunks = exec_utils.get_param_value(Parameters.YIELD_CHUNKS, parameters, False)
 
     ext_table = ocel.get_extended_table(ot_prefix)
+    columns = list(ext_table.columns)
 
-    for k, ev in ext_table.iterrows():
-        yield {x: y for x, y in dict(ev).items() if isinstance(y, list) or not pd.isna(y)}
+    for start in range(0, len(ext_table), chunk_size):
+        chunk = ext_table.iloc[start:start + chunk_size]
+        # the values are boxed column by column (keeping the timestamps), and the missing values are skipped
+        values = [chunk[c].tolist() for c in columns]
+        present = [(~pd.isna(chunk[c].to_numpy())).tolist() for c in columns]
+        events = []
+        for i in range(len(chunk)):
+            events.append({c: v[i] for c, v, p in zip(columns, values, present) if p[i]})
+        if yield_chunks:
+            yield events
+        else:
+            yield from events
@@ -14,5 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.util.lazy_loading import lazy_submodules
 
-from pm4py.objects.petri_net.saw_net import obj, semantics, convert
+_submodules = ["obj", "semantics", "convert"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
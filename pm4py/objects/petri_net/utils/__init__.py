@@ -14,6 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.petri_net.utils import align_utils, check_soundness, consumption_matrix, decomposition, \
-    embed_stochastic_map, explore_path, final_marking, incidence_matrix, initial_marking, performance_map, petri_utils, \
-    projection, reachability_graph, reduction, synchronous_product
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "align_utils", "check_soundness", "compiled_net", "consumption_matrix", "decomposition", "embed_stochastic_map",
+    "explore_path", "final_marking", "incidence_matrix", "initial_marking", "performance_map", "petri_utils",
+    "projection", "reachability_graph", "reduction", "synchronous_product"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -0,0 +1,220 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Compiled (integer-indexed) representation of a Petri net, to be used by the algorithms that fire many transitions.
+
+The places and the transitions are numbered. A marking is a tuple of integers (the number of tokens
+in every place), which is hashable and cheap to copy. The pre/post incidence of the transitions is stored
+both as dense NumPy matrices (for vectorized computations) and as tuples of (place, weight) couples
+(for the firing of single transitions).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils import petri_utils
+
+CompiledMarking = Tuple[int, ...]
+
+
+class CompiledPetriNet(object):
+
+    def __init__(self, net: PetriNet, initial_marking: Optional[Marking] = None,
+                 final_marking: Optional[Marking] = None):
+        """
+        Constructor
+
+        Parameters
+        --------------
+        net
+            Petri net
+        initial_marking
+            (optional) initial marking
+        final_marking
+            (optional) final marking
+        """
+        self.net = net
+        self.places = sorted(net.places, key=lambda x: (str(x.name), id(x)))
+        self.transitions = sorted(net.transitions, key=lambda x: (str(x.name), id(x)))
+        self.place_indices = {p: i for i, p in enumerate(self.places)}
+        self.transition_indices = {t: i for i, t in enumerate(self.transitions)}
+
+        self.pre = np.zeros((len(self.transitions), len(self.places)), dtype=np.int64)
+        self.post = np.zeros((len(self.transitions), len(self.places)), dtype=np.int64)
+        for arc in net.arcs:
+            if arc.source in self.place_indices:
+                self.pre[self.transition_indices[arc.target], self.place_indices[arc.source]] += arc.weight
+            else:
+                self.post[self.transition_indices[arc.source], self.place_indices[arc.target]] += arc.weight
+        self.incidence = self.post - self.pre
+
+        # sparse representation of the pre-set (places and weights) and of the effect of every transition
+        self.pre_sets = tuple(tuple((p, int(w)) for p, w in enumerate(row) if w > 0) for row in self.pre)
+        self.deltas = tuple(tuple((p, int(w)) for p, w in enumerate(row) if w != 0) for row in self.incidence)
+        # transitions consuming from every place, and transitions with an empty pre-set (always enabled)
+        self.consumers = tuple(tuple(int(t) for t in np.flatnonzero(self.pre[:, p])) for p in range(len(self.places)))
+        self.source_transitions = tuple(t for t in range(len(self.transitions)) if not self.pre_sets[t])
+
+        self.initial_marking = self.encode_marking(initial_marking) if initial_marking is not None else None
+        self.final_marking = self.encode_marking(final_marking) if final_marking is not None else None
+
+    def encode_marking(self, marking: Marking) -> CompiledMarking:
+        """
+        Transforms a marking of the Petri net into a tuple containing the number of tokens of every place
+        """
+        m = [0] * len(self.places)
+        for p, n in marking.items():
+            m[self.place_indices[p]] = n
+        return tuple(m)
+
+    def decode_marking(self, marking: CompiledMarking) -> Marking:
+        """
+        Transforms a tuple containing the number of tokens of every place into a marking of the Petri net
+        """
+        m = Marking()
+        for i, n in enumerate(marking):
+            if n > 0:
+                m[self.places[i]] = n
+        return m
+
+    def is_enabled(self, transition: int, marking: CompiledMarking) -> bool:
+        """
+        Checks if the transition (index) is enabled in the given marking
+        """
+        for p, w in self.pre_sets[transition]:
+            if marking[p] < w:
+                return False
+        return True
+
+    def enabled_transitions(self, marking: CompiledMarking) -> List[int]:
+        """
+        Gets the (sorted) indexes of the transitions enabled in the given marking. Only the transitions consuming
+        from a marked place (and the transitions with an empty pre-set) are checked.
+        """
+        candidates = set(self.source_transitions)
+        for p, n in enumerate(marking):
+            if n > 0:
+                candidates.update(self.consumers[p])
+        return [t for t in sorted(candidates) if self.is_enabled(t, marking)]
+
+    def fire(self, transition: int, marking: CompiledMarking) -> CompiledMarking:
+        """
+        Fires a transition (index) in the given marking, returning the reached marking.
+        The method does not check if the transition is enabled (this should be done by the invoking algorithm).
+        """
+        m = list(marking)
+        for p, w in self.deltas[transition]:
+            m[p] += w
+        return tuple(m)
+
+    def enabled_mask(self, markings: Sequence[CompiledMarking]) -> np.ndarray:
+        """
+        Computes (vectorized) which transitions are enabled in a batch of markings
+
+        Parameters
+        --------------
+        markings
+            Markings (or a NumPy matrix having a row per marking)
+
+        Returns
+        --------------
+        mask
+            Boolean matrix (markings x transitions) which is True when the transition is enabled in the marking
+        """
+        markings = np.asarray(markings, dtype=np.int64).reshape((-1, len(self.places)))
+        return np.all(markings[:, np.newaxis, :] >= self.pre[np.newaxis, :, :], axis=2)
+
+    def to_petri_net(self) -> Tuple[PetriNet, Optional[Marking], Optional[Marking]]:
+        """
+        Builds a new Petri net (along with the initial and final markings, if provided when compiling)
+        from the compiled representation
+
+        Returns
+        --------------
+        net
+            Petri net
+        im
+            Initial marking (None if not provided)
+        fm
+            Final marking (None if not provided)
+        """
+        net = PetriNet(self.net.name)
+        places = []
+        for p in self.places:
+            place = PetriNet.Place(p.name, properties=dict(p.properties))
+            net.places.add(place)
+            places.append(place)
+        transitions = []
+        for t in self.transitions:
+            trans = PetriNet.Transition(t.name, t.label, properties=dict(t.properties))
+            net.transitions.add(trans)
+            transitions.append(trans)
+        for t in range(len(self.transitions)):
+            for p in np.flatnonzero(self.pre[t]):
+                petri_utils.add_arc_from_to(places[p], transitions[t], net, weight=int(self.pre[t, p]))
+            for p in np.flatnonzero(self.post[t]):
+                petri_utils.add_arc_from_to(transitions[t], places[p], net, weight=int(self.post[t, p]))
+
+        def decode(marking):
+            if marking is None:
+                return None
+            m = Marking()
+            for i, n in enumerate(marking):
+                if n > 0:
+                    m[places[i]] = n
+            return m
+
+        return net, decode(self.initial_marking), decode(self.final_marking)
+
+
+def compile_net(net: PetriNet, initial_marking: Optional[Marking] = None,
+                final_marking: Optional[Marking] = None) -> CompiledPetriNet:
+    """
+    Compiles a Petri net into its integer-indexed representation
+
+    Parameters
+    --------------
+    net
+        Petri net
+    initial_marking
+        (optional) initial marking
+    final_marking
+        (optional) final marking
+
+    Returns
+    --------------
+    compiled_net
+        Compiled Petri net
+    """
+    return CompiledPetriNet(net, initial_marking, final_marking)
+
+
+def is_compilable(net: PetriNet, *markings: Marking) -> bool:
+    """
+    Checks if the Petri net can be executed by the compiled representation with the classic semantics
+    (no inhibitor/reset arcs, and all the places of the markings belong to the net)
+    """
+    for arc in net.arcs:
+        if type(arc) is not PetriNet.Arc:
+            return False
+    for marking in markings:
+        for p in marking:
+            if p not in net.places:
+                return False
+    return True
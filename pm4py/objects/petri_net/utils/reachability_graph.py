@@ -17,7 +17,7 @@
 import re
 
 from pm4py.objects import petri_net
-from pm4py.objects.petri_net.utils import align_utils
+from pm4py.objects.petri_net.utils import align_utils, compiled_net
 from pm4py.objects.transition_system import obj as ts
 from pm4py.objects.transition_system import utils
 from pm4py.util import exec_utils
@@ -65,7 +65,12 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
 
     # set a maximum execution time of 1 day (it can be changed by providing the parameter)
     max_exec_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, 86400)
-    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, petri_net.semantics.ClassicSemantics())
+    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, None)
+
+    if semantics is None:
+        if compiled_net.is_compilable(net, im):
+            return __compiled_marking_flow_petri(net, im, max_exec_time, return_eventually_enabled)
+        semantics = petri_net.semantics.ClassicSemantics()
 
     start_time = time.time()
 
@@ -95,6 +100,50 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
     return incoming_transitions, outgoing_transitions, eventually_enabled
 
 
+def __compiled_marking_flow_petri(net, im, max_exec_time, return_eventually_enabled):
+    """
+    Construct the marking flow of a Petri net (classic semantics), exploring the markings
+    on the compiled representation of the net
+    """
+    start_time = time.time()
+
+    cnet = compiled_net.compile_net(net, im)
+    initial = cnet.initial_marking
+
+    incoming = {initial: set()}
+    outgoing = {}
+
+    active = [initial]
+    while active:
+        if (time.time() - start_time) >= max_exec_time:
+            # interrupt the execution
+            break
+        m = active.pop()
+        outgoing[m] = {}
+        for t in cnet.enabled_transitions(m):
+            nm = cnet.fire(t, m)
+            outgoing[m][t] = nm
+            if nm not in incoming:
+                incoming[nm] = set()
+                active.append(nm)
+            incoming[nm].add(t)
+
+    # translates the compiled markings and transitions to the objects of the Petri net
+    markings = {m: cnet.decode_marking(m) for m in incoming}
+    markings[initial] = im
+    transitions = cnet.transitions
+    incoming_transitions = {markings[m]: {transitions[t] for t in ts} for m, ts in incoming.items()}
+    outgoing_transitions = {markings[m]: {transitions[t]: markings[nm] for t, nm in ts.items()} for m, ts in
+                            outgoing.items()}
+    eventually_enabled = {}
+    if return_eventually_enabled:
+        for m in outgoing:
+            eventually_enabled[markings[m]] = align_utils.get_visible_transitions_eventually_enabled_by_marking(
+                net, markings[m])
+
+    return incoming_transitions, outgoing_transitions, eventually_enabled
+
+
 def construct_reachability_graph_from_flow(incoming_transitions, outgoing_transitions,
                                            use_trans_name=False, parameters=None):
     """
@@ -14,8 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.process_tree import obj, semantics, state, utils
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["obj", "semantics", "state", "utils"]
 
 if pkgutil.find_loader("lxml"):
-    from pm4py.objects.process_tree import importer, exporter
+    _submodules.extend(["importer", "exporter"])
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,8 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.random_variables import constant0, normal, uniform, exponential, random_variable, lognormal, gamma
-
 import warnings
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["constant0", "normal", "uniform", "exponential", "random_variable", "lognormal", "gamma"]
 
 warnings.warn("The random_variables package will be removed in a future release.")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
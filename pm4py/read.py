@@ -45,7 +45,7 @@ def read_xes(file_path: str, variant: str = "lxml", return_legacy_log_object: bo
     Returns a table (``pandas.DataFrame``) view of the event log.
 
     :param file_path: file path of the event log (``.xes`` file) on disk
-    :param variant: the variant of the importer to use. "iterparse" => traditional XML parser; "line_by_line" => text-based line-by-line importer ; "chunk_regex" => chunk-of-bytes importer (default); "iterparse20" => XES 2.0 importer
+    :param variant: the variant of the importer to use. "lxml" => columnar XML parser importing directly into a dataframe, or traditional XML parser if a log object is requested (default); "iterparse" => traditional XML parser; "line_by_line" => text-based line-by-line importer ; "chunk_regex" => chunk-of-bytes importer; "iterparse20" => XES 2.0 importer
     :param return_legacy_log_object: boolean value enabling returning a log object (default: False)
     :rtype: ``DataFrame``
 
@@ -58,6 +58,11 @@ def read_xes(file_path: str, variant: str = "lxml", return_legacy_log_object: bo
     if not os.path.exists(file_path):
         raise Exception("File does not exist")
     from pm4py.objects.log.importer.xes import importer as xes_importer
+    if variant == "lxml" and not return_legacy_log_object and pkgutil.find_loader("lxml"):
+        # streams the XML directly into the columns of the dataframe, skipping the EventLog object
+        log = xes_importer.apply(file_path, variant=xes_importer.Variants.ITERPARSE_DATAFRAME, parameters=kwargs)
+        log = dataframe_utils.convert_timestamp_columns_in_df(log)
+        return log
     v = xes_importer.Variants.LINE_BY_LINE
     if pkgutil.find_loader("lxml"):
         v = xes_importer.Variants.ITERPARSE
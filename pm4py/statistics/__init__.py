@@ -14,5 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.statistics import traces, attributes, variants, start_activities, end_activities, \
-    sojourn_time, concurrent_activities, eventually_follows, rework
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "traces", "attributes", "variants", "start_activities", "end_activities", "sojourn_time",
+    "concurrent_activities", "eventually_follows", "rework"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,8 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.statistics.concurrent_activities import log
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["log"]
 
 if pkgutil.find_loader("pandas"):
-    from pm4py.statistics.concurrent_activities import pandas
+    _submodules.append("pandas")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -19,6 +19,7 @@ from pm4py.util.xes_constants import DEFAULT_NAME_KEY
 from pm4py.util.constants import GROUPED_DATAFRAME
 from pm4py.util import exec_utils
 from pm4py.util import constants
+from pm4py.objects.log.util import log_index
 from enum import Enum
 from typing import Optional, Dict, Any, Union, Tuple, List, Set
 import pandas as pd
@@ -59,6 +60,10 @@ def get_end_activities(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Pa
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
     grouped_df = parameters[GROUPED_DATAFRAME] if GROUPED_DATAFRAME in parameters else None
 
+    index = log_index.get(df, parameters=parameters) if grouped_df is None else None
+    if index is not None and index.rows_in_order:
+        return index.count_activities(index.get_last_events())
+
     if grouped_df is None:
         grouped_df = df.groupby(case_id_glue, sort=False)
 
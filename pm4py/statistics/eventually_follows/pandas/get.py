@@ -16,7 +16,7 @@
 '''
 from enum import Enum
 
-from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
+from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_aggregates
 from pm4py.util import exec_utils, constants, xes_constants
 from typing import Optional, Dict, Any, Union, Tuple, List, Set
 import pandas as pd
@@ -44,15 +44,12 @@ def apply(dataframe: pd.DataFrame, parameters: Optional[Dict[Union[str, Paramete
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
     keep_first_following = exec_utils.get_param_value(Parameters.KEEP_FIRST_FOLLOWING, parameters, False)
 
-    partial_order_dataframe = get_partial_order_dataframe(dataframe, start_timestamp_key=start_timestamp_key,
-                                                          timestamp_key=timestamp_key, case_id_glue=case_id_glue,
-                                                          activity_key=activity_key,
-                                                          keep_first_following=keep_first_following)
+    aggregates = get_partial_order_aggregates(dataframe, start_timestamp_key=start_timestamp_key,
+                                              timestamp_key=timestamp_key, case_id_glue=case_id_glue,
+                                              activity_key=activity_key,
+                                              keep_first_following=keep_first_following)
 
-    ret_dict = partial_order_dataframe.groupby([activity_key, activity_key + '_2']).size().to_dict()
-
-    # assure to avoid problems with np.float64, by using the Python float type
-    for el in ret_dict:
-        ret_dict[el] = int(ret_dict[el])
+    # assure to avoid problems with np.int64, by using the Python int type
+    ret_dict = {x: int(y["count"]) for x, y in aggregates.items()}
 
     return ret_dict
@@ -19,7 +19,8 @@ from typing import Optional, Dict, Any, Tuple, Collection, Set, List
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.objects.ocel import constants as ocel_constants
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+import pandas as pd
 
 
 class Parameters(Enum):
@@ -87,16 +88,16 @@ def performance_calculation_ocel_aggregation(ocel: OCEL, aggregation: Dict[str,
         ret[ot] = {}
         for act in aggregation[ot]:
             ret[ot][act] = []
-            for el in aggregation[ot][act]:
-                if business_hours:
-                    bh = BusinessHours(timestamps[el[0]],
-                                       timestamps[el[1]],
-                                       business_hour_slots=business_hours_slots,
-                                       workcalendar=workcalendar)
-                    diff = bh.get_seconds()
-                else:
+            if business_hours:
+                couples = list(aggregation[ot][act])
+                diffs = soj_time_business_hours_diff_vectorized(pd.DatetimeIndex([timestamps[el[0]] for el in couples]),
+                                                                pd.DatetimeIndex([timestamps[el[1]] for el in couples]),
+                                                                business_hours_slots, workcalendar)
+                ret[ot][act] = diffs.tolist()
+            else:
+                for el in aggregation[ot][act]:
                     diff = timestamps[el[1]].timestamp() - timestamps[el[0]].timestamp()
-                ret[ot][act].append(diff)
+                    ret[ot][act].append(diff)
             ret[ot][act] = sorted(ret[ot][act])
 
     return ret
@@ -14,8 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.statistics.overlap import cases, utils
-
 import warnings
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["cases", "utils"]
 
 warnings.warn("The overlap package will be removed in a future release.")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
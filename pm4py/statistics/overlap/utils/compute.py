@@ -17,9 +17,9 @@
 from enum import Enum
 from typing import Optional, Dict, Any, Tuple, List, Union
 
-from intervaltree import Interval, IntervalTree
+import numpy as np
 
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, intervals
 
 
 class Parameters(Enum):
@@ -47,15 +47,8 @@ def apply(points: List[Tuple[float, float]], parameters: Optional[Dict[Union[str
         parameters = {}
 
     epsilon = exec_utils.get_param_value(Parameters.EPSILON, parameters, 10 ** (-5))
-    points = [(x[0] - epsilon, x[1] + epsilon) for x in points]
-    sorted_points = sorted(points)
-    tree = IntervalTree()
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    begins = points[:, 0] - epsilon
+    ends = points[:, 1] + epsilon
 
-    for p in sorted_points:
-        tree.add(Interval(p[0], p[1]))
-
-    overlap = []
-    for p in points:
-        overlap.append(len(tree[p[0]:p[1]]))
-
-    return overlap
+    return intervals.count_overlapping(begins, ends, begins, ends).tolist()
@@ -17,13 +17,15 @@
 from enum import Enum
 from typing import Optional, Dict, Any, Union, Tuple, List
 
+import numpy as np
 import pandas as pd
 
+from pm4py.objects.log.util import log_index
 from pm4py.statistics.traces.generic.common import case_duration as case_duration_commons
 from pm4py.util import exec_utils, constants, pandas_utils
 from pm4py.util import variants_util
 from pm4py.util import xes_constants as xes
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 
@@ -163,21 +165,31 @@ def get_cases_description(df: pd.DataFrame, parameters: Optional[Dict[Union[str,
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
-    grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    # grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    first_eve_df = grouped_df.first()
-    last_eve_df = grouped_df.last()
-    del grouped_df
-    last_eve_df.columns = [str(col) + '_2' for col in first_eve_df.columns]
-    stacked_df = pd.concat([first_eve_df, last_eve_df], axis=1)
-    del first_eve_df
-    del last_eve_df
-    del stacked_df[case_id_glue]
-    del stacked_df[case_id_glue + "_2"]
+    index = log_index.get(df, parameters=parameters) if start_timestamp_key == timestamp_key else None
+    if index is not None and index.timestamps_ns is not None and index.rows_in_order:
+        # first and last timestamp of every case, read from the events sorted in the index
+        cases = pd.Index(index.case_ids, name=case_id_glue)
+        first_timestamps = df[timestamp_key].iloc[index.order[index.get_first_events()]]
+        last_timestamps = df[timestamp_key].iloc[index.order[index.get_last_timestamped_events()]]
+        first_timestamps.index, last_timestamps.index = cases, cases
+        stacked_df = pd.concat([first_timestamps.rename(timestamp_key), last_timestamps.rename(timestamp_key + "_2")],
+                               axis=1)
+    else:
+        grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
+        # grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
+        first_eve_df = grouped_df.first()
+        last_eve_df = grouped_df.last()
+        del grouped_df
+        last_eve_df.columns = [str(col) + '_2' for col in first_eve_df.columns]
+        stacked_df = pd.concat([first_eve_df, last_eve_df], axis=1)
+        del first_eve_df
+        del last_eve_df
+        del stacked_df[case_id_glue]
+        del stacked_df[case_id_glue + "_2"]
 
     if business_hours:
-        stacked_df['caseDuration'] = stacked_df.apply(
-            lambda x: soj_time_business_hours_diff(x[start_timestamp_key], x[timestamp_key + "_2"], business_hours_slots, workcalendar), axis=1)
+        stacked_df['caseDuration'] = soj_time_business_hours_diff_vectorized(
+            stacked_df[start_timestamp_key], stacked_df[timestamp_key + "_2"], business_hours_slots, workcalendar)
     else:
         stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[start_timestamp_key]
         stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
@@ -218,6 +230,14 @@ def get_variants_df(df, parameters=None):
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
 
+    index = log_index.get(df, parameters=parameters)
+    if index is not None and index.rows_in_order:
+        # variants of the cases, in the order of appearance of the cases in the dataframe
+        case_variants, variants = index.get_variants()
+        cases = np.argsort(index.get_first_rows(), kind="stable")
+        return pd.DataFrame({"variant": [variants[v] for v in case_variants[cases].tolist()]},
+                            index=pd.Index(index.case_ids[cases], name=case_id_glue))
+
     new_df = df.groupby(case_id_glue, sort=False)[activity_key].agg(lambda col: tuple(pd.Series.to_list(col))).to_frame()
 
     new_cols = list(new_df.columns)
@@ -275,8 +295,8 @@ def get_variants_df_with_case_duration(df, parameters=None):
     stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
     stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
     if business_hours:
-        stacked_df['caseDuration'] = stacked_df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[timestamp_key + "_2"], business_hours_slots, workcalendar), axis=1)
+        stacked_df['caseDuration'] = soj_time_business_hours_diff_vectorized(
+            stacked_df[timestamp_key], stacked_df[timestamp_key + "_2"], business_hours_slots, workcalendar)
     else:
         stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
         stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
@@ -16,6 +16,7 @@
 '''
 from pm4py.util import constants, exec_utils, xes_constants
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_store
 from pm4py.streaming.algo.interface import StreamingAlgorithm
 import logging
 from copy import copy
@@ -29,6 +30,10 @@ class Parameters:
     DEV_DICT_ID = "dev_dict_id"
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
+    EVICTION_POLICY = "eviction_policy"
+    ON_CASE_EVICTION = "on_case_eviction"
 
 
 START_ACTIVITIES = "start_activities"
@@ -48,7 +53,11 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         footprints
             Footprints
         parameters
-            Parameters of the algorithm
+            Parameters of the algorithm, including:
+             - Parameters.MAX_CASES: maximum number of open cases (default: None, unbounded)
+             - Parameters.CASE_IDLE_TTL: time (in seconds) after which a case not receiving events is evicted
+             - Parameters.EVICTION_POLICY: eviction policy when the maximum number of cases is exceeded
+             - Parameters.ON_CASE_EVICTION: callback receiving an evicted case and the result of its termination
         """
         self.footprints = footprints
         self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
@@ -59,6 +68,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         self.activities = footprints[ACTIVITIES]
         self.all_fps = set(footprints[SEQUENCE]).union(set(footprints[PARALLEL]))
         self.build_dictionaries(parameters=parameters)
+        self.case_store = case_store.apply(finalize=self.finalize_case, parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
     def build_dictionaries(self, parameters):
@@ -105,6 +115,52 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         else:
             self.message_case_or_activity_not_in_event(event)
 
+    def _process_batch(self, events):
+        """
+        Checks a batch of events, updating the case dictionary once per case
+
+        Parameters
+        ----------------
+        events
+            List of events
+        """
+        cases = {}
+        for event in events:
+            case = event[self.case_id_key] if self.case_id_key in event else None
+            activity = event[self.activity_key] if self.activity_key in event else None
+            if case is not None and activity is not None:
+                case = self.encode_str(case)
+                activity = self.encode_str(activity)
+                if case not in cases:
+                    if case in self.case_dict:
+                        cases[case] = [self.case_dict[case], int(self.dev_dict[case])]
+                    else:
+                        cases[case] = [None, 0]
+                # state of the case: last activity (None if the case is not yet started) and number of deviations
+                state = cases[case]
+                if state[0] is None:
+                    state[1] = 0
+                if activity in self.activities:
+                    if state[0] is None:
+                        if activity not in self.start_activities:
+                            state[1] += 1
+                            self.message_start_activity_not_possible(activity, case)
+                    elif (state[0], activity) not in self.all_fps:
+                        state[1] += 1
+                        self.message_footprints_not_possible((state[0], activity), case)
+                    state[0] = activity
+                else:
+                    state[1] += 1
+                    self.message_activity_not_possible(activity, case)
+            else:
+                self.message_case_or_activity_not_in_event(event)
+        for case, (activity, num_dev) in cases.items():
+            if activity is not None:
+                self.case_dict[case] = activity
+            self.dev_dict[case] = num_dev
+        for case in cases:
+            self.case_store.touch(case)
+
     def verify_footprints(self, case, activity):
         """
         Verify the event according to the footprints
@@ -128,6 +184,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         else:
             self.dev_dict[case] = int(self.dev_dict[case]) + 1
             self.message_activity_not_possible(activity, case)
+        self.case_store.touch(case)
 
     def verify_intra_case(self, case, activity):
         """
@@ -206,6 +263,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
             num_dev = int(self.dev_dict[case])
             del self.case_dict[case]
             del self.dev_dict[case]
+            self.case_store.remove(case)
             if num_dev == 0:
                 return True
             else:
@@ -213,6 +271,26 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         else:
             self.message_case_not_in_dictionary(case)
 
+    def finalize_case(self, case):
+        """
+        Finalizes a case evicted from the case-state store
+
+        Parameters
+        -----------------
+        case
+            Case
+
+        Returns
+        -----------------
+        boolean
+            Boolean value (True if there are no deviations)
+        """
+        if case in self.case_dict:
+            return self.terminate(case)
+        # no activity of the case is contained in the footprints: only the deviations are stored
+        del self.dev_dict[case]
+        return False
+
     def terminate_all(self):
         """
         Terminate all cases
@@ -293,6 +371,16 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         """
         logging.error("the case " + str(case) + " is not in the dictionary! case: " + str(case))
 
+    def _checkpoint_dictionaries(self):
+        """
+        Gets the dictionaries hosting the state of the algorithm (saved in the checkpoints)
+        """
+        return {
+            "case_dict": self.case_dict,
+            "dev_dict": self.dev_dict,
+            "case_store": self.case_store,
+        }
+
     def _current_result(self):
         """
         Gets a diagnostics dataframe with the status of the cases
@@ -314,6 +402,25 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
 
         return pd.DataFrame(diagn_stream)
 
+    @staticmethod
+    def merge_results(results):
+        """
+        Merges the diagnostics dataframes of instances processing disjoint sets of cases
+
+        Parameters
+        -------------
+        results
+            Diagnostics dataframes
+
+        Returns
+        -------------
+        diagn_df
+            Diagnostics dataframe
+        """
+        import pandas as pd
+
+        return pd.concat(results, ignore_index=True)
+
 
 def apply(footprints, parameters=None):
     """
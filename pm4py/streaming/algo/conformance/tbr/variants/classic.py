@@ -16,12 +16,14 @@
 '''
 from pm4py.util import constants, exec_utils, xes_constants
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_store
 import logging
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.streaming.algo.interface import StreamingAlgorithm
 from pm4py.objects.petri_net import semantics
 from copy import copy
 import sys
+import traceback
 
 
 class Parameters:
@@ -33,6 +35,10 @@ class Parameters:
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     MAXIMUM_ITERATIONS_INVISIBLES = "maximum_iterations_invisibles"
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
+    EVICTION_POLICY = "eviction_policy"
+    ON_CASE_EVICTION = "on_case_eviction"
 
 
 class TbrStreamingConformance(StreamingAlgorithm):
@@ -48,6 +54,12 @@ class TbrStreamingConformance(StreamingAlgorithm):
             Initial marking
         fm
             Final marking
+        parameters
+            Parameters of the algorithm, including:
+             - Parameters.MAX_CASES: maximum number of open cases (default: None, unbounded)
+             - Parameters.CASE_IDLE_TTL: time (in seconds) after which a case not receiving events is evicted
+             - Parameters.EVICTION_POLICY: eviction policy when the maximum number of cases is exceeded
+             - Parameters.ON_CASE_EVICTION: callback receiving an evicted case and the result of its termination
         """
         if parameters is None:
             parameters = {}
@@ -63,6 +75,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
         self.activities = list(set(x.label for x in self.net.transitions))
         self.dictio_spaths = self.get_paths_net()
         self.build_dictionaries(parameters=parameters)
+        self.case_store = case_store.apply(finalize=self.terminate, parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
     def build_dictionaries(self, parameters):
@@ -147,6 +160,48 @@ class TbrStreamingConformance(StreamingAlgorithm):
         else:
             self.message_case_or_activity_not_in_event(event)
 
+    def _process_batch(self, events):
+        """
+        Checks a batch of events according to the TBR. The marking of every case is decoded once
+        and stored once per batch.
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        markings = {}
+        for event in events:
+            case = event[self.case_id_key] if self.case_id_key in event else None
+            activity = event[self.activity_key] if self.activity_key in event else None
+            if case is not None and activity is not None:
+                case = self.encode_str(case)
+                if activity in self.activities:
+                    if case not in markings:
+                        if case not in self.case_dict:
+                            self.missing[case] = 0
+                            self.remaining[case] = 0
+                            markings[case] = [copy(self.im), 0]
+                        else:
+                            markings[case] = [self.decode_marking(self.case_dict[case]), 0]
+                    try:
+                        marking, missing = self.replay_activity(case, markings[case][0], activity)
+                        markings[case][0] = marking
+                        markings[case][1] += missing
+                    except:
+                        # as in the processing of a single event, a failure does not affect the other events
+                        traceback.print_exc()
+                else:
+                    self.message_activity_not_possible(activity, case)
+            else:
+                self.message_case_or_activity_not_in_event(event)
+        for case, (marking, missing) in markings.items():
+            self.case_dict[case] = self.encode_marking(marking)
+            if missing > 0:
+                self.missing[case] = int(self.missing[case]) + missing
+        for case in markings:
+            self.case_store.touch(case)
+
     def encode_str(self, stru):
         """
         Encodes a string for storage in generic dictionaries
@@ -189,41 +244,67 @@ class TbrStreamingConformance(StreamingAlgorithm):
                 self.case_dict[case] = self.encode_marking(copy(self.im))
                 self.missing[case] = 0
                 self.remaining[case] = 0
-            marking = self.decode_marking(self.case_dict[case])
-            new_marking = marking
-            prev_marking = None
-            correct_exec = False
-            numb_it = 0
-            while new_marking is not None and prev_marking != new_marking:
-                numb_it = numb_it + 1
-                if numb_it > self.maximum_iterations_invisibles:
-                    break
-                enabled_transitions = semantics.enabled_transitions(self.net, new_marking)
-                matching_transitions = [x for x in enabled_transitions if x.label == activity]
-                if matching_transitions:
-                    new_marking = semantics.weak_execute(matching_transitions[0], new_marking)
-                    self.case_dict[case] = self.encode_marking(new_marking)
-                    correct_exec = True
-                    break
-                prev_marking = new_marking
-                new_marking = self.enable_trans_with_invisibles(new_marking, activity)
-                correct_exec = False
-            if correct_exec is False:
-                self.message_missing_tokens(activity, case)
-                # enables one of the matching transitions
-                matching_transitions = [x for x in self.net.transitions if x.label == activity]
-                t = matching_transitions[0]
-                for a in t.in_arcs:
-                    pl = a.source
-                    mark = a.weight
-                    if pl not in marking or new_marking[pl] < mark:
-                        self.missing[case] = int(self.missing[case]) + (mark - marking[pl])
-                        marking[pl] = mark
-                new_marking = semantics.weak_execute(t, marking)
-                self.case_dict[case] = self.encode_marking(new_marking)
+            marking, missing = self.replay_activity(case, self.decode_marking(self.case_dict[case]), activity)
+            self.case_dict[case] = self.encode_marking(marking)
+            if missing > 0:
+                self.missing[case] = int(self.missing[case]) + missing
+            self.case_store.touch(case)
         else:
             self.message_activity_not_possible(activity, case)
 
+    def replay_activity(self, case, marking, activity):
+        """
+        Replays an activity (contained in the model) starting from the given marking of the case
+
+        Parameters
+        --------------
+        case
+            Case
+        marking
+            Current marking of the case
+        activity
+            Activity
+
+        Returns
+        --------------
+        new_marking
+            Marking reached after the replay of the activity
+        missing
+            Number of tokens that have been inserted to replay the activity
+        """
+        missing = 0
+        new_marking = marking
+        prev_marking = None
+        correct_exec = False
+        numb_it = 0
+        while new_marking is not None and prev_marking != new_marking:
+            numb_it = numb_it + 1
+            if numb_it > self.maximum_iterations_invisibles:
+                break
+            enabled_transitions = semantics.enabled_transitions(self.net, new_marking)
+            matching_transitions = [x for x in enabled_transitions if x.label == activity]
+            if matching_transitions:
+                new_marking = semantics.weak_execute(matching_transitions[0], new_marking)
+                correct_exec = True
+                break
+            prev_marking = new_marking
+            new_marking = self.enable_trans_with_invisibles(new_marking, activity)
+            correct_exec = False
+        if correct_exec is False:
+            self.message_missing_tokens(activity, case)
+            # enables one of the matching transitions
+            matching_transitions = [x for x in self.net.transitions if x.label == activity]
+            t = matching_transitions[0]
+            marking = copy(marking)
+            for a in t.in_arcs:
+                pl = a.source
+                mark = a.weight
+                if pl not in marking or new_marking[pl] < mark:
+                    missing = missing + (mark - marking[pl])
+                    marking[pl] = mark
+            new_marking = semantics.weak_execute(t, marking)
+        return new_marking, missing
+
     def enable_trans_with_invisibles(self, marking, activity):
         """
         Enables a visible transition (that is not enabled) through
@@ -314,6 +395,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
             del self.case_dict[case]
             del self.missing[case]
             del self.remaining[case]
+            self.case_store.remove(case)
             return ret
         else:
             self.message_case_not_in_dictionary(case)
@@ -424,6 +506,17 @@ class TbrStreamingConformance(StreamingAlgorithm):
             marking) + " final marking: " + str(self.fm))
         pass
 
+    def _checkpoint_dictionaries(self):
+        """
+        Gets the dictionaries hosting the state of the algorithm (saved in the checkpoints)
+        """
+        return {
+            "case_dict": self.case_dict,
+            "missing": self.missing,
+            "remaining": self.remaining,
+            "case_store": self.case_store,
+        }
+
     def _current_result(self):
         """
         Gets a diagnostics dataframe with the status of the cases
@@ -447,6 +540,25 @@ class TbrStreamingConformance(StreamingAlgorithm):
 
         return pd.DataFrame(diagn_stream)
 
+    @staticmethod
+    def merge_results(results):
+        """
+        Merges the diagnostics dataframes of instances processing disjoint sets of cases
+
+        Parameters
+        -------------
+        results
+            Diagnostics dataframes
+
+        Returns
+        -------------
+        diagn_df
+            Diagnostics dataframe
+        """
+        import pandas as pd
+
+        return pd.concat(results, ignore_index=True)
+
 
 def apply(net, im, fm, parameters=None):
     """
@@ -18,11 +18,12 @@ import logging
 import sys
 from copy import copy
 from enum import Enum
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List
 
 from pm4py.objects.log.obj import Event
 from pm4py.streaming.algo.interface import StreamingAlgorithm
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_store
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
 import json
@@ -38,6 +39,10 @@ class Parameters(Enum):
     DICT_ID = "dict_id"
     CASE_DICT_ID = "case_dict_id"
     DEV_DICT_ID = "dev_dict_id"
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
+    EVICTION_POLICY = "eviction_policy"
+    ON_CASE_EVICTION = "on_case_eviction"
 
 
 class TemporalProfileStreamingConformance(StreamingAlgorithm):
@@ -62,6 +67,10 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
              - Parameters.DICT_VARIANT => the variant of dictionary to use
              - Parameters.CASE_DICT_ID => the identifier of the case dictionary
              - Parameters.DEV_DICT_ID => the identifier of the deviations dictionary
+             - Parameters.MAX_CASES => maximum number of open cases (default: None, unbounded)
+             - Parameters.CASE_IDLE_TTL => time (in seconds) after which a case not receiving events is evicted
+             - Parameters.EVICTION_POLICY => eviction policy when the maximum number of cases is exceeded
+             - Parameters.ON_CASE_EVICTION => callback receiving an evicted case and its deviations
         """
         if parameters is None:
             parameters = {}
@@ -84,6 +93,7 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
         dev_dict_id = exec_utils.get_param_value(Parameters.DEV_DICT_ID, parameters, 1)
         parameters_dev[Parameters.DICT_ID] = dev_dict_id
         self.deviations_dict = generator.apply(variant=dict_variant, parameters=parameters_dev)
+        self.case_store = case_store.apply(finalize=self.finalize_case, parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
     def _process(self, event: Event):
@@ -110,6 +120,41 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
             this_case = json.loads(self.case_dictionary[case])
             this_case.append(ev_red)
             self.case_dictionary[case] = json.dumps(this_case)
+            self.case_store.touch(case)
+
+    def _process_batch(self, events: List[Event]):
+        """
+        Checks a batch of events, loading and storing the events and the deviations of every case
+        once per batch
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        cases = {}
+        for event in events:
+            if self.case_id_key not in event or self.start_timestamp_key not in event or self.timestamp_key not in event or self.activity_key not in event:
+                self.message_event_is_not_complete(event)
+            else:
+                case = str(event[self.case_id_key])
+                start_timestamp = event[self.start_timestamp_key].timestamp()
+                end_timestamp = event[self.timestamp_key].timestamp()
+                activity = str(event[self.activity_key])
+                if case not in cases:
+                    if case not in self.case_dictionary:
+                        cases[case] = ([], [])
+                    else:
+                        cases[case] = (json.loads(self.case_dictionary[case]), json.loads(self.deviations_dict[case]))
+                prev_events, deviations = cases[case]
+                ev_red = (case, start_timestamp, end_timestamp, activity)
+                deviations.extend(self.get_deviations(prev_events, ev_red))
+                prev_events.append(ev_red)
+        for case, (prev_events, deviations) in cases.items():
+            self.case_dictionary[case] = json.dumps(prev_events)
+            self.deviations_dict[case] = json.dumps(deviations)
+        for case in cases:
+            self.case_store.touch(case)
 
     def check_conformance(self, event: Tuple[str, float, float, str]):
         """
@@ -120,8 +165,32 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
         event
             Event
         """
+        case = event[0]
+        dev_descrs = self.get_deviations(json.loads(self.case_dictionary[case]), event)
+        if dev_descrs:
+            this_dev = json.loads(self.deviations_dict[case])
+            this_dev.extend(dev_descrs)
+            self.deviations_dict[case] = json.dumps(this_dev)
+
+    def get_deviations(self, prev_events: List[Tuple[str, float, float, str]],
+                       event: Tuple[str, float, float, str]) -> List[Tuple[str, str, str, float, float]]:
+        """
+        Gets the deviations from the temporal profile between the previous events of the case and the current event
+
+        Parameters
+        ---------------
+        prev_events
+            Previous events of the case
+        event
+            Event
+
+        Returns
+        ---------------
+        dev_descrs
+            Descriptions of the deviations
+        """
         case, start_timestamp, end_timestamp, activity = event
-        prev_events = json.loads(self.case_dictionary[case])
+        dev_descrs = []
         for i in range(len(prev_events)):
             prev_case, prev_start_timestamp, prev_end_timestamp, prev_activity = prev_events[i]
             if start_timestamp >= prev_end_timestamp:
@@ -132,10 +201,28 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
                     if diff < mean - self.zeta * std or diff > mean + self.zeta * std:
                         this_zeta = abs(diff - mean) / std if std > 0 else sys.maxsize
                         dev_descr = (case, prev_activity, activity, diff, this_zeta)
-                        this_dev = json.loads(self.deviations_dict[case])
-                        this_dev.append(dev_descr)
-                        self.deviations_dict[case] = json.dumps(this_dev)
+                        dev_descrs.append(dev_descr)
                         self.message_deviation(dev_descr)
+        return dev_descrs
+
+    def finalize_case(self, case: str) -> List[Tuple[str, str, str, float, float]]:
+        """
+        Finalizes a case evicted from the case-state store, removing its events and its deviations
+
+        Parameters
+        ---------------
+        case
+            Case
+
+        Returns
+        ---------------
+        deviations
+            Deviations of the case
+        """
+        deviations = [tuple(x) for x in json.loads(self.deviations_dict[case])]
+        del self.case_dictionary[case]
+        del self.deviations_dict[case]
+        return deviations
 
     def message_event_is_not_complete(self, event: Event):
         """
@@ -159,6 +246,16 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
         """
         logging.error("the temporal profile is broken in the following setting: " + str(dev_descr))
 
+    def _checkpoint_dictionaries(self):
+        """
+        Gets the dictionaries hosting the state of the algorithm (saved in the checkpoints)
+        """
+        return {
+            "case_dictionary": self.case_dictionary,
+            "deviations_dict": self.deviations_dict,
+            "case_store": self.case_store,
+        }
+
     def _current_result(self) -> typing.TemporalProfileStreamingConfResults:
         """
         Gets the current deviations identified by conformance checking
@@ -175,6 +272,26 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
                 dev_dict[x] = y
         return dev_dict
 
+    @staticmethod
+    def merge_results(results: List[typing.TemporalProfileStreamingConfResults]) -> typing.TemporalProfileStreamingConfResults:
+        """
+        Merges the deviations identified by instances processing disjoint sets of cases
+
+        Parameters
+        -------------
+        results
+            Deviations dictionaries
+
+        Returns
+        -------------
+        deviations_dict
+            Deviations dictionary
+        """
+        dev_dict = {}
+        for result in results:
+            dev_dict.update(result)
+        return dev_dict
+
 
 def apply(temporal_profile: typing.TemporalProfile, parameters: Optional[Dict[Any, Any]] = None):
     """
@@ -17,6 +17,7 @@
 from collections import Counter
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util import case_store
 from pm4py.streaming.algo.interface import StreamingAlgorithm
 from threading import Lock
 from enum import Enum
@@ -31,6 +32,11 @@ class Parameters(Enum):
     DFG_DICT_ID = "dfg_dict_id"
     ACT_DICT_ID = "act_dict_id"
     START_ACT_DICT_ID = "start_act_dict_id"
+    END_ACT_DICT_ID = "end_act_dict_id"
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
+    EVICTION_POLICY = "eviction_policy"
+    ON_CASE_EVICTION = "on_case_eviction"
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
 
@@ -45,6 +51,10 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         parameters of the algorithm, including:
          - Parameters.ACTIVITY_KEY: the key of the event to use as activity
          - Parameters.CASE_ID_KEY: the key of the event to use as case identifier
+         - Parameters.MAX_CASES: maximum number of open cases (default: None, unbounded)
+         - Parameters.CASE_IDLE_TTL: time (in seconds) after which a case not receiving events is evicted
+         - Parameters.EVICTION_POLICY: eviction policy when the maximum number of cases is exceeded
+         - Parameters.ON_CASE_EVICTION: callback receiving an evicted case and its last activity
         """
         if parameters is None:
             parameters = {}
@@ -55,6 +65,7 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
                                                       constants.CASE_CONCEPT_NAME)
         self.build_dictionaries(parameters)
+        self.case_store = case_store.apply(finalize=self.finalize_case, parameters=parameters)
         StreamingAlgorithm.__init__(self)
 
     def build_dictionaries(self, parameters):
@@ -71,12 +82,15 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
              - Parameters.DFG_DICT_ID: identifier of the DFG dictionary (1)
              - Parameters.ACT_ID: identifier of the dictionary hosting the count of the activities (2)
              - Parameters.START_ACT_DICT_ID: identifier of the dictionary hosting the count of the start activities (3)
+             - Parameters.END_ACT_DICT_ID: identifier of the dictionary hosting the count of the end activities
+             of the evicted cases (4)
         """
         dict_variant = exec_utils.get_param_value(Parameters.DICT_VARIANT, parameters, generator.Variants.THREAD_SAFE)
         case_dict_id = exec_utils.get_param_value(Parameters.CASE_DICT_ID, parameters, 0)
         dfg_dict_id = exec_utils.get_param_value(Parameters.DFG_DICT_ID, parameters, 1)
         act_dict_id = exec_utils.get_param_value(Parameters.ACT_DICT_ID, parameters, 2)
         start_act_dict_id = exec_utils.get_param_value(Parameters.START_ACT_DICT_ID, parameters, 3)
+        end_act_dict_id = exec_utils.get_param_value(Parameters.END_ACT_DICT_ID, parameters, 4)
         parameters_case_dict = copy(parameters)
         parameters_case_dict[Parameters.DICT_ID] = case_dict_id
         parameters_dfg = copy(parameters)
@@ -85,10 +99,13 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         parameters_activities[Parameters.DICT_ID] = act_dict_id
         parameters_start_activities = copy(parameters)
         parameters_start_activities[Parameters.DICT_ID] = start_act_dict_id
+        parameters_end_activities = copy(parameters)
+        parameters_end_activities[Parameters.DICT_ID] = end_act_dict_id
         self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
         self.dfg = generator.apply(variant=dict_variant, parameters=parameters_dfg)
         self.activities = generator.apply(variant=dict_variant, parameters=parameters_activities)
         self.start_activities = generator.apply(variant=dict_variant, parameters=parameters_start_activities)
+        self.end_activities = generator.apply(variant=dict_variant, parameters=parameters_end_activities)
 
     def event_without_activity_or_case(self, event):
         """
@@ -143,9 +160,87 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
             else:
                 self.activities[activity] = int(self.activities[activity]) + 1
             self.case_dict[case] = activity
+            self.case_store.touch(case)
         else:
             self.event_without_activity_or_case(event)
 
+    def _process_batch(self, events):
+        """
+        Receives a batch of events from the live event stream, and appends them to the current DFG discovery.
+        The counts are aggregated over the batch, so every entry of the dictionaries is updated once per batch.
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        last_activity = {}
+        dfg = Counter()
+        activities = Counter()
+        start_activities = Counter()
+        for event in events:
+            if self.case_id_key in event and self.activity_key in event:
+                case = self.encode_str(event[self.case_id_key])
+                activity = self.encode_str(event[self.activity_key])
+                if case in last_activity:
+                    dfg[(last_activity[case], activity)] += 1
+                elif case in self.case_dict:
+                    dfg[(self.case_dict[case], activity)] += 1
+                else:
+                    start_activities[activity] += 1
+                activities[activity] += 1
+                last_activity[case] = activity
+            else:
+                self.event_without_activity_or_case(event)
+        for df, count in dfg.items():
+            self.__increase(self.dfg, self.encode_tuple(df), count)
+        for activity, count in activities.items():
+            self.__increase(self.activities, activity, count)
+        for activity, count in start_activities.items():
+            self.__increase(self.start_activities, activity, count)
+        for case, activity in last_activity.items():
+            self.case_dict[case] = activity
+        for case in last_activity:
+            self.case_store.touch(case)
+
+    def __increase(self, dictio, key, count):
+        if key not in dictio:
+            dictio[key] = count
+        else:
+            dictio[key] = int(dictio[key]) + count
+
+    def finalize_case(self, case):
+        """
+        Finalizes a case evicted from the case-state store, counting its last activity as end activity
+
+        Parameters
+        ----------------
+        case
+            Case
+
+        Returns
+        ----------------
+        activity
+            Last activity of the case
+        """
+        activity = self.case_dict[case]
+        self.__increase(self.end_activities, activity, 1)
+        del self.case_dict[case]
+        return activity
+
+    def _checkpoint_dictionaries(self):
+        """
+        Gets the dictionaries hosting the state of the algorithm (saved in the checkpoints)
+        """
+        return {
+            "case_dict": self.case_dict,
+            "dfg": self.dfg,
+            "activities": self.activities,
+            "start_activities": self.start_activities,
+            "end_activities": self.end_activities,
+            "case_store": self.case_store,
+        }
+
     def _current_result(self):
         """
         Gets the current state of the DFG
@@ -159,14 +254,37 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         start_activities
             Start activities
         end_activities
-            End activities
+            End activities (of the evicted cases, and the last activities of the open cases)
         """
         dfg = {eval(x): int(self.dfg[x]) for x in self.dfg}
         activities = {x: int(self.activities[x]) for x in self.activities}
         start_activities = {x: int(self.start_activities[x]) for x in self.start_activities}
-        end_activities = dict(Counter(self.case_dict[x] for x in self.case_dict))
+        end_activities = Counter({x: int(self.end_activities[x]) for x in self.end_activities})
+        end_activities.update(self.case_dict[x] for x in self.case_dict)
+        end_activities = dict(end_activities)
         return dfg, activities, start_activities, end_activities
 
+    @staticmethod
+    def merge_results(results):
+        """
+        Merges the results of instances processing disjoint sets of cases, summing the counts
+
+        Parameters
+        ----------------
+        results
+            Results (DFG, activities, start activities, end activities) of the instances
+
+        Returns
+        ----------------
+        merged_result
+            DFG, activities, start activities and end activities of the whole stream
+        """
+        merged = [Counter(), Counter(), Counter(), Counter()]
+        for result in results:
+            for i in range(4):
+                merged[i].update(result[i])
+        return tuple(dict(x) for x in merged)
+
 
 def apply(parameters=None):
     """
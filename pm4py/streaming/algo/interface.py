@@ -18,11 +18,18 @@ import abc
 from threading import Lock
 #from typing import final
 import traceback
+from concurrent.futures import Future
+from typing import Optional, Dict, Any
+
+from pm4py.streaming.util import checkpoint
 
 
 class StreamingAlgorithm(abc.ABC):
     def __init__(self, parameters=None):
         self._lock = Lock()
+        # number of events received by the algorithm (offset in the stream)
+        self._offset = 0
+        self._checkpoint_writers = {}
 
     @abc.abstractmethod
     def _process(self, event):
@@ -32,6 +39,110 @@ class StreamingAlgorithm(abc.ABC):
     def _current_result(self):
         pass
 
+    def _process_batch(self, events):
+        """
+        Processes a batch of events (in the order in which they have been received).
+        The default implementation processes the events one at a time; the algorithms can override it
+        to share the work among the events of the batch.
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        for event in events:
+            try:
+                self._process(event)
+            except:
+                traceback.print_exc()
+
+    @staticmethod
+    def merge_results(results):
+        """
+        Merges the results of different instances of the algorithm, each one processing a partition
+        of the cases of the stream (the default implementation returns the list of the results)
+
+        Parameters
+        ---------------
+        results
+            Results (of the get method) of the instances
+
+        Returns
+        ---------------
+        merged_result
+            Merged result
+        """
+        return results
+
+    def _checkpoint_dictionaries(self) -> Dict[str, Any]:
+        """
+        Gets the dictionaries (and the other objects providing a snapshot and a restore method)
+        hosting the state of the algorithm, that are saved in the checkpoints.
+        The default implementation returns no dictionary.
+
+        Returns
+        ---------------
+        dictionaries
+            Dictionaries of the algorithm, indexed by name
+        """
+        return {}
+
+    def checkpoint(self, path: str, background: bool = True, parameters: Optional[Dict[Any, Any]] = None) -> Future:
+        """
+        Writes a checkpoint of the state of the algorithm. The lock is held only while copying the dictionaries;
+        the checkpoint is serialized and written by a background thread. After the first (full) checkpoint,
+        only the entries changed since the previous checkpoint on the same path are appended to the file.
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file
+        background
+            If True, returns without waiting for the checkpoint to be written
+        parameters
+            Parameters of the checkpoint writer (see pm4py.streaming.util.checkpoint)
+
+        Returns
+        ---------------
+        future
+            Future completed when the checkpoint has been written
+        """
+        if path not in self._checkpoint_writers:
+            self._checkpoint_writers[path] = checkpoint.CheckpointWriter(path, parameters=parameters)
+        self._lock.acquire()
+        try:
+            offset = self._offset
+            state = {name: checkpoint.snapshot(dictio) for name, dictio in self._checkpoint_dictionaries().items()}
+        finally:
+            self._lock.release()
+        return self._checkpoint_writers[path].write(offset, state, background=background)
+
+    def restore(self, path: str) -> int:
+        """
+        Restores the state of the algorithm from the last checkpoint written in the given file
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file
+
+        Returns
+        ---------------
+        offset
+            Number of events of the stream received by the algorithm when the checkpoint was taken
+            (the stream should be resumed from this offset)
+        """
+        offset, state = checkpoint.read(path)
+        self._lock.acquire()
+        try:
+            for name, dictio in self._checkpoint_dictionaries().items():
+                if name in state:
+                    checkpoint.restore(dictio, state[name])
+            self._offset = offset
+        finally:
+            self._lock.release()
+        return offset
+
     def get(self):
         self._lock.acquire()
         try:
@@ -44,8 +155,26 @@ class StreamingAlgorithm(abc.ABC):
 
     def receive(self, event):
         self._lock.acquire()
+        self._offset += 1
         try:
             self._process(event)
         except:
             traceback.print_exc()
         self._lock.release()
+
+    def receive_batch(self, events):
+        """
+        Receives a batch of events, which are processed while holding the lock only once
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        self._lock.acquire()
+        self._offset += len(events)
+        try:
+            self._process_batch(events)
+        except:
+            traceback.print_exc()
+        self._lock.release()
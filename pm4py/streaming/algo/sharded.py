@@ -0,0 +1,373 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import itertools
+import multiprocessing
+import queue
+import traceback
+import zlib
+from enum import Enum
+from typing import Optional, Dict, Any, Callable, List
+
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.streaming.util import checkpoint
+from pm4py.util import exec_utils, constants
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    NUM_SHARDS = "num_shards"
+    BATCH_SIZE = "batch_size"
+    MERGE_FUNCTION = "merge_function"
+
+
+# kinds of the messages sent to the worker processes
+_EVENTS = 0
+_GET = 1
+_CALL = 2
+_STOP = 3
+_CHECKPOINT = 4
+_RESTORE = 5
+
+# seconds waited for a reply before checking that the worker processes are still alive
+REPLY_TIMEOUT = 1.0
+
+
+def get_shard_checkpoint_path(path: str, shard: int) -> str:
+    """
+    Gets the path of the checkpoint file of a shard
+    """
+    return path + ".shard" + str(shard)
+
+
+def _run_shard(shard: int, factory: Callable[[], StreamingAlgorithm], requests, replies):
+    """
+    Main loop of a worker process: creates its own instance of the streaming algorithm, and processes the messages
+    in the order in which they are sent (hence, the events of a case are processed in order).
+    An error raised while processing the events is reported in the reply to the next request
+    """
+    algo = factory()
+    error = None
+    while True:
+        message = requests.get()
+        kind = message[0]
+        if kind == _EVENTS:
+            try:
+                algo.receive_batch(message[1])
+            except Exception:
+                if error is None:
+                    error = traceback.format_exc()
+        elif kind == _STOP:
+            break
+        else:
+            request_id = message[1]
+            try:
+                if error is not None:
+                    replies.put((request_id, shard, False, error))
+                    error = None
+                elif kind == _GET:
+                    replies.put((request_id, shard, True, (type(algo), algo.get())))
+                elif kind == _CHECKPOINT:
+                    # the snapshot is taken before replying; the file is written in background if required
+                    algo.checkpoint(get_shard_checkpoint_path(message[2], shard), background=message[3],
+                                    parameters=message[4])
+                    replies.put((request_id, shard, True, None))
+                elif kind == _RESTORE:
+                    replies.put((request_id, shard, True, algo.restore(get_shard_checkpoint_path(message[2], shard))))
+                else:
+                    replies.put((request_id, shard, True, getattr(algo, message[2])(*message[3])))
+            except Exception:
+                replies.put((request_id, shard, False, traceback.format_exc()))
+
+
+class ShardedStreamingAlgorithm(StreamingAlgorithm):
+    """
+    Streaming runtime that hash-partitions the events, by their case identifier, among worker processes
+    (the shards). Every shard has its own instance of the streaming algorithm, and receives the events of its cases
+    in the order in which they are received by the runtime. On get(), the results of the shards are merged.
+
+    The algorithm is created in the worker processes by the provided factory, that should be picklable
+    (for example, a function defined at the module level, or a functools.partial of it) when the processes
+    are spawned.
+    """
+
+    def __init__(self, factory: Callable[[], StreamingAlgorithm], parameters: Optional[Dict[Any, Any]] = None):
+        """
+        Initialize the sharded streaming runtime, starting the worker processes
+
+        Parameters
+        ---------------
+        factory
+            Function creating the instance of the streaming algorithm of a shard
+        parameters
+            Parameters of the runtime, including:
+             - Parameters.CASE_ID_KEY: the key of the event to use as case identifier
+             - Parameters.NUM_SHARDS: number of worker processes (default: number of CPUs)
+             - Parameters.BATCH_SIZE: number of events of a shard buffered before being sent together
+             to the worker process (default: 100). The buffered events are sent also before getting the result.
+             - Parameters.MERGE_FUNCTION: function merging the results of the shards (default: the merge_results
+             method of the streaming algorithm)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        self.num_shards = max(1, exec_utils.get_param_value(Parameters.NUM_SHARDS, parameters,
+                                                            multiprocessing.cpu_count()))
+        self.batch_size = max(1, exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 100))
+        self.merge_function = exec_utils.get_param_value(Parameters.MERGE_FUNCTION, parameters, None)
+        self._buffers = [[] for i in range(self.num_shards)]
+        self._request_ids = itertools.count()
+        self._replies = multiprocessing.Queue()
+        self._requests = []
+        self._workers = []
+        for i in range(self.num_shards):
+            requests = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=_run_shard, args=(i, factory, requests, self._replies), daemon=True)
+            worker.start()
+            self._requests.append(requests)
+            self._workers.append(worker)
+        StreamingAlgorithm.__init__(self)
+
+    def get_shard(self, case) -> int:
+        """
+        Gets the shard of the given case (the hash is stable across processes and executions)
+        """
+        return zlib.crc32(str(case).encode("utf-8")) % self.num_shards
+
+    def _process(self, event):
+        """
+        Sends an event to the shard of its case
+
+        Parameters
+        ---------------
+        event
+            Event
+        """
+        # the events without case identifier are sent to the first shard (the algorithm reports them)
+        shard = self.get_shard(event[self.case_id_key]) if self.case_id_key in event else 0
+        self._buffers[shard].append(event)
+        if len(self._buffers[shard]) >= self.batch_size:
+            self.__send(shard)
+
+    def _process_batch(self, events):
+        """
+        Sends a batch of events to the shards of their cases
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        for event in events:
+            self._process(event)
+
+    def __send(self, shard: int):
+        if self._buffers[shard]:
+            self._requests[shard].put((_EVENTS, self._buffers[shard]))
+            self._buffers[shard] = []
+
+    def flush(self):
+        """
+        Sends the buffered events to the worker processes
+        """
+        self._lock.acquire()
+        try:
+            self.__flush()
+        finally:
+            self._lock.release()
+
+    def __flush(self):
+        for shard in range(self.num_shards):
+            self.__send(shard)
+
+    def __request(self, shards: List[int], message) -> List[Any]:
+        """
+        Sends a request to the given shards (after the buffered events), returning the replies in the order
+        of the shards
+        """
+        self.__flush()
+        request_id = next(self._request_ids)
+        for shard in shards:
+            self._requests[shard].put((message[0], request_id) + message[1:])
+        replies = {}
+        while len(replies) < len(shards):
+            try:
+                reply_id, shard, success, value = self._replies.get(timeout=REPLY_TIMEOUT)
+            except queue.Empty:
+                for shard in shards:
+                    if shard not in replies and not self._workers[shard].is_alive():
+                        raise Exception("the worker process of the shard " + str(shard) + " terminated (exit code " +
+                                        str(self._workers[shard].exitcode) + ")")
+                continue
+            if reply_id == request_id:
+                replies[shard] = (success, value)
+        for shard in shards:
+            if not replies[shard][0]:
+                raise Exception(replies[shard][1])
+        return [replies[shard][1] for shard in shards]
+
+    def _current_result(self):
+        """
+        Gets the result of the algorithm on the whole stream, merging the results of the shards
+        """
+        replies = self.__request(list(range(self.num_shards)), (_GET,))
+        results = [result for cls, result in replies]
+        if self.merge_function is not None:
+            return self.merge_function(results)
+        return replies[0][0].merge_results(results)
+
+    def invoke(self, method: str, *args) -> List[Any]:
+        """
+        Invokes a method of the algorithm in all the shards (for example, terminate_all)
+
+        Parameters
+        ---------------
+        method
+            Name of the method
+        args
+            Arguments of the method
+
+        Returns
+        ---------------
+        results
+            Results of the invocation in every shard
+        """
+        self._lock.acquire()
+        try:
+            return self.__request(list(range(self.num_shards)), (_CALL, method, args))
+        finally:
+            self._lock.release()
+
+    def invoke_on_case(self, case, method: str, *args) -> Any:
+        """
+        Invokes a method of the algorithm in the shard of the given case (for example, terminate)
+
+        Parameters
+        ---------------
+        case
+            Case identifier
+        method
+            Name of the method
+        args
+            Arguments of the method
+
+        Returns
+        ---------------
+        result
+            Result of the invocation
+        """
+        self._lock.acquire()
+        try:
+            return self.__request([self.get_shard(case)], (_CALL, method, args))[0]
+        finally:
+            self._lock.release()
+
+    def checkpoint(self, path: str, background: bool = True, parameters: Optional[Dict[Any, Any]] = None):
+        """
+        Writes a checkpoint of the state of all the shards. Every shard writes its own checkpoint file
+        (see get_shard_checkpoint_path); the file at the provided path contains the offset of the runtime.
+        All the shards take their snapshot at the same position of the stream.
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file
+        background
+            If True, the checkpoint files are written by background threads (of the runtime and of the shards)
+        parameters
+            Parameters of the checkpoint writers (see pm4py.streaming.util.checkpoint)
+
+        Returns
+        ---------------
+        future
+            Future completed when the checkpoint file of the runtime has been written
+        """
+        if path not in self._checkpoint_writers:
+            self._checkpoint_writers[path] = checkpoint.CheckpointWriter(path, parameters=parameters)
+        self._lock.acquire()
+        try:
+            offset = self._offset
+            self.__request(list(range(self.num_shards)), (_CHECKPOINT, path, background, parameters))
+        finally:
+            self._lock.release()
+        return self._checkpoint_writers[path].write(offset, {}, background=background)
+
+    def restore(self, path: str) -> int:
+        """
+        Restores the state of all the shards from their last checkpoint (the number of shards should be the same
+        as when the checkpoint was taken)
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file
+
+        Returns
+        ---------------
+        offset
+            Number of events of the stream received by the runtime when the checkpoint was taken
+        """
+        offset, state = checkpoint.read(path)
+        self._lock.acquire()
+        try:
+            self.__request(list(range(self.num_shards)), (_RESTORE, path))
+            self._offset = offset
+        finally:
+            self._lock.release()
+        return offset
+
+    def shutdown(self):
+        """
+        Processes the buffered events and stops the worker processes
+        """
+        self._lock.acquire()
+        try:
+            self.__flush()
+            for requests in self._requests:
+                requests.put((_STOP,))
+            for worker in self._workers:
+                worker.join()
+            self._workers = []
+        finally:
+            self._lock.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+
+def apply(factory: Callable[[], StreamingAlgorithm],
+          parameters: Optional[Dict[Any, Any]] = None) -> ShardedStreamingAlgorithm:
+    """
+    Creates a sharded streaming runtime, in which every worker process runs its own instance of the
+    streaming algorithm on a partition of the cases
+
+    Parameters
+    ---------------
+    factory
+        Function creating the instance of the streaming algorithm of a shard
+    parameters
+        Parameters of the runtime
+
+    Returns
+    ---------------
+    sharded_algo
+        Sharded streaming algorithm (that can be registered to a live event stream)
+    """
+    return ShardedStreamingAlgorithm(factory, parameters=parameters)
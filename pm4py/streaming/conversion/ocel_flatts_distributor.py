@@ -14,7 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 from enum import Enum
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.objects.ocel import constants as ocel_constants
@@ -89,13 +89,36 @@ class OcelFlattsDistributor(object):
         event
             OCEL event (obtained for example using the ocel_iterator)
         """
-        base_event = {x: y for x, y in event.items() if not x.startswith(self.ot_prefix)}
-        base_event[self.activity_key] = base_event[self.ocel_activity]
-        base_event[self.timestamp_key] = base_event[self.ocel_timestamp]
-        del base_event[self.ocel_activity]
-        del base_event[self.ocel_timestamp]
+        for listener, fl_ev in self._flatten(event):
+            listener.append(fl_ev)
 
-        ev_objects = {x.split(self.ot_prefix)[1]: y for x, y in event.items() if x.startswith(self.ot_prefix)}
+    def append_batch(self, events: List[Dict[str, Any]]):
+        """
+        Flattens a batch of OCEL events (for example, a chunk yielded by the ocel_iterator with the yield_chunks
+        option), and sends the flattened events to the corresponding event streams.
+
+        Parameters
+        -------------
+        events
+            List of OCEL events
+        """
+        for event in events:
+            for listener, fl_ev in self._flatten(event):
+                listener.append(fl_ev)
+
+    def _flatten(self, event: Dict[str, Any]) -> Iterator[Tuple[LiveEventStream, Dict[str, Any]]]:
+        """
+        Gets the flattened events of an OCEL event, along with the event streams to which they should be sent
+        """
+        base_event = {}
+        ev_objects = {}
+        for x, y in event.items():
+            if x.startswith(self.ot_prefix):
+                ev_objects[x[len(self.ot_prefix):]] = y
+            else:
+                base_event[x] = y
+        base_event[self.activity_key] = base_event.pop(self.ocel_activity)
+        base_event[self.timestamp_key] = base_event.pop(self.ocel_timestamp)
 
         for ot in ev_objects:
             if ot in self.flattened_stream_listeners:
@@ -103,4 +126,4 @@ class OcelFlattsDistributor(object):
                     fl_ev = copy(base_event)
                     fl_ev[self.case_id_key] = obj
                     for listener in self.flattened_stream_listeners[ot]:
-                        listener.append(fl_ev)
+                        yield listener, fl_ev
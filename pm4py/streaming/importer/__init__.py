@@ -15,8 +15,11 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import pkgutil
-from pm4py.streaming.importer import csv
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["csv"]
 
 if pkgutil.find_loader("lxml"):
-    from pm4py.streaming.importer import xes
+    _submodules.append("xes")
 
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
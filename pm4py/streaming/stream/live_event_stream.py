@@ -16,6 +16,7 @@
 '''
 import collections
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pm4py.util import exec_utils
@@ -29,11 +30,26 @@ class StreamState(Enum):
 
 class Parameters(Enum):
     THREAD_POOL_SIZE = "thread_pool_size"
+    BATCH_SIZE = "batch_size"
+    BATCH_TIMEOUT = "batch_timeout"
 
 
 class LiveEventStream:
 
     def __init__(self, parameters=None):
+        """
+        Initialize the live event stream
+
+        Parameters
+        ---------------
+        parameters
+            Parameters of the stream, including:
+             - Parameters.THREAD_POOL_SIZE: number of threads delivering the events to the algorithms (6)
+             - Parameters.BATCH_SIZE: maximum number of events delivered together to the receive_batch method
+             of the algorithms. With the default (1), every event is delivered alone to the receive method.
+             - Parameters.BATCH_TIMEOUT: maximum time (in seconds) waited for the events filling a batch,
+             before delivering an incomplete batch (0: the events already in the stream are delivered)
+        """
         self._dq = collections.deque()
         self._state = StreamState.INACTIVE
         self._lock = threading.Lock()
@@ -41,6 +57,8 @@ class LiveEventStream:
         self._observers = set()
         self._mail_man = None
         self._tp = ThreadPoolExecutor(exec_utils.get_param_value(Parameters.THREAD_POOL_SIZE, parameters, 6))
+        self._batch_size = max(1, exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 1))
+        self._batch_timeout = exec_utils.get_param_value(Parameters.BATCH_TIMEOUT, parameters, 0.0)
 
     def append(self, event):
         self._cond.acquire()
@@ -64,10 +82,33 @@ class LiveEventStream:
                 self._tp.submit(algo.receive, event)
             self._cond.release()
 
+    def _deliver_batches(self):
+        while self._state != StreamState.INACTIVE:
+            self._cond.acquire()
+            while len(self._dq) == 0:
+                self._cond.notify()
+                if self._state != StreamState.FINISHED:
+                    self._cond.wait()
+                else:
+                    self._cond.release()
+                    return
+            if len(self._dq) < self._batch_size and self._batch_timeout > 0:
+                # waits (releasing the lock) for the events filling the batch
+                deadline = time.monotonic() + self._batch_timeout
+                while len(self._dq) < self._batch_size and self._state != StreamState.FINISHED:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            batch = [self._dq.popleft() for i in range(min(self._batch_size, len(self._dq)))]
+            for algo in self._observers:
+                self._tp.submit(algo.receive_batch, batch)
+            self._cond.release()
+
     def start(self):
         self._cond.acquire()
         self._state = StreamState.ACTIVE
-        self._mail_man = threading.Thread(target=self._deliver)
+        self._mail_man = threading.Thread(target=self._deliver if self._batch_size == 1 else self._deliver_batches)
         self._mail_man.start()
         self._cond.release()
 
@@ -14,4 +14,8 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.streaming.util import dictio, event_stream_printer, trace_stream_printer
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = ["dictio", "case_store", "checkpoint", "event_stream_printer", "trace_stream_printer"]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
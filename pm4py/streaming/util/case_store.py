@@ -0,0 +1,209 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+from pm4py.util import exec_utils
+
+
+class EvictionPolicy(Enum):
+    # evicts the case that has not received an event for the longest time
+    LRU = "lru"
+    # evicts the case that has been started first
+    OLDEST_FIRST = "oldest_first"
+
+
+class Parameters(Enum):
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
+    EVICTION_POLICY = "eviction_policy"
+    ON_CASE_EVICTION = "on_case_eviction"
+
+
+class CaseStateStore(object):
+    """
+    Keeps track of the open cases of a streaming algorithm, and decides which cases should be evicted
+    (to bound the memory occupied by the per-case state) when:
+    - the number of open cases exceeds the maximum number of cases (the least recently updated, or the oldest case,
+    is evicted, depending on the eviction policy)
+    - a case does not receive events for more than the idle time-to-live (in seconds). The expiration is checked
+    only when an event is received (or when evict() is called), hence the idle cases are not evicted while the
+    stream does not receive events
+
+    When no limit is set, the store does not keep track of the cases.
+
+    The state of the cases is kept by the algorithm (in its dictionaries). Before a case is dropped,
+    the finalization function of the algorithm is called (for example, to account for the end activity or to compute
+    the final conformance of the case); then, the (optional) eviction callback provided by the user is called with
+    the case and the result of the finalization.
+    """
+
+    def __init__(self, finalize: Optional[Callable[[str], Any]] = None, max_cases: Optional[int] = None,
+                 idle_ttl: Optional[float] = None, policy: EvictionPolicy = EvictionPolicy.LRU,
+                 on_eviction: Optional[Callable[[str, Any], None]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Constructor
+
+        Parameters
+        ---------------
+        finalize
+            Function of the algorithm finalizing an evicted case (returns the final result of the case)
+        max_cases
+            Maximum number of open cases (None: unbounded)
+        idle_ttl
+            Time (in seconds) after which a case not receiving events is evicted (None: no expiration)
+        policy
+            Eviction policy when the maximum number of cases is exceeded
+        on_eviction
+            Callback receiving the case and the result of its finalization, after its eviction
+        clock
+            Function returning the current time (in seconds)
+        """
+        self.finalize = finalize
+        self.max_cases = max_cases
+        self.idle_ttl = idle_ttl
+        self.policy = policy
+        self.on_eviction = on_eviction
+        self.clock = clock
+        self.evicted_cases = 0
+        # cases sorted by the time of their last event (the least recently updated case is the first)
+        self.__last_update = OrderedDict()
+        # cases sorted by their start (used by the oldest-first policy)
+        self.__started = OrderedDict()
+
+    def touch(self, case: str):
+        """
+        Registers an event of the given case (starting the case, if it is not open), and evicts the cases
+        exceeding the limits of the store (nothing is done when no limit is set)
+        """
+        if self.max_cases is None and self.idle_ttl is None:
+            return
+        now = self.clock()
+        self.__last_update[case] = now
+        self.__last_update.move_to_end(case)
+        if case not in self.__started:
+            self.__started[case] = now
+        self.evict()
+
+    def remove(self, case: str):
+        """
+        Removes a case that has been closed by the algorithm (without calling the finalization)
+        """
+        self.__last_update.pop(case, None)
+        self.__started.pop(case, None)
+
+    def evict(self) -> List[str]:
+        """
+        Evicts the expired cases, and the cases exceeding the maximum number of cases
+
+        Returns
+        ---------------
+        evicted
+            Evicted cases
+        """
+        evicted = []
+        if self.idle_ttl is not None:
+            threshold = self.clock() - self.idle_ttl
+            while self.__last_update and next(iter(self.__last_update.values())) < threshold:
+                evicted.append(self.__evict(next(iter(self.__last_update))))
+        if self.max_cases is not None:
+            order = self.__started if self.policy == EvictionPolicy.OLDEST_FIRST else self.__last_update
+            while len(order) > self.max_cases:
+                evicted.append(self.__evict(next(iter(order))))
+        return evicted
+
+    def __evict(self, case: str) -> str:
+        self.remove(case)
+        self.evicted_cases += 1
+        result = self.finalize(case) if self.finalize is not None else None
+        if self.on_eviction is not None:
+            self.on_eviction(case, result)
+        return case
+
+    def snapshot(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Gets the state of the store (for checkpointing)
+
+        Returns
+        ---------------
+        state
+            Dictionary associating to every open case the time of its start and of its last event
+        """
+        return {case: (self.__started[case], last_update) for case, last_update in self.__last_update.items()}
+
+    def restore(self, state: Dict[str, Tuple[float, float]]):
+        """
+        Restores the state of the store from a snapshot (the orders of the cases are rebuilt from the times)
+
+        Parameters
+        ---------------
+        state
+            Dictionary associating to every open case the time of its start and of its last event
+        """
+        self.__last_update = OrderedDict(sorted(((case, times[1]) for case, times in state.items()),
+                                                key=lambda x: x[1]))
+        self.__started = OrderedDict(sorted(((case, times[0]) for case, times in state.items()),
+                                            key=lambda x: x[1]))
+
+    def _get_active_cases(self) -> int:
+        return len(self.__last_update)
+
+    active_cases = property(_get_active_cases)
+
+    def __contains__(self, case: str) -> bool:
+        return case in self.__last_update
+
+    def __len__(self) -> int:
+        return len(self.__last_update)
+
+
+def apply(finalize: Optional[Callable[[str], Any]] = None,
+          parameters: Optional[Dict[Any, Any]] = None) -> CaseStateStore:
+    """
+    Creates the case-state store of a streaming algorithm
+
+    Parameters
+    ---------------
+    finalize
+        Function of the algorithm finalizing an evicted case
+    parameters
+        Parameters, including:
+        - Parameters.MAX_CASES => maximum number of open cases (default: None, unbounded)
+        - Parameters.CASE_IDLE_TTL => time (in seconds) after which a case not receiving events is evicted
+        (default: None, no expiration). The expiration is checked when the events are received
+        - Parameters.EVICTION_POLICY => eviction policy when the maximum number of cases is exceeded
+        (default: EvictionPolicy.LRU)
+        - Parameters.ON_CASE_EVICTION => callback receiving the case and its final result, after its eviction
+
+    Returns
+    ---------------
+    case_store
+        Case-state store
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_cases = exec_utils.get_param_value(Parameters.MAX_CASES, parameters, None)
+    idle_ttl = exec_utils.get_param_value(Parameters.CASE_IDLE_TTL, parameters, None)
+    policy = EvictionPolicy(exec_utils.get_param_value(Parameters.EVICTION_POLICY, parameters, EvictionPolicy.LRU))
+    on_eviction = exec_utils.get_param_value(Parameters.ON_CASE_EVICTION, parameters, None)
+
+    return CaseStateStore(finalize=finalize, max_cases=max_cases, idle_ttl=idle_ttl, policy=policy,
+                          on_eviction=on_eviction)
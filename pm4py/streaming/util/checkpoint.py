@@ -0,0 +1,192 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Checkpoints of the state of the streaming algorithms.
+
+A checkpoint file is a sequence of records. Every record is a (zlib-compressed) pickle of the offset in the stream
+(number of events received by the algorithm) and of the state of the dictionaries of the algorithm.
+The first record contains the full state; the following records contain only the entries which have been changed
+or deleted since the previous record. After a given number of incremental records, the checkpoint is compacted
+(a new file containing the full state atomically replaces the previous one).
+"""
+
+import os
+import pickle
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    MAX_DELTAS = "max_deltas"
+    COMPRESSION_LEVEL = "compression_level"
+
+
+_HEADER = struct.Struct(">Q")
+
+
+def snapshot(dictio) -> Dict[Any, Any]:
+    """
+    Gets a copy of the content of a dictionary (or of an object providing a snapshot method,
+    such as the dictio backends and the case-state store)
+    """
+    if hasattr(dictio, "snapshot"):
+        return dictio.snapshot()
+    return dict(dictio)
+
+
+def restore(dictio, values: Dict[Any, Any]):
+    """
+    Replaces the content of a dictionary (or of an object providing a restore method) with the given values
+    """
+    if hasattr(dictio, "restore"):
+        dictio.restore(values)
+    else:
+        dictio.clear()
+        dictio.update(values)
+
+
+class CheckpointWriter(object):
+    """
+    Writes the checkpoints of an algorithm in a file. The records are serialized, compressed and written by a
+    background thread, in the order in which the snapshots are provided.
+    """
+
+    def __init__(self, path: str, parameters: Optional[Dict[Any, Any]] = None):
+        """
+        Constructor
+
+        Parameters
+        ---------------
+        path
+            Path of the checkpoint file
+        parameters
+            Parameters, including:
+            - Parameters.MAX_DELTAS => number of incremental records after which the checkpoint is compacted (100)
+            - Parameters.COMPRESSION_LEVEL => zlib compression level (1)
+        """
+        self.path = path
+        self.max_deltas = exec_utils.get_param_value(Parameters.MAX_DELTAS, parameters, 100)
+        self.compression_level = exec_utils.get_param_value(Parameters.COMPRESSION_LEVEL, parameters, 1)
+        self._previous = None
+        self._num_deltas = 0
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def write(self, offset: int, state: Dict[str, Dict[Any, Any]], background: bool = True) -> Future:
+        """
+        Writes the checkpoint of the given state
+
+        Parameters
+        ---------------
+        offset
+            Offset in the stream (number of events received by the algorithm)
+        state
+            Copies of the dictionaries of the algorithm (not modified anymore by the algorithm)
+        background
+            If True, returns immediately (the checkpoint is written by a background thread)
+
+        Returns
+        ---------------
+        future
+            Future completed when the checkpoint has been written
+        """
+        future = self._executor.submit(self.__write, offset, state)
+        if not background:
+            future.result()
+        return future
+
+    def __write(self, offset: int, state: Dict[str, Dict[Any, Any]]):
+        if self._previous is None or self._num_deltas >= self.max_deltas or set(state) != set(self._previous):
+            record = {"offset": offset, "full": True, "state": state}
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                self.__append(f, record)
+            os.replace(tmp_path, self.path)
+            self._num_deltas = 0
+        else:
+            delta = {}
+            for name, values in state.items():
+                previous = self._previous[name]
+                changed = {k: v for k, v in values.items() if k not in previous or previous[k] != v}
+                deleted = [k for k in previous if k not in values]
+                delta[name] = {"changed": changed, "deleted": deleted}
+            record = {"offset": offset, "full": False, "state": delta}
+            with open(self.path, "ab") as f:
+                self.__append(f, record)
+            self._num_deltas += 1
+        self._previous = state
+
+    def __append(self, f, record):
+        data = zlib.compress(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL), self.compression_level)
+        f.write(_HEADER.pack(len(data)))
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    def wait(self):
+        """
+        Waits for the completion of the pending checkpoints
+        """
+        self._executor.submit(lambda: None).result()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+def read(path: str) -> Tuple[int, Dict[str, Dict[Any, Any]]]:
+    """
+    Reads a checkpoint file. An incomplete last record (for example, when the process has been killed while writing
+    the checkpoint) is ignored.
+
+    Parameters
+    ---------------
+    path
+        Path of the checkpoint file
+
+    Returns
+    ---------------
+    offset
+        Offset in the stream (number of events received by the algorithm) of the last complete record
+    state
+        State of the dictionaries of the algorithm
+    """
+    offset = 0
+    state = {}
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                break
+            data = f.read(_HEADER.unpack(header)[0])
+            try:
+                record = pickle.loads(zlib.decompress(data))
+            except (zlib.error, EOFError, pickle.UnpicklingError):
+                break
+            if record["full"]:
+                state = record["state"]
+            else:
+                for name, delta in record["state"].items():
+                    values = state[name]
+                    values.update(delta["changed"])
+                    for k in delta["deleted"]:
+                        del values[k]
+            offset = record["offset"]
+    return offset, state
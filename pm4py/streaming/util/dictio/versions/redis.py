@@ -65,6 +65,28 @@ class ThreadSafeRedisDict(dict):
         self.lock.release()
         return ret
 
+    def snapshot(self) -> Dict[Any, Any]:
+        """
+        Gets a (plain) copy of the content of the Redis dictionary
+        """
+        self.lock.acquire()
+        keys = list(self.redis_connection.keys())
+        ret = dict(zip(keys, self.redis_connection.mget(keys))) if keys else {}
+        self.lock.release()
+        return ret
+
+    def restore(self, values: Dict[Any, Any]):
+        """
+        Replaces the content of the Redis dictionary with the given values
+        """
+        self.lock.acquire()
+        self.redis_connection.flushdb()
+        if values:
+            self.redis_connection.mset(values)
+        dict.clear(self)
+        dict.update(self, values)
+        self.lock.release()
+
     def flushdb(self):
         self.lock.acquire()
         self.redis_connection.flushdb()
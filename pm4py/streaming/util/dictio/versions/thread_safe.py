@@ -55,6 +55,24 @@ class ThreadSafeDict(dict):
         self.lock.release()
         return ret
 
+    def snapshot(self) -> Dict[Any, Any]:
+        """
+        Gets a (plain) copy of the content of the dictionary
+        """
+        self.lock.acquire()
+        ret = dict(dict.items(self))
+        self.lock.release()
+        return ret
+
+    def restore(self, values: Dict[Any, Any]):
+        """
+        Replaces the content of the dictionary with the given values
+        """
+        self.lock.acquire()
+        dict.clear(self)
+        dict.update(self, values)
+        self.lock.release()
+
 
 def apply(parameters: Optional[Dict[Any, Any]] = None):
     return ThreadSafeDict()
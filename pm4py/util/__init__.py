@@ -14,5 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.util import variants_util, lp, constants, points_subset, business_hours, xes_constants, vis_utils, \
-    dt_parsing, colors, exec_utils, pandas_utils, typing, compression
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "variants_util", "lp", "constants", "points_subset", "business_hours", "xes_constants", "vis_utils",
+    "dt_parsing", "colors", "exec_utils", "pandas_utils", "typing", "compression", "intervals"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -14,12 +14,23 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-import math
-from datetime import timedelta, datetime, time
+from bisect import bisect_right
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
+
 from pm4py.util import constants
 
+# number of seconds in a week
+WEEK_SECONDS = 7 * 24 * 60 * 60
+# the business hour slots are expressed in seconds since the start of the week (Monday 00:00).
+# the Unix epoch (01/01/1970) is a Thursday, so the weeks are aligned to Monday 29/12/1969.
+REFERENCE_MONDAY = datetime(1969, 12, 29)
+_REFERENCE_MONDAY_NS = -3 * 24 * 60 * 60 * 10 ** 9
+_WEEK_NS = WEEK_SECONDS * 10 ** 9
+
 
 def soj_time_business_hours_diff(st: datetime, et: datetime, business_hour_slots: List[Tuple[int]],
                                  work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> float:
@@ -63,6 +74,252 @@ def get_overlapping_time(timespan1_begin: datetime, timespan1_end: datetime,
     return overlap
 
 
+def unify_business_hour_slots(business_hour_slots: List[Tuple[int]]) -> List[List[int]]:
+    """
+    Performs the union of the business hour slots, in order to avoid overlapping business hours
+
+    Parameters
+    -----------------
+    business_hour_slots
+        Work schedule of the company (list of tuples, each containing the start and the end of the slot
+        in seconds since the week start)
+
+    Returns
+    -----------------
+    unified_slots
+        Sorted list of non-overlapping slots
+    """
+    unified = []
+    for begin, end in sorted(business_hour_slots):
+        if unified and unified[-1][1] >= begin - 1:
+            unified[-1][1] = max(unified[-1][1], end)
+        else:
+            unified.append([begin, end])
+    return unified
+
+
+class BusinessHoursSchedule:
+    """
+    Closed-form computation of the business hours between timestamps.
+
+    The weekly schedule is folded into [0, WEEK_SECONDS) and a table with the cumulative working time at the
+    beginning of every slot is precomputed. The working time elapsed since a fixed reference Monday up to a given
+    timestamp is then obtained with arithmetic on the position of the timestamp inside its week, and the business
+    hours between two timestamps are the difference between the two cumulative values.
+    The computation works both on single datetimes and on NumPy/Pandas arrays of timestamps (naive or
+    timezone-aware: the wall-clock time is considered, as done by the BusinessHours class).
+    """
+
+    def __init__(self, business_hour_slots: List[Tuple[int]] = constants.DEFAULT_BUSINESS_HOUR_SLOTS,
+                 work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR):
+        folded = []
+        for begin, end in unify_business_hour_slots(business_hour_slots):
+            if end - begin >= WEEK_SECONDS:
+                folded = [(0, WEEK_SECONDS)]
+                break
+            begin0 = begin % WEEK_SECONDS
+            end0 = begin0 + (end - begin)
+            if end0 > WEEK_SECONDS:
+                folded.append((begin0, WEEK_SECONDS))
+                folded.append((0, end0 - WEEK_SECONDS))
+            elif end0 > begin0:
+                folded.append((begin0, end0))
+
+        slots = []
+        for begin, end in sorted(folded):
+            if slots and slots[-1][1] >= begin:
+                slots[-1][1] = max(slots[-1][1], end)
+            else:
+                slots.append([begin, end])
+
+        self.starts = [b * 10 ** 9 for b, e in slots]
+        self.lengths = [(e - b) * 10 ** 9 for b, e in slots]
+        self.cumulative = [0] * len(slots)
+        for i in range(1, len(slots)):
+            self.cumulative[i] = self.cumulative[i - 1] + self.lengths[i - 1]
+        self.week_total = sum(self.lengths)
+
+        self.__starts = np.array(self.starts, dtype=np.int64)
+        self.__lengths = np.array(self.lengths, dtype=np.int64)
+        self.__cumulative = np.array(self.cumulative, dtype=np.int64)
+
+        # work calendar (it permits querying if a given day is a working day in a given culture) - not used yet
+        self.work_calendar = work_calendar
+
+    def working_ns(self, timestamps_ns: np.ndarray) -> np.ndarray:
+        """
+        Gets the working time (in nanoseconds) elapsed from the reference Monday up to the provided timestamps
+
+        Parameters
+        ----------------
+        timestamps_ns
+            Array of (wall-clock) timestamps, expressed as nanoseconds since the Unix epoch
+
+        Returns
+        ----------------
+        working_ns
+            Array of cumulative working times
+        """
+        if not self.starts:
+            return np.zeros(len(timestamps_ns), dtype=np.int64)
+        weeks, positions = np.divmod(np.asarray(timestamps_ns, dtype=np.int64) - _REFERENCE_MONDAY_NS, _WEEK_NS)
+        idx = np.searchsorted(self.__starts, positions, side="right") - 1
+        valid = idx >= 0
+        idx[~valid] = 0
+        within = self.__cumulative[idx] + np.minimum(positions - self.__starts[idx], self.__lengths[idx])
+        within[~valid] = 0
+        return weeks * self.week_total + within
+
+    def working_ns_scalar(self, dt: datetime) -> int:
+        """
+        Gets the working time (in nanoseconds) elapsed from the reference Monday up to the provided datetime
+
+        Parameters
+        ----------------
+        dt
+            Datetime (the wall-clock time is considered)
+
+        Returns
+        ----------------
+        working_ns
+            Cumulative working time
+        """
+        delta = dt.replace(tzinfo=None) - REFERENCE_MONDAY
+        timestamp_ns = ((delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds) * 1000
+        weeks, position = divmod(timestamp_ns, _WEEK_NS)
+        idx = bisect_right(self.starts, position) - 1
+        within = 0
+        if idx >= 0:
+            within = self.cumulative[idx] + min(position - self.starts[idx], self.lengths[idx])
+        return weeks * self.week_total + within
+
+    def get_seconds(self, st: datetime, et: datetime) -> float:
+        """
+        Gets the business hours (in seconds) between two datetimes
+
+        Parameters
+        ----------------
+        st
+            Start datetime
+        et
+            End datetime
+
+        Returns
+        ----------------
+        seconds
+            Business seconds between the two datetimes (0 if the end precedes the start)
+        """
+        return max(0, self.working_ns_scalar(et) - self.working_ns_scalar(st)) / 10 ** 9
+
+    def get_seconds_vectorized(self, st, et) -> np.ndarray:
+        """
+        Gets the business hours (in seconds) between two arrays of timestamps
+
+        Parameters
+        ----------------
+        st
+            Start timestamps (Pandas series / index, or NumPy datetime64 array)
+        et
+            End timestamps (Pandas series / index, or NumPy datetime64 array)
+
+        Returns
+        ----------------
+        seconds
+            NumPy array containing the business seconds between the timestamps (NaN where any of the two is missing)
+        """
+        st_ns, st_nat = to_wall_clock_ns(st)
+        et_ns, et_nat = to_wall_clock_ns(et)
+        diff = np.maximum(self.working_ns(et_ns) - self.working_ns(st_ns), 0) / 10 ** 9
+        missing = st_nat | et_nat
+        if missing.any():
+            diff[missing] = np.nan
+        return diff
+
+
+def to_wall_clock_ns(timestamps) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Transforms an array of timestamps into an array of nanoseconds since the Unix epoch,
+    considering the wall-clock time of timezone-aware timestamps
+
+    Parameters
+    ----------------
+    timestamps
+        Pandas series / index, or NumPy datetime64 array
+
+    Returns
+    ----------------
+    timestamps_ns
+        Array of nanoseconds
+    nat_mask
+        Boolean mask of the missing (NaT) timestamps
+    """
+    import pandas as pd
+
+    if isinstance(timestamps, pd.Series):
+        if getattr(timestamps.dt, "tz", None) is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        values = timestamps.to_numpy(dtype="datetime64[ns]")
+    elif isinstance(timestamps, pd.DatetimeIndex):
+        if timestamps.tz is not None:
+            timestamps = timestamps.tz_localize(None)
+        values = timestamps.to_numpy(dtype="datetime64[ns]")
+    else:
+        return to_wall_clock_ns(pd.DatetimeIndex(pd.to_datetime(np.asarray(timestamps))))
+    nat_mask = np.isnat(values)
+    return values.view(np.int64), nat_mask
+
+
+@lru_cache(maxsize=32)
+def __get_schedule(business_hour_slots: Tuple[Tuple[int]]) -> BusinessHoursSchedule:
+    return BusinessHoursSchedule(business_hour_slots=business_hour_slots)
+
+
+def get_schedule(business_hour_slots: List[Tuple[int]] = constants.DEFAULT_BUSINESS_HOUR_SLOTS,
+                 work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> BusinessHoursSchedule:
+    """
+    Gets the (cached) closed-form business hours schedule for the provided slots
+
+    Parameters
+    -----------------
+    business_hour_slots
+        Work schedule of the company (list of tuples, each containing the start and the end of the slot
+        in seconds since the week start)
+    work_calendar
+        Work calendar (it permits querying if a given day is a working day in a given culture) - not used yet
+
+    Returns
+    -----------------
+    schedule
+        Business hours schedule
+    """
+    return __get_schedule(tuple(tuple(slot) for slot in business_hour_slots))
+
+
+def soj_time_business_hours_diff_vectorized(st, et, business_hour_slots: List[Tuple[int]],
+                                            work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> np.ndarray:
+    """
+    Calculates the difference between the provided arrays of timestamps based on the business hours
+
+    Parameters
+    -----------------
+    st
+        Start timestamps (Pandas series / index, or NumPy datetime64 array)
+    et
+        Complete timestamps (Pandas series / index, or NumPy datetime64 array)
+    business_hour_slots
+        work schedule of the company, provided as a list of tuples where each tuple represents one time slot of business
+        hours (see soj_time_business_hours_diff)
+    work_calendar
+        work calendar (it permits querying if a given day is a working day in a given culture)
+
+    Returns
+    -----------------
+    diff
+        NumPy array with the differences in business hours
+    """
+    return get_schedule(business_hour_slots, work_calendar).get_seconds_vectorized(st, et)
+
+
 class BusinessHours:
     def __init__(self, datetime1, datetime2, **kwargs):
         self.datetime1 = datetime1
@@ -72,44 +329,11 @@ class BusinessHours:
             "business_hour_slots"] if "business_hour_slots" in kwargs else constants.DEFAULT_BUSINESS_HOUR_SLOTS
 
         # union of business hour slots in order to avoid overlapping business hours
-        self.business_hour_slots_unified = []
-        for begin, end in sorted(self.business_hour_slots):
-            if self.business_hour_slots_unified and self.business_hour_slots_unified[-1][1] >= begin - 1:
-                self.business_hour_slots_unified[-1][1] = max(self.business_hour_slots_unified[-1][1], end)
-            else:
-                self.business_hour_slots_unified.append([begin, end])
+        self.business_hour_slots_unified = unify_business_hour_slots(self.business_hour_slots)
 
         # work calendar (it permits querying if a given day is a working day in a given culture) - not used yet
         self.work_calendar = kwargs[
             "work_calendar"] if "work_calendar" in kwargs else constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR
 
     def get_seconds(self):
-        sum = 0
-        week_start = self.datetime1.date() - timedelta(days=self.datetime1.weekday())
-
-        for bhs, bhe in self.business_hour_slots_unified:
-            begin_day_of_week = math.floor(bhs / 60 / 60 / 24)
-            begin_seconds_of_day = bhs - 24 * 60 * 60 * begin_day_of_week
-            bh_start = datetime.combine(week_start, time.min) + timedelta(days=begin_day_of_week) + timedelta(
-                seconds=begin_seconds_of_day)
-
-            end_day_of_week = math.floor(bhe / 60 / 60 / 24)
-            end_seconds_of_day = bhe - 24 * 60 * 60 * end_day_of_week
-            bh_end = datetime.combine(week_start, time.min) + timedelta(days=end_day_of_week) + timedelta(
-                seconds=end_seconds_of_day)
-
-            overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
-            sum += overlapping_time
-
-            while True:
-                bh_start += timedelta(days=7)
-                bh_end += timedelta(days=7)
-
-                overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
-
-                if overlapping_time <= 0:
-                    break
-
-                sum += overlapping_time
-
-        return sum
+        return get_schedule(self.business_hour_slots, self.work_calendar).get_seconds(self.datetime1, self.datetime2)
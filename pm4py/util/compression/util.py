@@ -190,14 +190,12 @@ def discover_dfg(log: Union[UCL, MCL], index: int = 0) -> DFG:
 
 def discover_dfg_uvcl(log: UVCL) -> DFG:
     dfg = DFG()
-    [dfg.graph.update({(t[i], t[i + 1]): log[t]}) for t in log for i in range(0, len(t) - 1) if len(t)]
-    for a in get_alphabet(log):
-        for t in log:
-            if len(t) > 0:
-                if t[0] == a:
-                    dfg.start_activities.update({a: log[t]})
-                if t[len(t) - 1] == a:
-                    dfg.end_activities.update({a: log[t]})
+    for t, n in log.items():
+        if len(t) > 0:
+            for i in range(0, len(t) - 1):
+                dfg.graph[(t[i], t[i + 1])] += n
+            dfg.start_activities[t[0]] += n
+            dfg.end_activities[t[len(t) - 1]] += n
     return dfg
 
 
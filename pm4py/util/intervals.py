@@ -0,0 +1,55 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Utilities for the computation of the overlap between intervals (such as the lifecycles of cases or objects),
+based on the sorted arrays of their begins and ends.
+"""
+
+import numpy as np
+
+
+def count_overlapping(begins: np.ndarray, ends: np.ndarray, query_begins: np.ndarray, query_ends: np.ndarray) -> np.ndarray:
+    """
+    Counts, for every query interval, the number of distinct intervals [begin, end) overlapping it.
+    The intervals are sorted once, and every query is answered by two binary searches (O(n log n) overall):
+    an interval [b, e) overlaps the query [qb, qe) iff b < qe and e > qb, and every interval ending before qb
+    (e <= qb) also begins before qe.
+
+    Parameters
+    -----------------
+    begins
+        Begins of the intervals
+    ends
+        Ends of the intervals (greater than the begins)
+    query_begins
+        Begins of the query intervals
+    query_ends
+        Ends of the query intervals
+
+    Returns
+    -----------------
+    counts
+        Number of overlapping (distinct) intervals for every query interval
+    """
+    begins = np.asarray(begins, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    if len(begins) > 0:
+        # identical intervals are counted once
+        unique_intervals = np.unique(np.stack([begins, ends], axis=1), axis=0)
+        begins, ends = np.sort(unique_intervals[:, 0]), np.sort(unique_intervals[:, 1])
+    return np.searchsorted(begins, np.asarray(query_ends, dtype=float), side="left") - \
+        np.searchsorted(ends, np.asarray(query_begins, dtype=float), side="right")
@@ -0,0 +1,61 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def lazy_submodules(package_name: str, submodules: Iterable[str], attributes: Optional[Dict[str, str]] = None) -> \
+        Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Gets the module-level __getattr__ and __dir__ functions (PEP 562) of a package, such that its submodules
+    (and the attributes re-exported from its submodules) are imported only when they are accessed for the first time
+
+    Parameters
+    ----------------
+    package_name
+        Name of the package (__name__)
+    submodules
+        Names of the submodules of the package that should be available as attributes of the package
+    attributes
+        (optional) dictionary associating to the name of a re-exported attribute the name of the submodule
+        (relative to the package) defining it
+
+    Returns
+    ----------------
+    __getattr__
+        Function resolving the lazy attributes of the package
+    __dir__
+        Function listing the attributes of the package (including the ones not yet loaded)
+    """
+    submodules = frozenset(submodules)
+    attributes = dict(attributes) if attributes is not None else {}
+
+    def __getattr__(name: str):
+        if name in submodules:
+            # import_module also binds the submodule as attribute of the package
+            return importlib.import_module(package_name + "." + name)
+        if name in attributes:
+            value = getattr(importlib.import_module(package_name + "." + attributes[name]), name)
+            setattr(sys.modules[package_name], name, value)
+            return value
+        raise AttributeError("module %r has no attribute %r" % (package_name, name))
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])).union(submodules, attributes))
+
+    return __getattr__, __dir__
@@ -15,9 +15,14 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = []
 
 if pkgutil.find_loader("pulp"):
-    from pm4py.util.lp.variants import pulp_solver
+    _submodules.append("pulp_solver")
 
 if pkgutil.find_loader("scipy"):
-    from pm4py.util.lp.variants import scipy_solver
+    _submodules.append("scipy_solver")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
@@ -15,21 +15,26 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import pkgutil
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = []
 
 if pkgutil.find_loader("graphviz"):
     # imports the visualizations only if graphviz is installed
-    from pm4py.visualization import common, dfg, petri_net, process_tree, transition_system, \
-        bpmn, trie, ocel, network_analysis
+    _submodules.extend(["common", "dfg", "petri_net", "process_tree", "transition_system",
+                        "bpmn", "trie", "ocel", "network_analysis"])
     if pkgutil.find_loader("matplotlib") and pkgutil.find_loader("pyvis"):
         # SNA requires both packages matplotlib and pyvis. These are included in the default installation;
         # however, they may lead to problems in some platforms/deployments
-        from pm4py.visualization import sna, performance_spectrum
+        _submodules.extend(["sna", "performance_spectrum"])
     if pkgutil.find_loader("pydotplus"):
         # heuristics net visualization requires pydotplus. This is included in the default installation;
         # however, they may lead to problems in some platforms/deployments
-        from pm4py.visualization import heuristics_net
+        _submodules.append("heuristics_net")
 
 if pkgutil.find_loader("matplotlib"):
     # graphs require matplotlib. This is included in the default installation;
     # however, they may lead to problems in some platforms/deployments
-    from pm4py.visualization import graphs
+    _submodules.append("graphs")
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
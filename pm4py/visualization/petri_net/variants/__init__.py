@@ -14,5 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.visualization.petri_net.variants import alignments, greedy_decoration_frequency, \
-    greedy_decoration_performance, token_decoration_frequency, token_decoration_performance, wo_decoration
+from pm4py.util.lazy_loading import lazy_submodules
+
+_submodules = [
+    "alignments", "greedy_decoration_frequency", "greedy_decoration_performance",
+    "token_decoration_frequency", "token_decoration_performance", "wo_decoration"
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, _submodules)
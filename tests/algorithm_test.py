@@ -70,6 +70,32 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_prefix_trie(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        import pm4py
+        from pm4py.algo.conformance.tokenreplay.variants import token_replay
+        # model not fitting all the variants
+        net, im, fm = pm4py.discover_petri_net_inductive(pm4py.filter_variants_top_k(log, 2))
+        for stop_immediately_unfit in [False, True]:
+            for cleaning_token_flood in [False, True]:
+                parameters = {token_replay.Parameters.STOP_IMMEDIATELY_UNFIT: stop_immediately_unfit,
+                              token_replay.Parameters.CLEANING_TOKEN_FLOOD: cleaning_token_flood,
+                              token_replay.Parameters.SHOW_PROGRESS_BAR: False}
+                replayed_trie = token_replay.apply(log, net, im, fm, parameters=parameters)
+                parameters[token_replay.Parameters.USE_PREFIX_TRIE] = False
+                replayed_traces = token_replay.apply(log, net, im, fm, parameters=parameters)
+                self.assertEqual(replayed_trie, replayed_traces)
+        # with a maximum execution time, the variants are replayed one by one
+        apply_variants_prefix_trie = token_replay.apply_variants_prefix_trie
+        token_replay.apply_variants_prefix_trie = None
+        try:
+            replayed_traces = token_replay.apply(log, net, im, fm, parameters={
+                token_replay.Parameters.THREAD_MAX_EX_TIME: 5, token_replay.Parameters.SHOW_PROGRESS_BAR: False})
+        finally:
+            token_replay.apply_variants_prefix_trie = apply_variants_prefix_trie
+        self.assertEqual(replayed_traces, token_replay.apply(log, net, im, fm, parameters={
+            token_replay.Parameters.SHOW_PROGRESS_BAR: False}))
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
@@ -117,6 +143,52 @@ class AlgorithmTest(unittest.TestCase):
         process_tree = inductive_miner.apply(log)
         net, im, fm = process_tree_converter.apply(process_tree)
 
+    def test_inductive_miner_parallel_recursion(self):
+        log = xes_importer.apply(os.path.join("input_data", "roadtraffic100traces.xes"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.algo.discovery.inductive.variants.abc import Parameters
+        for variant in [inductive_miner.Variants.IM, inductive_miner.Variants.IMf]:
+            tree = inductive_miner.apply(log, variant=variant)
+            parallel_tree = inductive_miner.apply(log, variant=variant,
+                                                  parameters={Parameters.PARALLEL_RECURSION: True,
+                                                              Parameters.PARALLEL_RECURSION_MIN_SIZE: 0})
+            self.assertEqual(repr(tree), repr(parallel_tree))
+
+    def test_inductive_miner_shared_pool(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.algo.discovery.inductive import pool
+        from pm4py.algo.discovery.inductive.variants.abc import Parameters
+        parameters = {Parameters.MULTIPROCESSING: True, Parameters.PARALLEL_RECURSION: True,
+                      Parameters.PARALLEL_RECURSION_MIN_SIZE: 0}
+        tree = inductive_miner.apply(log)
+        self.assertEqual(repr(inductive_miner.apply(log, parameters=parameters)), repr(tree))
+        shared_pool = pool.get_pool()
+        self.assertEqual(repr(inductive_miner.apply(log, parameters=parameters)), repr(tree))
+        self.assertIs(pool.get_pool(), shared_pool)
+        pool.set_max_workers(pool.get_max_workers())
+        self.assertIs(pool.get_pool(), shared_pool)
+        pool.set_max_workers(pool.get_max_workers() + 1)
+        self.assertIsNot(pool.get_pool(), shared_pool)
+        pool.set_max_workers(None)
+        pool.shutdown()
+
+    def test_inductive_miner_projection(self):
+        from collections import Counter
+        from pm4py.util.compression import util as comut
+        from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        uvcl = comut.get_variants(comut.project_univariate(log, key="concept:name"))
+        obj = IMDataStructureUVCL(uvcl)
+        for removed in [{"reinitiate request"}, {"check ticket", "decide"}, {"register request", "pay compensation"}]:
+            projected = obj.project_activities(removed)
+            expected = Counter()
+            for t in uvcl:
+                expected[tuple(e for e in t if e not in removed)] = uvcl[t]
+            expected_dfg = comut.discover_dfg_uvcl(expected)
+            self.assertEqual(dict(projected.data_structure), dict(expected))
+            self.assertEqual(tuple(projected.dfg), tuple(expected_dfg))
+
     def test_performance_spectrum(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.performance_spectrum import algorithm as pspectrum
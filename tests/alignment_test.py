@@ -100,6 +100,96 @@ class AlignmentTest(unittest.TestCase):
         net, im, fm = pm4py.discover_petri_net_inductive(log)
         align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_TWEAKED_STATE_EQUATION_A_STAR)
 
+    def test_alignments_worker_pool(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net import pool
+        log = pm4py.read_xes("input_data/roadtraffic100traces.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+        parameters = {align_alg.Parameters.SHOW_PROGRESS_BAR: False, align_alg.Parameters.CORES: 2}
+        aligned_traces = align_alg.apply_log(log, net, im, fm, parameters=dict(parameters))
+        for i in range(2):
+            # the second call reuses the worker processes started by the first one
+            aligned_traces_mp = align_alg.apply_multiprocessing(log, net, im, fm, parameters=dict(parameters))
+            self.assertEqual([x["cost"] for x in aligned_traces], [x["cost"] for x in aligned_traces_mp])
+            self.assertEqual([x["fitness"] for x in aligned_traces], [x["fitness"] for x in aligned_traces_mp])
+        self.assertEqual(len(pool._pools), 1)
+        pool.shutdown_pools()
+        chunks = pool.balanced_chunks([10, 1, 7, 3, 3, 2], 2)
+        self.assertEqual(sorted(i for chunk in chunks for i in chunk), list(range(6)))
+        self.assertEqual([sum([10, 1, 7, 3, 3, 2][i] for i in chunk) for chunk in chunks], [13, 13])
+
+    def test_alignments_cache(self):
+        import copy
+        import tempfile
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net import cache
+        log = pm4py.read_xes("input_data/running-example.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            disk_path = os.path.join(temp_dir, "alignments.db")
+            alignments_cache = cache.AlignmentsCache(disk_path=disk_path)
+            parameters = {align_alg.Parameters.SHOW_PROGRESS_BAR: False,
+                          align_alg.Parameters.ALIGNMENTS_CACHE: alignments_cache}
+            aligned_traces = align_alg.apply_log(log, net, im, fm, parameters=dict(parameters))
+            self.assertEqual(alignments_cache.hits, 0)
+            aligned_traces2 = align_alg.apply_log(log, net, im, fm, parameters=dict(parameters))
+            self.assertGreater(alignments_cache.hits, 0)
+            self.assertEqual(aligned_traces, aligned_traces2)
+            alignments_cache.close()
+            # the fingerprint does not depend on the identity of the objects, and the entries are persisted
+            net2, im2, fm2 = copy.deepcopy((net, im, fm))
+            self.assertEqual(cache.model_fingerprint(net, im, fm, align_alg.DEFAULT_VARIANT),
+                             cache.model_fingerprint(net2, im2, fm2, align_alg.DEFAULT_VARIANT))
+            alignments_cache2 = cache.AlignmentsCache(disk_path=disk_path)
+            parameters[align_alg.Parameters.ALIGNMENTS_CACHE] = alignments_cache2
+            aligned_traces3 = align_alg.apply_log(log, net2, im2, fm2, parameters=dict(parameters))
+            self.assertEqual(alignments_cache2.misses, 0)
+            self.assertEqual([x["alignment"] for x in aligned_traces], [x["alignment"] for x in aligned_traces3])
+            alignments_cache2.close()
+
+    def test_alignments_cache_non_isomorphic_models(self):
+        from pm4py.algo.conformance.alignments.petri_net import cache
+        from pm4py.objects.log.obj import EventLog, Trace, Event
+        from pm4py.objects.petri_net.obj import PetriNet, Marking
+        from pm4py.objects.petri_net.utils import petri_utils
+
+        def cycles(length, same_names=False):
+            # two cycles of length two, or one cycle of length four, alternating the labels a and b
+            net = PetriNet("cycles")
+            places = [PetriNet.Place("p" if same_names else "p%d" % i) for i in range(4)]
+            for i in range(4):
+                net.places.add(places[i])
+                trans = PetriNet.Transition("t" if same_names else "t%d" % i, "a" if i % 2 == 0 else "b")
+                net.transitions.add(trans)
+                petri_utils.add_arc_from_to(places[i], trans, net)
+                petri_utils.add_arc_from_to(trans, places[(i + 1) % length + (i // length) * length], net)
+            marking = Marking({places[0]: 1, places[2]: 1})
+            return net, marking, Marking(marking)
+
+        log = EventLog([Trace([Event({"concept:name": "a"}), Event({"concept:name": "b"})])])
+        net1, im1, fm1 = cycles(2)
+        net2, im2, fm2 = cycles(4)
+        self.assertNotEqual(cache.model_fingerprint(net1, im1, fm1, align_alg.DEFAULT_VARIANT),
+                            cache.model_fingerprint(net2, im2, fm2, align_alg.DEFAULT_VARIANT))
+        alignments_cache = cache.AlignmentsCache()
+        parameters = {align_alg.Parameters.SHOW_PROGRESS_BAR: False,
+                      align_alg.Parameters.ALIGNMENTS_CACHE: alignments_cache}
+        self.assertEqual(align_alg.apply_log(log, net1, im1, fm1, parameters=dict(parameters))[0]["cost"], 0)
+        expected = align_alg.apply_log(log, net2, im2, fm2, parameters={
+            align_alg.Parameters.SHOW_PROGRESS_BAR: False})[0]["cost"]
+        self.assertGreater(expected, 0)
+        self.assertEqual(align_alg.apply_log(log, net2, im2, fm2, parameters=dict(parameters))[0]["cost"], expected)
+        # models whose places and transitions share the same names
+        net1, im1, fm1 = cycles(2, same_names=True)
+        net2, im2, fm2 = cycles(4, same_names=True)
+        self.assertNotEqual(cache.model_fingerprint(net1, im1, fm1, align_alg.DEFAULT_VARIANT),
+                            cache.model_fingerprint(net2, im2, fm2, align_alg.DEFAULT_VARIANT))
+        self.assertEqual(cache.model_fingerprint(net1, im1, fm1, align_alg.DEFAULT_VARIANT),
+                         cache.model_fingerprint(net1, im1, fm1, align_alg.DEFAULT_VARIANT))
+        alignments_cache = cache.AlignmentsCache()
+        parameters[align_alg.Parameters.ALIGNMENTS_CACHE] = alignments_cache
+        self.assertEqual(align_alg.apply_log(log, net1, im1, fm1, parameters=dict(parameters))[0]["cost"], 0)
+        self.assertEqual(align_alg.apply_log(log, net2, im2, fm2, parameters=dict(parameters))[0]["cost"], expected)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import unittest
 
+import pandas as pd
+
 import pm4py
 
 
@@ -18,6 +20,24 @@ class DfgTests(unittest.TestCase):
         act_count = pm4py.get_event_attribute_values(log, "concept:name")
         dfg_filtering.filter_dfg_on_paths_percentage(dfg, sa, ea, act_count, 0.3)
 
+    def test_dataframe_dfg_consistency(self):
+        from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics
+        from pm4py.algo.discovery.dfg.variants import native, performance
+        df = pm4py.format_dataframe(pd.read_csv("input_data/receipt.csv"), case_id="case:concept:name",
+                                    activity_key="concept:name", timestamp_key="time:timestamp")
+        log = pm4py.convert_to_event_log(df)
+        for window in [1, 2]:
+            for keep_once_per_case in [False, True]:
+                dfg_df = df_statistics.get_dfg_graph(df, window=window, keep_once_per_case=keep_once_per_case)
+                dfg_log = native.apply(log, parameters={native.Parameters.WINDOW: window,
+                                                        native.Parameters.KEEP_ONCE_PER_CASE: keep_once_per_case})
+                self.assertEqual(dfg_df, dict(dfg_log))
+        dfg_perf_df = df_statistics.get_dfg_graph(df, measure="performance")
+        dfg_perf_log = performance.apply(log)
+        self.assertEqual(set(dfg_perf_df), set(dfg_perf_log))
+        for arc in dfg_perf_df:
+            self.assertAlmostEqual(dfg_perf_df[arc], dfg_perf_log[arc], delta=1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -61,6 +61,29 @@ class HeuMinerTest(unittest.TestCase):
         net, im, fm = heuristics_miner.apply(log, variant=heuristics_miner.Variants.PLUSPLUS)
         gviz = pn_vis.apply(net, im, fm)
 
+    def test_heunet_thresholds_df(self):
+        from pm4py.algo.discovery.heuristics.variants import classic
+        from pm4py.objects.conversion.log import converter as log_converter
+        from pm4py.objects.log.util import log_index
+
+        def edges(heu_net):
+            return {(n1, n2.node_name, e.dependency_value, e.dfg_value) for n1, node in heu_net.nodes.items()
+                    for n2, node_edges in node.output_connections.items() for e in node_edges}
+
+        df = pd.read_csv(os.path.join(INPUT_DATA_DIR, "running-example.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df)
+        log = log_converter.apply(df, variant=log_converter.Variants.TO_EVENT_LOG)
+        parameters = {"dependency_thresh": 0.2, "and_measure_thresh": 0.1}
+        heu_net = heuristics_miner.apply_heu(df, parameters=parameters)
+        self.assertEqual(edges(heu_net), edges(heuristics_miner.apply_heu(log, parameters=parameters)))
+        self.assertEqual(heu_net.nodes["decide"].and_measures_out,
+                         heuristics_miner.apply_heu(log, parameters=parameters).nodes["decide"].and_measures_out)
+        # the thresholds are applied again on the same heuristics net
+        expected = heuristics_miner.apply_heu(df, parameters={"dependency_thresh": 0.9})
+        classic.calculate(heu_net, dependency_thresh=0.9)
+        self.assertEqual(edges(heu_net), edges(expected))
+        log_index.attach(df)
+        self.assertEqual(edges(heuristics_miner.apply_heu(df, parameters={"dependency_thresh": 0.9})), edges(expected))
 
 if __name__ == "__main__":
     unittest.main()
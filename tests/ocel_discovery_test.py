@@ -87,6 +87,21 @@ class OcelDiscoveryTest(unittest.TestCase):
         pm4py.save_vis_ocdfg(ocdfg, target_path, annotation="performance", act_metric="unique_objects", edge_metric="total_objects", act_threshold=2, edge_threshold=1, performance_aggregation="median")
         os.remove(target_path)
 
+    def test_object_graphs(self):
+        from pm4py.algo.transformation.ocel.graphs import object_interaction_graph, object_cobirth_graph, \
+            object_codeath_graph, object_descendants_graph, object_inheritance_graph
+        ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
+        ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].apply(list).to_dict()
+        expected = {(o1, o2) for objs in ev_rel_obj.values() for o1 in objs for o2 in objs if o1 < o2}
+        self.assertEqual(object_interaction_graph.apply(ocel), expected)
+        for graph, symmetric in [(object_interaction_graph, True), (object_cobirth_graph, True),
+                                 (object_codeath_graph, True), (object_descendants_graph, False),
+                                 (object_inheritance_graph, False)]:
+            edges, object_ids = graph.apply_edges(ocel)
+            adjacency, object_ids = graph.apply_adjacency(ocel)
+            self.assertEqual(len(graph.apply(ocel)), len(edges))
+            self.assertEqual(adjacency.nnz, 2 * len(edges) if symmetric else len(edges))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -313,6 +313,338 @@ class OtherPartsTests(unittest.TestCase):
         self.assertTrue(compression_util.discover_dfg(cl))
         self.assertTrue(compression_util.get_variants(cl))
 
+    def test_business_hours_vectorized(self):
+        from datetime import datetime
+        from pm4py.util import business_hours, constants
+        st = [datetime(2022, 1, 3, 6), datetime(2022, 1, 7, 16), datetime(2022, 1, 5, 12)]
+        et = [datetime(2022, 1, 3, 18), datetime(2022, 1, 11, 8), datetime(2022, 1, 5, 10)]
+        diffs = business_hours.soj_time_business_hours_diff_vectorized(pd.Series(st), pd.Series(et),
+                                                                       constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+        # Monday 07:00-17:00; Friday 16:00-17:00 + Monday 07:00-17:00 + Tuesday 07:00-08:00; negative interval
+        self.assertEqual(list(diffs), [36000.0, 43200.0, 0.0])
+        for i in range(len(st)):
+            self.assertEqual(diffs[i], business_hours.BusinessHours(st[i], et[i]).get_seconds())
+
+    def test_lazy_import(self):
+        # "import pm4py" must not load the algorithms and their dependencies, which are imported when
+        # the corresponding attributes are accessed
+        import subprocess
+        import sys
+        import pm4py
+        heavy_modules = ["numpy", "pandas", "lxml", "scipy", "networkx", "graphviz", "sklearn", "matplotlib",
+                         "pm4py.algo", "pm4py.objects"]
+        code = "import sys; import pm4py; print(' '.join(m for m in %r if m in sys.modules))" % heavy_modules
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(os.path.abspath(pm4py.__file__))), env.get("PYTHONPATH", "")])
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                                check=True).stdout.split()
+        self.assertEqual(output, [])
+        for name in pm4py.__all__:
+            self.assertTrue(hasattr(pm4py, name))
+
+    def test_compiled_petri_net(self):
+        import pm4py
+        from pm4py.objects.petri_net.obj import Marking
+        from pm4py.objects.petri_net.semantics import PetriNetSemantics
+        from pm4py.objects.petri_net.utils import compiled_net, reachability_graph
+
+        class ObjectSemantics(object):
+            # semantics on the objects of the Petri net, with the interface used by the reachability graph
+            def enabled_transitions(self, pn, m):
+                return {t for t in pn.transitions if PetriNetSemantics.is_enabled(pn, t, m)}
+
+            def weak_execute(self, t, pn, m):
+                return Marking({p: n for p, n in PetriNetSemantics.fire(pn, t, m).items() if n > 0})
+
+        object_semantics = ObjectSemantics()
+        tree = pm4py.parse_process_tree("+( ->('a','b'), X('c','d'), *('e','f'), 'g')")
+        net, im, fm = pm4py.convert_to_petri_net(tree)
+        cnet = compiled_net.compile_net(net, im, fm)
+        # firing on the compiled net is consistent with the semantics on the objects
+        m = im
+        cm = cnet.initial_marking
+        for i in range(20):
+            enabled = cnet.enabled_transitions(cm)
+            if not enabled:
+                break
+            self.assertEqual({cnet.transitions[t] for t in enabled}, object_semantics.enabled_transitions(net, m))
+            self.assertEqual(list(cnet.enabled_mask([cm])[0].nonzero()[0]), enabled)
+            t = enabled[i % len(enabled)]
+            m = object_semantics.weak_execute(cnet.transitions[t], net, m)
+            cm = cnet.fire(t, cm)
+            self.assertEqual(cnet.decode_marking(cm), m)
+            self.assertEqual(cnet.encode_marking(m), cm)
+        net2, im2, fm2 = cnet.to_petri_net()
+        cnet2 = compiled_net.compile_net(net2, im2, fm2)
+        self.assertTrue((cnet.pre == cnet2.pre).all() and (cnet.post == cnet2.post).all())
+        self.assertEqual((cnet.initial_marking, cnet.final_marking), (cnet2.initial_marking, cnet2.final_marking))
+        incoming, outgoing, _ = reachability_graph.marking_flow_petri(net, im)
+        incoming2, outgoing2, _ = reachability_graph.marking_flow_petri(
+            net, im, parameters={reachability_graph.Parameters.PETRI_SEMANTICS: object_semantics})
+        self.assertEqual(incoming, incoming2)
+        self.assertEqual(outgoing, outgoing2)
+
+
+    def test_live_event_stream_batches(self):
+        import pm4py
+        from pm4py.streaming.stream.live_event_stream import LiveEventStream, Parameters
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.algo.conformance.tbr import algorithm as streaming_tbr
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        event_stream = pm4py.convert_to_event_stream(log)
+        net, im, fm = pm4py.discover_petri_net_inductive(pm4py.filter_variants_top_k(log, 2))
+        results = []
+        for batch_size in [1, 4]:
+            # a single delivery thread keeps the order of the batches
+            live_stream = LiveEventStream(parameters={Parameters.BATCH_SIZE: batch_size,
+                                                      Parameters.BATCH_TIMEOUT: 0.01,
+                                                      Parameters.THREAD_POOL_SIZE: 1})
+            dfg_obj = streaming_dfg.apply()
+            tbr_obj = streaming_tbr.apply(net, im, fm)
+            live_stream.register(dfg_obj)
+            live_stream.register(tbr_obj)
+            live_stream.start()
+            for event in event_stream:
+                live_stream.append(event)
+            live_stream.stop()
+            results.append((dfg_obj.get(), tbr_obj.get().sort_values("case").to_dict("records")))
+        self.assertEqual(results[0], results[1])
+
+
+    def test_streaming_case_eviction(self):
+        import pm4py
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.algo.conformance.tbr import algorithm as streaming_tbr
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        # the events are sorted by case, hence a single case is open at every time
+        event_stream = sorted(pm4py.convert_to_event_stream(log), key=lambda x: (x["case:concept:name"],
+                                                                                  x["time:timestamp"]))
+        evicted = []
+        dfg_obj = streaming_dfg.apply(parameters={streaming_dfg.Variants.FREQUENCY.value.Parameters.MAX_CASES: 1})
+        net, im, fm = pm4py.discover_petri_net_inductive(pm4py.filter_variants_top_k(log, 2))
+        tbr_obj = streaming_tbr.apply(net, im, fm, parameters={"max_cases": 1,
+                                                               "on_case_eviction": lambda c, r: evicted.append(r)})
+        for event in event_stream:
+            dfg_obj.receive(event)
+            tbr_obj.receive(event)
+        dfg, activities, start_activities, end_activities = dfg_obj.get()
+        self.assertEqual(dfg, pm4py.discover_dfg(log)[0])
+        self.assertEqual(end_activities, pm4py.get_end_activities(log))
+        self.assertEqual(len(dfg_obj.case_dict), 1)
+        self.assertEqual(dfg_obj.case_store.evicted_cases, len(log) - 1)
+        self.assertEqual(len(evicted), len(log) - 1)
+        self.assertEqual(tbr_obj.case_store.active_cases, 1)
+        # without limits, the cases are not tracked
+        clock_calls = []
+        dfg_obj = streaming_dfg.apply()
+        dfg_obj.case_store.clock = lambda: clock_calls.append(None)
+        for event in event_stream:
+            dfg_obj.receive(event)
+        self.assertEqual(len(clock_calls), 0)
+        self.assertEqual(dfg_obj.case_store.active_cases, 0)
+        self.assertEqual(dfg_obj.get()[0], pm4py.discover_dfg(log)[0])
+
+
+    def test_sharded_streaming(self):
+        import pm4py
+        from pm4py.streaming.algo import sharded
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.stream.live_event_stream import LiveEventStream, Parameters
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        event_stream = pm4py.convert_to_event_stream(log)
+        with sharded.apply(streaming_dfg.apply, parameters={sharded.Parameters.NUM_SHARDS: 2,
+                                                            sharded.Parameters.BATCH_SIZE: 3}) as sharded_dfg:
+            live_stream = LiveEventStream(parameters={Parameters.THREAD_POOL_SIZE: 1})
+            live_stream.register(sharded_dfg)
+            live_stream.start()
+            for event in event_stream:
+                live_stream.append(event)
+            live_stream.stop()
+            dfg, activities, start_activities, end_activities = sharded_dfg.get()
+            self.assertEqual(len(sharded_dfg.invoke("get")), 2)
+        self.assertEqual(dfg, pm4py.discover_dfg(log)[0])
+        self.assertEqual(start_activities, pm4py.get_start_activities(log))
+        self.assertEqual(end_activities, pm4py.get_end_activities(log))
+
+        def failing_factory():
+            algo = streaming_dfg.apply()
+            algo.receive_batch = None
+            return algo
+
+        # an error on the events of a shard is reported by the next request, and the shard keeps working
+        with sharded.apply(failing_factory, parameters={sharded.Parameters.NUM_SHARDS: 1}) as sharded_dfg:
+            sharded_dfg.receive(event_stream[0])
+            self.assertRaises(Exception, sharded_dfg.invoke, "get")
+            self.assertEqual(len(sharded_dfg.invoke("get")), 1)
+        # the termination of a worker process is detected
+        with sharded.apply(lambda: os._exit(1), parameters={sharded.Parameters.NUM_SHARDS: 1}) as sharded_dfg:
+            self.assertRaises(Exception, sharded_dfg.invoke, "get")
+
+    def test_streaming_checkpoint(self):
+        import tempfile
+        import pm4py
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.algo.conformance.tbr import algorithm as streaming_tbr
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        event_stream = list(pm4py.convert_to_event_stream(log))
+        net, im, fm = pm4py.discover_petri_net_inductive(log)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for factory in [lambda: streaming_dfg.apply(), lambda: streaming_tbr.apply(net, im, fm)]:
+                path = os.path.join(tmp_dir, "checkpoint")
+                algo = factory()
+                for i, event in enumerate(event_stream[:30]):
+                    algo.receive(event)
+                    if i % 10 == 9:
+                        # the first checkpoint is full, the following ones are incremental
+                        algo.checkpoint(path, parameters={"max_deltas": 5})
+                algo.receive_batch(event_stream[30:35])
+                algo.checkpoint(path, background=False)
+                restored = factory()
+                offset = restored.restore(path)
+                self.assertEqual(offset, 35)
+                for event in event_stream[offset:]:
+                    algo.receive(event)
+                    restored.receive(event)
+                self.assertEqual(str(restored.get()), str(algo.get()))
+                os.remove(path)
+
+
+    def test_count_overlapping_intervals(self):
+        from pm4py.util import intervals
+        from pm4py.algo.transformation.log_to_features.variants import trace_based
+        # identical intervals are counted once; touching intervals do not overlap
+        begins = [0.0, 0.0, 1.0, 2.0, 5.0]
+        ends = [2.0, 2.0, 3.0, 4.0, 6.0]
+        self.assertEqual(intervals.count_overlapping(begins, ends, begins, ends).tolist(), [2, 2, 3, 2, 1])
+        self.assertEqual(intervals.count_overlapping([], [], [0.0], [1.0]).tolist(), [0])
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        data, feature_names = trace_based.work_in_progress(log)
+        self.assertEqual(len(data), len(log))
+        data, feature_names = trace_based.resource_workload(log)
+        self.assertEqual(len(data[0]), len(feature_names))
+
+    def test_ocel_iterator_chunks(self):
+        import pm4py
+        from pm4py.objects.ocel.util import ocel_iterator
+        from pm4py.streaming.conversion.ocel_flatts_distributor import OcelFlattsDistributor
+        ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
+        events = list(ocel_iterator.apply(ocel, parameters={"chunk_size": 3}))
+        self.assertEqual(len(events), len(ocel.events))
+        self.assertTrue(all(isinstance(y, list) for x, y in events[0].items() if x.startswith("ocel:type:")))
+        chunks = list(ocel_iterator.apply(ocel, parameters={"chunk_size": 3, "yield_chunks": True}))
+        self.assertEqual(str([event for chunk in chunks for event in chunk]), str(events))
+        flattened = [[], []]
+        distributor = OcelFlattsDistributor()
+        distributor.register("order", type("Listener", (), {"append": lambda self, ev: flattened[0].append(ev)})())
+        for event in events:
+            distributor.append(event)
+        distributor = OcelFlattsDistributor()
+        distributor.register("order", type("Listener", (), {"append": lambda self, ev: flattened[1].append(ev)})())
+        for chunk in chunks:
+            distributor.append_batch(chunk)
+        self.assertEqual(len(flattened[0]), len(ocel.relations[ocel.relations["ocel:type"] == "order"]))
+        self.assertEqual(flattened[0], flattened[1])
+
+    def test_event_log_index(self):
+        import pm4py
+        from pm4py.objects.log.util import log_index
+        from pm4py.statistics.traces.generic.pandas import case_statistics
+        dataframe = pd.read_csv(os.path.join("input_data", "receipt.csv"))
+        dataframe = pm4py.format_dataframe(dataframe)
+
+        def compute():
+            return [pm4py.get_start_activities(dataframe), pm4py.get_end_activities(dataframe),
+                    pm4py.get_variants(dataframe), pm4py.discover_dfg(dataframe),
+                    case_statistics.get_cases_description(dataframe),
+                    len(pm4py.filter_variants_top_k(dataframe, 3))]
+
+        expected = compute()
+        index = log_index.attach(dataframe)
+        self.assertIs(log_index.get(dataframe), index)
+        # the algorithms reuse the attached index, without computing other indexes
+        event_log_index = log_index.EventLogIndex
+        log_index.EventLogIndex = None
+        try:
+            self.assertEqual(compute(), expected)
+            self.assertEqual(compute(), expected)
+        finally:
+            log_index.EventLogIndex = event_log_index
+        self.assertIs(log_index.get(dataframe), index)
+        dataframe.drop(dataframe.index[:10], inplace=True)
+        self.assertIsNone(log_index.get(dataframe))
+        # the replacement of a column is detected, while the values changed in place require invalidate()
+        index = log_index.attach(dataframe)
+        dataframe["concept:name"] = dataframe["concept:name"].copy()
+        self.assertIsNone(log_index.get(dataframe))
+        log_index.attach(dataframe)
+        dataframe.loc[dataframe.index[4], "concept:name"] = "X"
+        log_index.invalidate(dataframe)
+        self.assertIsNone(log_index.get(dataframe))
+        # with the rows not sorted by timestamp, the algorithms keep the order of the rows
+        dataframe = pm4py.format_dataframe(pd.read_csv(os.path.join("input_data", "running-example.csv")))
+        dataframe = dataframe.sample(frac=1, random_state=3).reset_index(drop=True)
+        expected = compute()
+        index = log_index.attach(dataframe)
+        self.assertFalse(index.rows_in_order)
+        self.assertEqual(compute(), expected)
+
+    def test_encoded_variants_dataframe(self):
+        import pm4py
+        from pm4py.objects.log.util import pandas_numpy_variants
+        dataframe = pm4py.format_dataframe(pd.read_csv(os.path.join("input_data", "receipt.csv")))
+        expected = {}
+        for case, activities in dataframe.groupby("case:concept:name")["concept:name"]:
+            variant = tuple(activities.tolist())
+            expected[variant] = expected.get(variant, 0) + 1
+        variants = pandas_numpy_variants.apply(dataframe)
+        self.assertEqual(list(variants.items()), list(expected.items()))
+        # the indexes not attached to the dataframe are not validated
+        from pm4py.objects.log.util import log_index
+        transient = log_index.EventLogIndex(dataframe, "case:concept:name", "concept:name", "time:timestamp")
+        self.assertIsNone(transient.fingerprint)
+        self.assertIsNotNone(log_index.attach(dataframe).fingerprint)
+        log_index.invalidate(dataframe)
+        cases, case_variants, table = pandas_numpy_variants.get_variants_table(dataframe)
+        self.assertEqual(len(cases), dataframe["case:concept:name"].nunique())
+        self.assertEqual(table, list(expected))
+        # a degenerate hash (the first activity and the length) makes most of the variants collide
+        hash_base = pandas_numpy_variants.HASH_BASE
+        pandas_numpy_variants.HASH_BASE = 0
+        try:
+            self.assertEqual(list(pandas_numpy_variants.apply(dataframe).items()), list(expected.items()))
+        finally:
+            pandas_numpy_variants.HASH_BASE = hash_base
+        # timestamps which are not datetimes: the events of every case are in the order of the rows
+        dataframe = pd.read_csv(os.path.join("input_data", "running-example.csv"))
+        expected = {}
+        for case, activities in dataframe.groupby("case:concept:name")["concept:name"]:
+            variant = tuple(activities.tolist())
+            expected[variant] = expected.get(variant, 0) + 1
+        self.assertEqual(pandas_numpy_variants.apply(dataframe), expected)
+
+    def test_trace_based_features_dataframe(self):
+        import pm4py
+        import numpy as np
+        from pm4py.algo.transformation.log_to_features.variants import trace_based, trace_based_dataframe
+        dataframe = pm4py.format_dataframe(pd.read_csv(os.path.join("input_data", "running-example.csv")))
+        log = pm4py.convert_to_event_log(dataframe)
+        parameters = {"str_ev_attr": ["concept:name", "org:resource"], "str_tr_attr": [], "num_ev_attr": [],
+                      "num_tr_attr": [], "str_evsucc_attr": ["concept:name"], "enable_all_extra_features": True}
+        expected, expected_names = trace_based.apply(log, parameters=parameters)
+        data, feature_names = trace_based_dataframe.apply(dataframe, parameters=parameters)
+        self.assertEqual(feature_names, expected_names)
+        self.assertTrue(np.allclose(data, np.array(expected)))
+        data, feature_names = trace_based_dataframe.apply(dataframe, parameters={**parameters, "sparse": True})
+        self.assertTrue(np.allclose(data.toarray(), np.array(expected)))
+        feature_names, chunks = trace_based_dataframe.apply_chunks(dataframe, parameters={**parameters,
+                                                                                         "chunk_size": 4})
+        chunks = list(chunks)
+        self.assertEqual([len(x) for x in chunks], [4, 2])
+        self.assertTrue(np.allclose(np.vstack(chunks), np.array(expected)))
+        expected, expected_names = trace_based.apply(log)
+        data, feature_names = trace_based_dataframe.apply(dataframe)
+        self.assertEqual(sorted(feature_names), sorted(expected_names))
 
 if __name__ == "__main__":
     unittest.main()
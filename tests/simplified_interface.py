@@ -525,6 +525,26 @@ class SimplifiedInterfaceTest(unittest.TestCase):
         model = pm4py.discover_temporal_profile(dataframe, activity_key="Activity", case_id_key="CaseID", timestamp_key="Timestamp")
         pm4py.conformance_temporal_profile(dataframe, model, activity_key="Activity", case_id_key="CaseID", timestamp_key="Timestamp")
 
+    def test_temporal_profile_df_log_consistency(self):
+        from pm4py.algo.conformance.temporal_profile.variants import dataframe as tp_conf_dataframe
+        dataframe = pm4py.read_xes("input_data/running-example.xes")
+        log = pm4py.convert_to_event_log(dataframe)
+        model = pm4py.discover_temporal_profile(dataframe)
+        res_df = pm4py.conformance_temporal_profile(dataframe, model, zeta=0.5)
+        res_log = pm4py.conformance_temporal_profile(log, model, zeta=0.5)
+        self.assertEqual([sorted(x) for x in res_df], [sorted(x) for x in res_log])
+        dev_df = tp_conf_dataframe.apply(dataframe, model, parameters={"zeta": 0.5, "return_dataframe": True})
+        self.assertEqual(len(dev_df), sum(len(x) for x in res_df))
+        # zeta of the couples of activities with a standard deviation equal to zero
+        model = {couple: (0.0, 0.0) for couple in model}
+        res_df = tp_conf_dataframe.apply(dataframe, model)
+        self.assertEqual([sorted(x) for x in res_df],
+                         [sorted(x) for x in pm4py.conformance_temporal_profile(log, model)])
+        self.assertTrue(all(type(x[3]) is int for y in res_df for x in y))
+        # no deviation from an empty temporal profile
+        self.assertEqual(tp_conf_dataframe.apply(dataframe, {}), [[] for i in range(len(log))])
+        self.assertEqual(len(tp_conf_dataframe.apply(dataframe, {}, parameters={"return_dataframe": True})), 0)
+
     def test_ocel_get_obj_types(self):
         ocel = pm4py.read_ocel("input_data/ocel/example_log.csv")
         pm4py.ocel_get_object_types(ocel)
@@ -883,6 +903,15 @@ class SimplifiedInterfaceTest(unittest.TestCase):
 
         pm4py.extract_features_dataframe(dataframe, activity_key="Activity", case_id_key="CaseID", timestamp_key="Timestamp", resource_key="Resource")
 
+    def test_fea_ext_df_columnar(self):
+        dataframe = pm4py.read_xes("input_data/running-example.xes")
+        features = pm4py.extract_features_dataframe(dataframe, columnar=True)
+        expected = pm4py.extract_features_dataframe(pm4py.convert_to_event_log(dataframe))
+        self.assertEqual(sorted(features.columns), sorted(expected.columns))
+        pd.testing.assert_frame_equal(features[expected.columns], expected, check_dtype=False)
+        sparse_features = pm4py.extract_features_dataframe(dataframe, columnar=True, sparse=True)
+        self.assertEqual(sparse_features.sparse.to_dense().values.tolist(), features.values.tolist())
+
     def test_new_alpha_miner_df(self):
         dataframe = pd.read_csv("input_data/running-example-transformed.csv")
         dataframe["Timestamp"] = pd.to_datetime(dataframe["Timestamp"], utc=True)
@@ -42,5 +42,26 @@ class SimulationTest(unittest.TestCase):
         self.assertEqual(eventlog[-1].attributes['concept:name'], str(last_case_id))
 
 
+    def test_montecarlo_discrete_event(self):
+        from pm4py.objects.log.importer.xes import importer as xes_importer
+        from pm4py.algo.simulation.montecarlo import algorithm as montecarlo
+        from pm4py.algo.simulation.montecarlo.variants import petri_discrete_event
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        net, im, fm = pnml_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.pnml"))
+        parameters = {petri_discrete_event.Parameters.PARAM_NUM_SIMULATIONS: 50,
+                      petri_discrete_event.Parameters.PARAM_ENABLE_DIAGNOSTICS: False,
+                      petri_discrete_event.Parameters.PARAM_SEED: 7}
+        log1, result1 = montecarlo.apply(log, net, im, fm, variant=montecarlo.Variants.PETRI_DISCRETE_EVENT,
+                                         parameters=parameters)
+        log2, result2 = montecarlo.apply(log, net, im, fm, variant=montecarlo.Variants.PETRI_DISCRETE_EVENT,
+                                         parameters=parameters)
+        self.assertEqual(len(log1), 50)
+        self.assertEqual(result1["cases_ex_time"], result2["cases_ex_time"])
+        self.assertEqual(set(result1["places_interval_trees"]), set(net.places))
+        self.assertEqual(set(result1["transitions_interval_trees"]), {t.name for t in net.transitions})
+        replications = petri_discrete_event.apply_replications(log, net, im, fm, 2, parameters=parameters)
+        self.assertEqual(len(replications), 2)
+        self.assertEqual(len(replications[0][0]), 50)
+
 if __name__ == "__main__":
     unittest.main()
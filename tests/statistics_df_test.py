@@ -80,6 +80,18 @@ class StatisticsDfTest(unittest.TestCase):
         df = self.get_dataframe()
         msd_pandas.apply(df)
 
+    def test_partial_order_chunks_aggregates(self):
+        from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics
+        df = self.get_dataframe()
+        part_ord = df_statistics.get_partial_order_dataframe(df, keep_first_following=False)
+        chunks = list(df_statistics.get_partial_order_dataframe_chunks(df, keep_first_following=False,
+                                                                       max_pairs_per_chunk=50))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(len(part_ord), sum(len(x) for x in chunks))
+        aggregates = df_statistics.get_partial_order_aggregates(df, max_pairs_per_chunk=50)
+        counts = part_ord.groupby(["concept:name", "concept:name_2"]).size().to_dict()
+        self.assertEqual(counts, {x: y["count"] for x, y in aggregates.items()})
+
 
 if __name__ == "__main__":
     unittest.main()
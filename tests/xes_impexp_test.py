@@ -51,6 +51,34 @@ class XesImportExportTest(unittest.TestCase):
         log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "01_running-example.xes.gz"))
         del log
 
+    def test_importXESdataframe(self):
+        import pandas as pd
+        from pm4py.objects.conversion.log import converter as log_converter
+        log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "04_reviewing.xes.gz"))
+        df = log_converter.apply(log, variant=log_converter.Variants.TO_DATA_FRAME)
+        df2 = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "04_reviewing.xes.gz"),
+                                 variant=xes_importer.Variants.ITERPARSE_DATAFRAME)
+        pd.testing.assert_frame_equal(df, df2)
+        self.assertEqual(df.attrs, df2.attrs)
+
+    def test_importXESdataframeTimestampSort(self):
+        import pandas as pd
+        from pm4py.objects.conversion.log import converter as log_converter
+        parameters = {"timestamp_sort": True, "max_traces": 50}
+        log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "08_receipt.xes.gz"), parameters=parameters)
+        df = log_converter.apply(log, variant=log_converter.Variants.TO_DATA_FRAME)
+        df2 = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "08_receipt.xes.gz"),
+                                 variant=xes_importer.Variants.ITERPARSE_DATAFRAME, parameters=parameters)
+        pd.testing.assert_frame_equal(df, df2[df.columns])
+
+    def test_importXESdataframeNestedAttributes(self):
+        import pandas as pd
+        import pm4py
+        df = pm4py.read_xes(os.path.join(INPUT_DATA_DIR, "xes_20.xes"))
+        self.assertEqual(df["sdasaddas"].tolist(), [{"value": "ciao", "children": {"cost": 0}}])
+        log = pm4py.read_xes(os.path.join(INPUT_DATA_DIR, "xes_20.xes"), return_legacy_log_object=True)
+        pd.testing.assert_frame_equal(pm4py.convert_to_dataframe(log), df)
+
 
 if __name__ == "__main__":
     unittest.main()